@@ -1,23 +1,263 @@
+import asyncio
+import json
+import threading
+import time
+import typing as tp
+
+import httpx
 import requests
 import pandas as pd
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from fpl_modelling.ReplayServer import archive_path
+from fpl_modelling.ResponseArchive import ResponseArchive
+from fpl_modelling.ResponseCache import ResponseCache
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket shared by every request a client makes.
+
+    Optionally enforces an overall request budget, raising once it is spent so a
+    runaway job fails fast instead of hammering the API.
+    """
+
+    def __init__(self, requests_per_second: tp.Optional[float] = None, burst: int = 1,
+                 request_budget: tp.Optional[int] = None):
+        self.requests_per_second = requests_per_second
+        self.burst = max(burst, 1)
+        self.request_budget = request_budget
+        self.requests_made = 0
+
+        self._tokens = float(self.burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request may be sent."""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self):
+        """Async variant of acquire that yields to the event loop while waiting."""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def _reserve(self) -> float:
+        """Take a slot from the budget and bucket, returning how long to wait before using it."""
+        with self._lock:
+            if self.request_budget is not None and self.requests_made >= self.request_budget:
+                raise RuntimeError(f"Request budget of {self.request_budget} requests exhausted.")
+            self.requests_made += 1
+
+            if not self.requests_per_second:
+                return 0
+
+            # Refill, then reserve a token (going negative means waiting for it)
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.requests_per_second)
+            self._last = now
+            self._tokens -= 1
+            return -self._tokens / self.requests_per_second if self._tokens < 0 else 0
+
 
 class FPLClient:
-    def __init__(self, base_url="https://fantasy.premierleague.com/api/"):
+    """
+    Client for the FPL API.
+
+    Owns a single pooled ``requests.Session`` (keep-alive, bounded retries with
+    backoff on 429/5xx, per-host connection limit) so one instance can be shared
+    across threads and pipeline nodes.
+
+    The ``*_many`` methods fetch many endpoints concurrently on one thread with an
+    ``httpx.AsyncClient``, bounded by the same per-host limit and rate limiter.
+
+    Pass ``cache`` (a ``ResponseCache`` or its kwargs) to persist responses on disk
+    between runs; authenticated requests are never cached.
+
+    Pass ``record_dir`` to archive every response body so runs can later be replayed
+    offline with ``ReplayServer``.
+
+    Pass ``archive`` (a ``ResponseArchive`` or its kwargs) to keep every payload in the
+    season/gameweek partitioned archive, and additionally ``snapshot`` (season and
+    gameweek) to serve public requests from that archive instead of the network.
+    Authenticated requests are never archived, so they still go to the network.
+
+    The async paths run the blocking pieces (SQLite cache and archive, metadata fetch)
+    in worker threads so the event loop keeps serving the other requests.
+    """
+
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    def __init__(self, base_url="https://fantasy.premierleague.com/api/", max_retries: int = 5,
+                 backoff_factor: float = 0.5, max_connections_per_host: int = 20,
+                 requests_per_second: tp.Optional[float] = None, request_budget: tp.Optional[int] = None,
+                 timeout: float = 30, cache: tp.Optional[tp.Union[ResponseCache, tp.Dict]] = None,
+                 record_dir: tp.Optional[str] = None,
+                 archive: tp.Optional[tp.Union[ResponseArchive, tp.Dict]] = None,
+                 snapshot: tp.Optional[tp.Dict] = None):
         self.base_url = base_url
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_connections_per_host = max_connections_per_host
         self._metadata = None  # private cache
+        self.cache = ResponseCache(**cache) if isinstance(cache, dict) else cache
+        self.record_dir = record_dir
+        self.archive = ResponseArchive(**archive) if isinstance(archive, dict) else archive
+        self.snapshot = snapshot
+        if snapshot is not None and self.archive is None:
+            raise ValueError("snapshot needs an archive to read from.")
+
+        self.rate_limiter = RateLimiter(
+            requests_per_second=requests_per_second,
+            burst=max_connections_per_host,
+            request_budget=request_budget,
+        )
+        self.session = self._build_session(max_retries, backoff_factor, max_connections_per_host)
+
+    def _build_session(self, max_retries: int, backoff_factor: float, max_connections_per_host: int):
+        """Create the pooled session. pool_block caps concurrent connections per host."""
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=self.RETRY_STATUSES,
+            allowed_methods=frozenset(["GET"]),
+            respect_retry_after_header=True,
+        )
+        adapter = HTTPAdapter(
+            max_retries=retry,
+            pool_connections=4,
+            pool_maxsize=max_connections_per_host,
+            pool_block=True,
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def _record(self, endpoint: str, data):
+        """Keep a response body for ReplayServer and/or the season/gameweek archive."""
+        if self.record_dir is not None:
+            path = archive_path(self.record_dir, endpoint)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(data))
+
+        if self.archive is not None and self.snapshot is None:
+            # The archive partitions by the season/gameweek found in bootstrap-static
+            if self.archive.season is None and not endpoint.startswith("bootstrap-static"):
+                if self._metadata is None:
+                    self.get_metadata()  # archived by its own _record call
+                else:
+                    self.archive.append("bootstrap-static/", self._metadata)
+            self.archive.append(endpoint, data)
+
+    def _get_json(self, endpoint: str, headers: tp.Optional[tp.Dict] = None, revalidate: bool = False):
+        """GET a path relative to base_url through the shared session and return the parsed body."""
+        if self.snapshot is not None and not headers:
+            return self.archive.get(endpoint, **self.snapshot)
+
+        data = self._fetch_json(endpoint, headers, revalidate)
+        if not headers:  # never archive authenticated responses
+            self._record(endpoint, data)
+        return data
+
+    def _fetch_json(self, endpoint: str, headers: tp.Optional[tp.Dict] = None, revalidate: bool = False):
+        if self.cache is None or headers:
+            self.rate_limiter.acquire()
+            r = self.session.get(self.base_url + endpoint, headers=headers, timeout=self.timeout)
+            r.raise_for_status()
+            return r.json()
+
+        data, entry = self.cache.lookup(endpoint)
+        if data is not None and not revalidate:
+            return data
+
+        self.rate_limiter.acquire()
+        r = self.session.get(self.base_url + endpoint, headers=self.cache.conditional_headers(entry),
+                             timeout=self.timeout)
+        r.raise_for_status()
+        return self.cache.update(endpoint, entry, r)
+
+    def _backoff(self, attempt: int, response: tp.Optional[httpx.Response] = None) -> float:
+        """Seconds to wait before retry number attempt + 1, honouring Retry-After when sent."""
+        if response is not None and response.headers.get("Retry-After", "").isdigit():
+            return float(response.headers["Retry-After"])
+        return self.backoff_factor * (2 ** attempt)
+
+    async def _aget_json(self, aclient: httpx.AsyncClient, endpoint: str, semaphore: asyncio.Semaphore):
+        """Async GET with the same retry policy, cache and recording as the pooled session."""
+        if self.snapshot is not None:
+            return await asyncio.to_thread(self.archive.get, endpoint, **self.snapshot)
+
+        data = await self._afetch_json(aclient, endpoint, semaphore)
+        await asyncio.to_thread(self._record, endpoint, data)
+        return data
+
+    async def _afetch_json(self, aclient: httpx.AsyncClient, endpoint: str, semaphore: asyncio.Semaphore):
+        entry = None
+        if self.cache is not None:
+            data, entry = await asyncio.to_thread(self.cache.lookup, endpoint)
+            if data is not None:
+                return data
+
+        async with semaphore:
+            for attempt in range(self.max_retries + 1):
+                await self.rate_limiter.aacquire()
+                response = None
+                try:
+                    response = await aclient.get(self.base_url + endpoint,
+                                                 headers=ResponseCache.conditional_headers(entry))
+                except httpx.TransportError:
+                    if attempt == self.max_retries:
+                        raise
+                else:
+                    if response.status_code not in self.RETRY_STATUSES or attempt == self.max_retries:
+                        if response.status_code != 304:  # httpx treats 304 as an error
+                            response.raise_for_status()
+                        if self.cache is not None:
+                            return await asyncio.to_thread(self.cache.update, endpoint, entry, response)
+                        return response.json()
+                await asyncio.sleep(self._backoff(attempt, response))
+
+    async def _afetch_many(self, endpoints: tp.List[str], return_exceptions: bool = False) -> tp.List:
+        """
+        Fetch endpoints concurrently; results are returned in the order given. With
+        return_exceptions, failed endpoints give their exception instead of aborting the batch.
+        """
+        limits = httpx.Limits(
+            max_connections=self.max_connections_per_host,
+            max_keepalive_connections=self.max_connections_per_host,
+        )
+        semaphore = asyncio.Semaphore(self.max_connections_per_host)
+        if self.archive is not None and self.snapshot is None and self.archive.season is None:
+            # Archiving needs the season/gameweek; fetch it once rather than from every thread
+            await asyncio.to_thread(self.get_metadata)
+        async with httpx.AsyncClient(limits=limits, timeout=self.timeout) as aclient:
+            return await asyncio.gather(*(self._aget_json(aclient, e, semaphore) for e in endpoints),
+                                        return_exceptions=return_exceptions)
+
+    def close(self):
+        self.session.close()
+        if self.cache is not None:
+            self.cache.close()
+        if self.archive is not None:
+            self.archive.close()
 
     def get_metadata(self, force_refresh=False):
         """Fetch and cache FPL bootstrap-static data (general game metadata)."""
         if self._metadata is None or force_refresh:
-            endpoint = "bootstrap-static"
-            self._metadata = requests.get(self.base_url + endpoint).json()
+            self._metadata = self._get_json("bootstrap-static/", revalidate=force_refresh)
         return self._metadata
 
     def get_players(self):
         """Return current players dataframe."""
         r = self.get_metadata()
         return pd.json_normalize(r['elements'])
-    
+
     def get_teams(self):
         """Return current teams dataframe."""
         r = self.get_metadata()
@@ -29,28 +269,69 @@ class FPLClient:
 
     def get_players_hist(self, player_id):
 
-        endpoint = f"{self.base_url}element-summary/{player_id}/"
-
-        r = requests.get(endpoint).json()
+        r = self._get_json(f"element-summary/{player_id}/")
 
         return pd.json_normalize(r['history'])
 
-    def get_gameweek_fixtures(self, gameweek_number, keep_stats=False):
-        endpoint = f"{self.base_url}fixtures/?event={gameweek_number}"
-        r = requests.get(endpoint).json()   # r is a list of dicts (one per fixture)
+    async def aget_players_hist_records_many(self, player_ids: tp.Iterable[int]) -> tp.List[tp.List[tp.Dict]]:
+        """Raw ``history`` records for many players fetched concurrently, in the order of player_ids."""
+        responses = await self._afetch_many([f"element-summary/{player_id}/" for player_id in player_ids])
+
+        return [r['history'] for r in responses]
+
+    def get_players_hist_records_many(self, player_ids: tp.Iterable[int]) -> tp.List[tp.List[tp.Dict]]:
+        return asyncio.run(self.aget_players_hist_records_many(player_ids))
+
+    async def aget_players_hist_many(self, player_ids: tp.Iterable[int]) -> tp.List[pd.DataFrame]:
+        """Fetch gameweek history for many players concurrently, in the order of player_ids."""
+        histories = await self.aget_players_hist_records_many(player_ids)
+
+        return [pd.json_normalize(history) for history in histories]
+
+    def get_players_hist_many(self, player_ids: tp.Iterable[int]) -> tp.List[pd.DataFrame]:
+        return asyncio.run(self.aget_players_hist_many(player_ids))
+
+    def get_gameweek_fixtures(self, gameweek_number, keep_stats=False, force_refresh=False):
+        r = self._get_json(f"fixtures/?event={gameweek_number}", revalidate=force_refresh)   # r is a list of dicts (one per fixture)
 
+        return self._fixtures_to_df(r, keep_stats)
+
+    def get_all_fixtures(self, keep_stats=False):
+        """Every fixture of the season in one request; postponed fixtures have no event."""
+        r = self._get_json("fixtures/")
+
+        return self._fixtures_to_df(r, keep_stats)
+
+    async def aget_fixtures_many(self, gameweeks: tp.Iterable[int], keep_stats=False) -> tp.List[pd.DataFrame]:
+        """Fetch fixtures for many gameweeks concurrently, in the order of gameweeks."""
+        responses = await self._afetch_many([f"fixtures/?event={gw}" for gw in gameweeks])
+
+        return [self._fixtures_to_df(r, keep_stats) for r in responses]
+
+    def get_fixtures_many(self, gameweeks: tp.Iterable[int], keep_stats=False) -> tp.List[pd.DataFrame]:
+        return asyncio.run(self.aget_fixtures_many(gameweeks, keep_stats))
+
+    @staticmethod
+    def _fixtures_to_df(r: tp.List[tp.Dict], keep_stats=False) -> pd.DataFrame:
         if not keep_stats:
             for fixture in r:
                 fixture.pop("stats", None)  # safely remove "stats" if present
 
         return pd.json_normalize(r)
 
+    def get_event_live(self, gameweek: int) -> tp.List[tp.Dict]:
+        """
+        Live stats for every player in a gameweek in one request. Always revalidated, so a
+        configured cache only saves the body download when nothing changed.
+        """
+        r = self._get_json(f"event/{gameweek}/live/", revalidate=True)
+
+        return r['elements']
+
     def get_team_on_gameweek(self, team_id: int, gameweek: int):
 
-        endpoint = f"{self.base_url}entry/{team_id}/event/{gameweek}/picks/"
+        r = self._get_json(f"entry/{team_id}/event/{gameweek}/picks/")
 
-        r = requests.get(endpoint).json()   
-        
         gameweek_team = pd.json_normalize(r['picks'])
         gameweek_summary = r['entry_history']
 
@@ -59,17 +340,30 @@ class FPLClient:
             "gameweek_summary": gameweek_summary
         }
 
-    def get_team_transfers(self, team_id: int):
+    async def aget_team_picks_many(self, team_ids: tp.Iterable[int], gameweek: int) -> tp.List:
+        """Raw picks payloads for many entries in one gameweek; failures come back as exceptions."""
+        return await self._afetch_many([f"entry/{team_id}/event/{gameweek}/picks/" for team_id in team_ids],
+                                       return_exceptions=True)
+
+    def get_team_picks_many(self, team_ids: tp.Iterable[int], gameweek: int) -> tp.List:
+        return asyncio.run(self.aget_team_picks_many(team_ids, gameweek))
 
-        endpoint = f"{self.base_url}entry/{team_id}/transfers/"
+    def get_league_entries(self, league_id: int, max_entries: int) -> tp.List[int]:
+        """Entry ids from the top of a classic league's standings (314 is the overall league)."""
+        pages = range(1, -(-max_entries // 50) + 1)  # 50 entries per standings page
+        responses = asyncio.run(self._afetch_many(
+            [f"leagues-classic/{league_id}/standings/?page_standings={page}" for page in pages]
+        ))
+        entries = [result['entry'] for r in responses for result in r['standings']['results']]
 
-        r = requests.get(endpoint).json()  
+        return entries[:max_entries]
+
+    def get_team_transfers(self, team_id: int):
+
+        r = self._get_json(f"entry/{team_id}/transfers/")
 
         return pd.DataFrame(r)
-    
-    def get_current_team(self, team_id: int, bearer: str):
 
-        endpoint = f"{self.base_url}my-team/{team_id}"
-        r = requests.get(endpoint, headers={ "X-Api-Authorization": f"Bearer {bearer}"})
+    def get_current_team(self, team_id: int, bearer: str):
 
-        return r.json()
\ No newline at end of file
+        return self._get_json(f"my-team/{team_id}", headers={"X-Api-Authorization": f"Bearer {bearer}"})
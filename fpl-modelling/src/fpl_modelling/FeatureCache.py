@@ -0,0 +1,87 @@
+import hashlib
+import json
+import time
+import typing as tp
+from pathlib import Path
+
+import pandas as pd
+
+from fpl_modelling.SQLiteLRU import SQLiteLRU
+
+
+class FeatureCache(SQLiteLRU):
+    """
+    Disk cache of processed feature frames, content-addressed: the key is a hash of
+    everything the frame was computed from (the source data's version, the settings
+    and the code), so a stale entry can never be returned, only left to age out.
+
+    Frames are stored as uncompressed Feather (Arrow IPC) files, which read back
+    column by column with categoricals intact. The SQLite index of sizes and access
+    times (see SQLiteLRU) evicts the least recently used entries once the cache grows
+    past ``max_size_mb``.
+
+    Example usage:
+        cache = FeatureCache("data/04_feature/feature_cache")
+        key = FeatureCache.key(data=source.version, settings=settings, code=code_version)
+        df = cache.get_or_put(key, lambda: build_features(source.load()))
+    """
+
+    TABLE = "entries"
+    SCHEMA = "key TEXT PRIMARY KEY, size INTEGER NOT NULL, created_at REAL NOT NULL, last_access REAL NOT NULL"
+
+    def __init__(self, path: str = "data/04_feature/feature_cache", max_size_mb: float = 1024):
+        self.path = Path(path)
+        super().__init__(self.path / "index.sqlite", max_size_mb)
+
+    @staticmethod
+    def key(**parts: tp.Any) -> str:
+        """Hash of the JSON-serialised parts, e.g. key(data=..., settings=..., code=...)."""
+        payload = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    @staticmethod
+    def file_digest(paths: tp.Iterable[tp.Union[str, Path]]) -> str:
+        """Hash of source files' contents, for the code part of a key."""
+        digest = hashlib.sha256()
+        for path in sorted(str(p) for p in paths):
+            digest.update(Path(path).read_bytes())
+        return digest.hexdigest()
+
+    def _file(self, key: str) -> Path:
+        return self.path / f"{key}.feather"
+
+    def get(self, key: str) -> tp.Optional[pd.DataFrame]:
+        with self._lock:
+            known = self._conn.execute("SELECT 1 FROM entries WHERE key = ?", (key,)).fetchone()
+            if known is None or not self._file(key).exists():
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._touch(key)
+        return pd.read_feather(self._file(key))
+
+    def put(self, key: str, df: pd.DataFrame):
+        # Write then rename so a concurrent reader never sees half a file
+        tmp = self.path / f"{key}.feather.tmp"
+        df.reset_index(drop=True).to_feather(tmp, compression="uncompressed")
+        tmp.replace(self._file(key))
+        now = time.time()
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)", (key, self._file(key).stat().st_size, now, now)
+            )
+            self._evict()
+            self._conn.commit()
+
+    def get_or_put(self, key: str, build: tp.Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        """The cached frame for key, or build() stored under key."""
+        df = self.get(key)
+        if df is None:
+            df = build()
+            self.put(key, df)
+        return df
+
+    def _on_evict(self, key: str):
+        self._file(key).unlink(missing_ok=True)
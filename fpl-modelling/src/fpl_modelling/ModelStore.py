@@ -0,0 +1,142 @@
+import hashlib
+import json
+import logging
+import shutil
+import threading
+import time
+import typing as tp
+from collections import OrderedDict
+from pathlib import Path
+
+import joblib
+import mlflow
+from mlflow.tracking import MlflowClient
+
+logger = logging.getLogger(__name__)
+
+_STORES: tp.Dict[tp.Tuple, "ModelStore"] = {}
+
+
+class ModelStore:
+    """
+    Local copies of registered MLflow models, so predictions do not download and unpickle
+    the model from the tracking server on every run.
+
+    The registry is only asked which version ``latest`` is (and that answer is reused for
+    ``resolve_ttl`` seconds). Each (name, version, run_id) is stored once under a
+    directory named by its hash, as ``model.joblib`` plus ``meta.json``, and the last
+    ``max_loaded`` unpickled models stay in memory. If the registry cannot be reached,
+    the newest stored version of the model is used instead.
+
+    Use ``ModelStore.shared(...)`` from nodes: it returns one store per settings for the
+    whole process, so an app running the prediction pipeline repeatedly keeps its
+    in-memory models between runs.
+
+    Example usage:
+        store = ModelStore.shared(tracking_uri="http://127.0.0.1:5001")
+        pipeline = store.load("model_gameweek_12")
+    """
+
+    def __init__(self, path: str = "data/06_models/model_store", tracking_uri: tp.Optional[str] = None,
+                 max_loaded: int = 8, resolve_ttl: float = 60):
+        self.path = Path(path)
+        self.tracking_uri = tracking_uri
+        self.max_loaded = max_loaded
+        self.resolve_ttl = resolve_ttl
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.downloads = 0
+
+        self._lock = threading.Lock()
+        self._loaded: "OrderedDict[str, tp.Any]" = OrderedDict()
+        self._resolved: tp.Dict[tp.Tuple[str, str], tp.Tuple[float, tp.Dict[str, str]]] = {}
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    @classmethod
+    def shared(cls, **kwargs) -> "ModelStore":
+        """The process-wide store for these settings."""
+        key = tuple(sorted(kwargs.items()))
+        if key not in _STORES:
+            _STORES[key] = cls(**kwargs)
+        return _STORES[key]
+
+    @staticmethod
+    def key(name: str, version: str, run_id: str) -> str:
+        return hashlib.sha256(f"{name}/{version}/{run_id}".encode()).hexdigest()
+
+    def _stored(self, name: str) -> tp.List[tp.Dict[str, str]]:
+        """meta.json of every stored version of name, newest first."""
+        metas = [json.loads(p.read_text()) for p in self.path.glob("*/meta.json")]
+        return sorted((m for m in metas if m["name"] == name), key=lambda m: int(m["version"]), reverse=True)
+
+    def resolve(self, name: str, version: str = "latest") -> tp.Dict[str, str]:
+        """{name, version, run_id} for a registered model version, asking the registry at most every resolve_ttl."""
+        version = str(version)
+        cached = self._resolved.get((name, version))
+        if cached and time.time() - cached[0] < self.resolve_ttl:
+            return cached[1]
+
+        try:
+            client = MlflowClient(tracking_uri=self.tracking_uri)
+            if version == "latest":
+                versions = client.search_model_versions(f"name='{name}'")
+                if not versions:
+                    raise KeyError(f"No registered versions of {name}")
+                mv = max(versions, key=lambda v: int(v.version))
+            else:
+                mv = client.get_model_version(name, version)
+            resolved = {"name": name, "version": str(mv.version), "run_id": mv.run_id}
+        except KeyError:
+            raise
+        except Exception as e:
+            stored = [m for m in self._stored(name) if version in ("latest", m["version"])]
+            if not stored:
+                raise
+            resolved = {k: stored[0][k] for k in ("name", "version", "run_id")}
+            logger.warning("Model registry unavailable (%s); using stored %s version %s", e, name, resolved["version"])
+
+        self._resolved[(name, version)] = (time.time(), resolved)
+        return resolved
+
+    def _download(self, resolved: tp.Dict[str, str], entry: Path):
+        if self.tracking_uri:
+            mlflow.set_tracking_uri(self.tracking_uri)
+        model = mlflow.sklearn.load_model(f"models:/{resolved['name']}/{resolved['version']}")
+
+        # Write then rename so a concurrent reader never sees half an entry
+        tmp = entry.with_name(entry.name + ".tmp")
+        shutil.rmtree(tmp, ignore_errors=True)
+        tmp.mkdir(parents=True)
+        joblib.dump(model, tmp / "model.joblib")
+        (tmp / "meta.json").write_text(json.dumps({**resolved, "stored_at": time.time()}))
+        shutil.rmtree(entry, ignore_errors=True)
+        tmp.rename(entry)
+        return model
+
+    def load(self, name: str, version: str = "latest"):
+        """The model, from memory, the local store or (once per version) the registry."""
+        resolved = self.resolve(name, version)
+        key = self.key(**resolved)
+
+        with self._lock:
+            if key in self._loaded:
+                self._loaded.move_to_end(key)
+                self.memory_hits += 1
+                return self._loaded[key]
+
+            entry = self.path / key
+            if (entry / "model.joblib").exists():
+                model = joblib.load(entry / "model.joblib")
+                self.disk_hits += 1
+            else:
+                model = self._download(resolved, entry)
+                self.downloads += 1
+
+            self._loaded[key] = model
+            while len(self._loaded) > self.max_loaded:
+                self._loaded.popitem(last=False)
+        return model
+
+    def stats(self) -> tp.Dict[str, int]:
+        return {"memory_hits": self.memory_hits, "disk_hits": self.disk_hits, "downloads": self.downloads}
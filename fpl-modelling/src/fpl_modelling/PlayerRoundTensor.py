@@ -0,0 +1,159 @@
+import json
+import shutil
+import typing as tp
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+class PlayerRoundTensor:
+    """
+    Per-player, per-round numeric features as one dense ``players x rounds x features``
+    array, with index maps from player_id, round and feature name to array positions.
+
+    Rounds are a contiguous range, so a round's position is ``round - first_round``, and
+    player positions come from a lookup array indexed by player_id. A gameweek slice
+    (players x features), a player's history (rounds x features) or one feature across
+    everything (players x rounds) is then plain array indexing that returns a view, no
+    boolean filter over a long frame. ``present`` marks the (player, round) cells that had
+    rows; the rest are NaN.
+
+    ``save`` writes ``values.npy``, ``present.npy`` and ``index.json`` to a directory and
+    ``load`` memory-maps them read-only by default, so every process that loads the same
+    store shares one copy through the page cache.
+
+    Example usage:
+        tensor = PlayerRoundTensor.from_frame(players_hist_merged, ["round_points", "ict_index"],
+                                              sum_features=["round_points"])
+        tensor.save("data/07_model_output/players_hist_tensor")
+
+        tensor = PlayerRoundTensor.load("data/07_model_output/players_hist_tensor")
+        tensor.gameweek(12)                           # players x features
+        tensor.player(355)[:, tensor.features.index("ict_index")]
+    """
+
+    def __init__(self, values: np.ndarray, present: np.ndarray, player_ids: tp.Sequence[int],
+                 first_round: int, features: tp.Sequence[str]):
+        self.values = values
+        self.present = present
+        self.player_ids = np.asarray(player_ids, dtype=np.int64)
+        self.first_round = int(first_round)
+        self.features = list(features)
+
+        if values.shape != (len(self.player_ids), present.shape[1], len(self.features)):
+            raise ValueError(f"values shape {values.shape} does not match the index maps")
+        self._feature_pos = {name: i for i, name in enumerate(self.features)}
+        self._player_pos = np.full(int(self.player_ids.max(initial=-1)) + 1, -1, dtype=np.int64)
+        self._player_pos[self.player_ids] = np.arange(len(self.player_ids))
+
+    @property
+    def rounds(self) -> np.ndarray:
+        return np.arange(self.first_round, self.first_round + self.values.shape[1])
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, features: tp.Sequence[str], sum_features: tp.Sequence[str] = (),
+                   dtype: str = "float32") -> "PlayerRoundTensor":
+        """
+        Build from a long (player_id, round) frame such as players_hist_merged. Where a
+        player has several rows in a round (double gameweeks), ``sum_features`` are summed
+        and the rest take the round's last row.
+
+        Rows that repeat a (player_id, round) with the same feature values are counted
+        once: players_hist_merged has one row per fixture and next-week fixture, so a
+        round before a double gameweek would otherwise sum every fixture twice.
+        """
+        df = df.drop_duplicates(subset=["player_id", "round", *features], keep="last")
+        player_ids = np.unique(df["player_id"].to_numpy())
+        rounds = df["round"].to_numpy(dtype=np.int64)
+        first_round = int(rounds.min()) if len(df) else 1
+        n_rounds = int(rounds.max()) - first_round + 1 if len(df) else 0
+
+        p = np.searchsorted(player_ids, df["player_id"].to_numpy())
+        r = rounds - first_round
+        values = np.full((len(player_ids), n_rounds, len(features)), np.nan, dtype=dtype)
+        present = np.zeros((len(player_ids), n_rounds), dtype=bool)
+        present[p, r] = True
+
+        data = df[list(features)].to_numpy(dtype=np.float64, na_value=np.nan)
+        # Last row per (player, round) in frame order: keep only the final occurrence of each cell
+        cell = p * max(n_rounds, 1) + r
+        last = len(cell) - 1 - np.unique(cell[::-1], return_index=True)[1]
+        for i, name in enumerate(features):
+            if name in sum_features:
+                totals = np.zeros(present.shape)
+                np.add.at(totals, (p, r), np.nan_to_num(data[:, i]))
+                values[..., i] = np.where(present, totals, np.nan)
+            else:
+                values[p[last], r[last], i] = data[last, i]
+
+        return cls(values, present, player_ids, first_round, features)
+
+    def player_index(self, player_ids: tp.Union[int, tp.Sequence[int], np.ndarray]) -> np.ndarray:
+        """Array positions of player_ids (-1 for unknown players)."""
+        ids = np.asarray(player_ids, dtype=np.int64)
+        known = (ids >= 0) & (ids < len(self._player_pos))
+        return np.where(known, self._player_pos[np.where(known, ids, 0)], -1)
+
+    def round_index(self, round: int) -> int:
+        pos = round - self.first_round
+        if not 0 <= pos < self.values.shape[1]:
+            raise KeyError(f"Round {round} is not in the store ({self.first_round}-{self.rounds[-1]})")
+        return pos
+
+    def gameweek(self, round: int) -> np.ndarray:
+        """players x features for one round (a view)."""
+        return self.values[:, self.round_index(round), :]
+
+    def player(self, player_id: int) -> np.ndarray:
+        """rounds x features for one player (a view)."""
+        pos = int(self.player_index(player_id))
+        if pos < 0:
+            raise KeyError(f"Player {player_id} is not in the store")
+        return self.values[pos]
+
+    def feature(self, name: str) -> np.ndarray:
+        """players x rounds for one feature (a view)."""
+        return self.values[:, :, self._feature_pos[name]]
+
+    def gameweek_frame(self, round: int, features: tp.Optional[tp.Sequence[str]] = None) -> pd.DataFrame:
+        """The round's rows as a frame indexed by player_id, players without a row left out."""
+        pos = self.round_index(round)
+        features = list(features or self.features)
+        rows = self.present[:, pos]
+        cols = [self._feature_pos[name] for name in features]
+        return pd.DataFrame(
+            self.values[rows, pos][:, cols], columns=features,
+            index=pd.Index(self.player_ids[rows], name="player_id"),
+        )
+
+    def save(self, path: tp.Union[str, Path]):
+        """Write the store, replacing any previous one only once the new files are complete."""
+        path = Path(path)
+        tmp = path.with_name(path.name + ".tmp")
+        shutil.rmtree(tmp, ignore_errors=True)
+        tmp.mkdir(parents=True)
+
+        np.save(tmp / "values.npy", np.ascontiguousarray(self.values))
+        np.save(tmp / "present.npy", np.ascontiguousarray(self.present))
+        (tmp / "index.json").write_text(json.dumps({
+            "player_ids": self.player_ids.tolist(), "first_round": self.first_round, "features": self.features,
+        }))
+
+        # Processes with the old files mapped keep reading them until they reload
+        old = path.with_name(path.name + ".old")
+        shutil.rmtree(old, ignore_errors=True)
+        if path.exists():
+            path.rename(old)
+        tmp.rename(path)
+        shutil.rmtree(old, ignore_errors=True)
+
+    @classmethod
+    def load(cls, path: tp.Union[str, Path], mmap_mode: tp.Optional[str] = "r") -> "PlayerRoundTensor":
+        path = Path(path)
+        index = json.loads((path / "index.json").read_text())
+        return cls(
+            np.load(path / "values.npy", mmap_mode=mmap_mode),
+            np.load(path / "present.npy", mmap_mode=mmap_mode),
+            index["player_ids"], index["first_round"], index["features"],
+        )
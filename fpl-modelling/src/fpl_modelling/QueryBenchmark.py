@@ -0,0 +1,226 @@
+import argparse
+import logging
+import sqlite3
+import statistics
+import tempfile
+import time
+import typing as tp
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import yaml
+
+from kedro_datasets.pandas import SQLQueryDataset
+
+from fpl_modelling.datasets.duckdb_query_dataset import DuckDBQueryDataset
+from fpl_modelling.datasets.partitioned_parquet_dataset import PartitionedParquetDataset
+from fpl_modelling.datasets.players_hist_merged_dataset import PlayersHistMergedDataset
+from fpl_modelling.datasets.sqlite_schema import SQLiteSchema
+
+logger = logging.getLogger(__name__)
+
+QUERY_TABLES = Path(__file__).resolve().parents[2] / "conf" / "base" / "catalog" / "query_tables.yml"
+
+
+def generate_league_history(n_seasons: int = 1, n_players: int = 700, n_teams: int = 20,
+                            seed: int = 0) -> tp.Dict[str, pd.DataFrame]:
+    """
+    Synthetic players/teams/positions/players_hist/fixtures tables shaped like the real
+    ones, with 38 rounds per season numbered on from the previous season.
+    """
+    rng = np.random.default_rng(seed)
+    n_rounds = 38 * n_seasons
+
+    teams = pd.DataFrame({"team_id": np.arange(1, n_teams + 1)})
+    teams["team_name"] = "Team " + teams["team_id"].astype(str)
+    positions = pd.DataFrame({
+        "position_id": [1, 2, 3, 4],
+        "position_name": ["Goalkeeper", "Defender", "Midfielder", "Forward"],
+        "singular_name_short": ["GKP", "DEF", "MID", "FWD"],
+    })
+    players = pd.DataFrame({
+        "player_id": np.arange(1, n_players + 1),
+        "team_id": rng.integers(1, n_teams + 1, n_players),
+        "position_id": rng.integers(1, 5, n_players),
+    })
+    players["first_name"] = "First" + players["player_id"].astype(str)
+    players["second_name"] = "Second" + players["player_id"].astype(str)
+    players["web_name"] = players["second_name"]
+    players["player_name"] = players["first_name"] + " " + players["second_name"]
+
+    # Each round every team plays once: a random pairing of the teams
+    pairs = np.stack([rng.permutation(np.arange(1, n_teams + 1)).reshape(-1, 2) for _ in range(n_rounds)])
+    fixtures = pd.DataFrame({
+        "id": np.arange(1, n_rounds * n_teams // 2 + 1),
+        "gameweek": np.repeat(np.arange(1, n_rounds + 1), n_teams // 2),
+        "team_h": pairs[:, :, 0].ravel(),
+        "team_a": pairs[:, :, 1].ravel(),
+    })
+    fixtures["event"] = fixtures["gameweek"]
+    fixtures["team_h_score"] = rng.integers(0, 4, len(fixtures))
+    fixtures["team_a_score"] = rng.integers(0, 4, len(fixtures))
+    fixtures["finished"] = True
+
+    home = fixtures.rename(columns={"team_h": "team_id", "team_a": "opponent_team"}).assign(was_home=True)
+    away = fixtures.rename(columns={"team_a": "team_id", "team_h": "opponent_team"}).assign(was_home=False)
+    team_fixtures = pd.concat([home, away])[
+        ["team_id", "id", "gameweek", "opponent_team", "was_home", "team_h_score", "team_a_score"]
+    ]
+    players_hist = players[["player_id", "team_id", "position_id", "player_name"]].merge(team_fixtures, on="team_id")
+    players_hist = players_hist.rename(columns={"id": "fixture", "gameweek": "round"})
+    n = len(players_hist)
+    players_hist["element"] = players_hist["player_id"]
+    players_hist["minutes"] = rng.choice([0, 0, 30, 90, 90, 90], n)
+    players_hist["total_points"] = rng.integers(0, 12, n)
+    players_hist["ict_index"] = rng.gamma(2.0, 2.0, n).round(1)
+    players_hist["value"] = rng.integers(40, 130, n)
+    players_hist["transfers_in"] = rng.integers(0, 50000, n)
+    players_hist["transfers_out"] = rng.integers(0, 50000, n)
+    players_hist["transfers_balance"] = players_hist["transfers_in"] - players_hist["transfers_out"]
+    players_hist["selected"] = rng.integers(0, 2_000_000, n)
+
+    return {
+        "players": players, "teams": teams, "positions": positions,
+        "players_hist": players_hist.sort_values(["round", "player_id"]).reset_index(drop=True),
+        "fixtures": fixtures,
+    }
+
+
+def merged_query(name: str = "players_hist_merged_view") -> str:
+    return yaml.safe_load(QUERY_TABLES.read_text())[name]["sql"]
+
+
+def write_unmanaged(path: Path, tables: tp.Dict[str, pd.DataFrame]):
+    """Tables the way pandas.SQLTableDataset writes them: to_sql, no keys or indexes."""
+    with sqlite3.connect(path) as conn:
+        for name, df in tables.items():
+            df.to_sql(name, conn, index=False, if_exists="replace")
+
+
+def write_managed(path: Path, tables: tp.Dict[str, pd.DataFrame]):
+    schema = SQLiteSchema(path)
+    schema.migrate()
+    for name, df in tables.items():
+        schema.write(name, df, if_exists="replace")
+    conn = schema.connect()
+    conn.execute("ANALYZE")
+    conn.close()
+
+
+def time_query(path: Path, sql: str, repeats: int = 3) -> float:
+    """Median seconds to load the query into pandas."""
+    timings = []
+    for _ in range(repeats):
+        conn = sqlite3.connect(path)
+        start = time.perf_counter()
+        pd.read_sql_query(sql, conn)
+        timings.append(time.perf_counter() - start)
+        conn.close()
+    return statistics.median(timings)
+
+
+def time_load(dataset, repeats: int = 3) -> float:
+    """Median seconds for dataset.load()."""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        dataset.load()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def time_materialised(path: Path, tables: tp.Dict[str, pd.DataFrame], repeats: int = 3) -> tp.Dict[str, float]:
+    """Refresh time when one new round lands on a materialised table, and plain-scan load time."""
+    players_hist = tables["players_hist"]
+    last_round = players_hist["round"].max()
+    schema = SQLiteSchema(path)
+    schema.write("players_hist", players_hist[players_hist["round"] < last_round], if_exists="replace")
+    merged = PlayersHistMergedDataset(credentials={"con": f"sqlite:///{path}"}, refresh_on_load=False)
+    merged.refresh(full=True)
+
+    schema.write("players_hist", players_hist[players_hist["round"] == last_round], if_exists="append")
+    start = time.perf_counter()
+    merged.refresh()
+    refresh_s = time.perf_counter() - start
+
+    return {"materialised_refresh_s": refresh_s, "materialised_load_s": time_load(merged, repeats)}
+
+
+def benchmark_sqlite(seasons: tp.Iterable[int], n_players: int = 700, repeats: int = 3) -> pd.DataFrame:
+    """
+    players_hist_merged load time on to_sql tables vs the managed schema as history grows,
+    plus the materialised table's per-round refresh and scan time.
+    """
+    sql = merged_query()
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_seasons in seasons:
+            tables = generate_league_history(n_seasons, n_players)
+            row = {"seasons": n_seasons, "players_hist_rows": len(tables["players_hist"])}
+            for label, writer in [("to_sql", write_unmanaged), ("managed", write_managed)]:
+                path = Path(tmp) / f"{label}_{n_seasons}.db"
+                start = time.perf_counter()
+                writer(path, tables)
+                row[f"{label}_write_s"] = time.perf_counter() - start
+                row[f"{label}_query_s"] = time_query(path, sql, repeats)
+            row.update(time_materialised(Path(tmp) / f"managed_{n_seasons}.db", tables, repeats))
+            results.append(row)
+            logger.info("%s", row)
+
+    return pd.DataFrame(results)
+
+
+def write_parquet(path: Path, tables: tp.Dict[str, pd.DataFrame]) -> tp.Dict[str, str]:
+    """Tables as PartitionedParquetDataset writes them, 38 rounds to a season."""
+    paths = {}
+    for name, table in tables.items():
+        partition_cols = ["season"]
+        round_col = {"players_hist": "round", "fixtures": "gameweek"}.get(name)
+        partitioned = table
+        if round_col:
+            partitioned = table.assign(season=((table[round_col] - 1) // 38).map("s{:02d}".format))
+            partition_cols.append(round_col)
+        paths[name] = str(path / name)
+        PartitionedParquetDataset(path=paths[name], partition_cols=partition_cols, season="s00").save(partitioned)
+    return paths
+
+
+def benchmark_engines(seasons: tp.Iterable[int] = (1, 10), n_players: int = 700, repeats: int = 3) -> pd.DataFrame:
+    """
+    players_hist_merged_view through pandas.SQLQueryDataset (SQLite) vs DuckDBQueryDataset
+    attached to the same SQLite file, and DuckDBQueryDataset over the Parquet tables.
+    """
+    sql = merged_query()
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_seasons in seasons:
+            tables = generate_league_history(n_seasons, n_players)
+            db = Path(tmp) / f"managed_{n_seasons}.db"
+            write_managed(db, tables)
+            credentials = {"con": f"sqlite:///{db}"}
+            parquet_tables = write_parquet(Path(tmp) / f"parquet_{n_seasons}", tables)
+
+            row = {"seasons": n_seasons, "players_hist_rows": len(tables["players_hist"])}
+            row["sqlite_s"] = time_load(SQLQueryDataset(sql=sql, credentials=credentials), repeats)
+            row["duckdb_sqlite_s"] = time_load(DuckDBQueryDataset(sql=sql, credentials=credentials), repeats)
+            row["duckdb_parquet_s"] = time_load(
+                DuckDBQueryDataset(sql=sql.replace("ph.value/10", "ph.value // 10"), tables=parquet_tables), repeats
+            )
+            results.append(row)
+            logger.info("%s", row)
+
+    return pd.DataFrame(results)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark players_hist_merged load latency as history grows.")
+    parser.add_argument("--seasons", type=int, nargs="+", default=[1, 2, 5])
+    parser.add_argument("--players", type=int, default=700)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--engines", action="store_true", help="compare SQLite, DuckDB-on-SQLite and DuckDB-on-Parquet")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    benchmark = benchmark_engines if args.engines else benchmark_sqlite
+    logger.info("\n%s", benchmark(args.seasons, args.players, args.repeats).round(3).to_string(index=False))
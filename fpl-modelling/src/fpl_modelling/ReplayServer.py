@@ -0,0 +1,152 @@
+import argparse
+import hashlib
+import logging
+import threading
+import time
+import typing as tp
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import quote
+
+logger = logging.getLogger(__name__)
+
+
+def archive_path(record_dir: tp.Union[str, Path], endpoint: str) -> Path:
+    """File an endpoint's recorded response lives in, e.g. fixtures/?event=3 -> fixtures%2F%3Fevent%3D3.json"""
+    return Path(record_dir) / f"{quote(endpoint, safe='')}.json"
+
+
+class ReplayServer:
+    """
+    Local stand-in for the FPL API that serves responses recorded with
+    ``FPLClient(record_dir=...)``, so ingestion can run and be timed without network access.
+
+    Latency and failures are deterministic: every request waits ``latency`` seconds, and
+    the endpoints selected by ``error_rate`` (a stable hash of endpoint and ``seed``) fail
+    with ``error_status`` for their first ``error_attempts`` requests before succeeding,
+    which exercises the client's retry path. Responses carry an ETag and honour
+    If-None-Match, so cache revalidation can be measured too.
+
+    Example usage:
+        with ReplayServer("data/01_raw/api_recording", latency=0.05, error_rate=0.1) as server:
+            client = FPLClient(server.base_url)
+
+    Or from the command line, then point params:base_url at it:
+        python -m fpl_modelling.ReplayServer data/01_raw/api_recording --port 8000
+    """
+
+    def __init__(self, record_dir: tp.Union[str, Path], host: str = "127.0.0.1", port: int = 0,
+                 latency: float = 0.0, error_rate: float = 0.0, error_status: int = 503,
+                 error_attempts: int = 1, seed: int = 0):
+        self.record_dir = Path(record_dir)
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.error_attempts = error_attempts
+        self.seed = seed
+
+        self.requests_served = 0
+        self.errors_injected = 0
+        self._attempts: tp.Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/api/"
+
+    def _should_fail(self, endpoint: str) -> bool:
+        """Fail the first error_attempts requests of a stable error_rate share of endpoints."""
+        digest = hashlib.sha256(f"{self.seed}:{endpoint}".encode()).digest()
+        if int.from_bytes(digest[:8], "big") / 2 ** 64 >= self.error_rate:
+            return False
+
+        with self._lock:
+            attempt = self._attempts.get(endpoint, 0)
+            self._attempts[endpoint] = attempt + 1
+        return attempt < self.error_attempts
+
+    def _make_handler(self):
+        replay = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status: int, body: bytes = b"", headers: tp.Optional[tp.Dict] = None):
+                self.send_response(status)
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                endpoint = self.path.split("/api/", 1)[-1]
+                if replay.latency:
+                    time.sleep(replay.latency)
+
+                with replay._lock:
+                    replay.requests_served += 1
+
+                if replay._should_fail(endpoint):
+                    with replay._lock:
+                        replay.errors_injected += 1
+                    return self._send(replay.error_status)
+
+                path = archive_path(replay.record_dir, endpoint)
+                if not path.exists():
+                    return self._send(404)
+
+                body = path.read_bytes()
+                etag = f'"{hashlib.md5(body).hexdigest()}"'
+                if self.headers.get("If-None-Match") == etag:
+                    return self._send(304, headers={"ETag": etag})
+
+                self._send(200, body, {"Content-Type": "application/json", "ETag": etag})
+
+        return Handler
+
+    def start(self) -> "ReplayServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def stats(self) -> tp.Dict[str, int]:
+        return {"requests_served": self.requests_served, "errors_injected": self.errors_injected}
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve recorded FPL API responses locally.")
+    parser.add_argument("record_dir")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--error-attempts", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+
+    server = ReplayServer(args.record_dir, args.host, args.port, args.latency, args.error_rate,
+                          args.error_status, args.error_attempts, args.seed)
+    logger.info("Replaying %s at %s", args.record_dir, server.base_url)
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
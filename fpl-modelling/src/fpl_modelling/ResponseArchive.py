@@ -0,0 +1,146 @@
+import gzip
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import typing as tp
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+
+class ResponseArchive:
+    """
+    Append-only, compressed archive of raw FPL API payloads partitioned by season and gameweek.
+
+    Every payload is written as its own gzip member appended to
+    ``<path>/season=<season>/gameweek=<gw>/responses.json.gz`` and indexed in
+    ``<path>/index.sqlite`` by (season, gameweek, endpoint, fetched_at, offset), so a
+    single payload can be read back with one seek. Nothing is ever overwritten, and a
+    payload identical to the endpoint's latest archived one is skipped.
+
+    The season and gameweek come from the latest bootstrap-static payload seen, so the
+    client archives that first (see ``FPLClient._record``).
+
+    ``get(endpoint, season, gameweek)`` returns the latest payload for an endpoint fetched
+    at or before that gameweek, which is what ``FPLClient(snapshot=...)`` uses to rebuild
+    players, players_hist and fixtures offline.
+
+    Example usage:
+        archive = ResponseArchive("data/01_raw/api_archive")
+        client = FPLClient(archive=archive)                                       # archive while fetching
+        client = FPLClient(archive=archive, snapshot={"season": "2025-26", "gameweek": 12})  # replay
+    """
+
+    def __init__(self, path: str = "data/01_raw/api_archive"):
+        self.path = Path(path)
+        self.season: tp.Optional[str] = None
+        self.gameweek: tp.Optional[int] = None
+
+        self._lock = threading.Lock()
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path / "index.sqlite", check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS payloads (
+                season TEXT NOT NULL,
+                gameweek INTEGER NOT NULL,
+                endpoint TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                file TEXT NOT NULL,
+                offset INTEGER NOT NULL,
+                length INTEGER NOT NULL,
+                digest TEXT NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS payloads_lookup ON payloads (season, endpoint, gameweek, fetched_at)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def season_and_gameweek(metadata: tp.Dict) -> tp.Tuple[str, int]:
+        """Season label (e.g. 2025-26) and current gameweek (0 before GW1) from bootstrap-static."""
+        events = metadata["events"]
+        start_year = int(events[0]["deadline_time"][:4])
+        current = [e["id"] for e in events if e.get("is_current")]
+        finished = [e["id"] for e in events if e.get("finished")]
+
+        return f"{start_year}-{(start_year + 1) % 100:02d}", max(current or finished or [0])
+
+    def append(self, endpoint: str, data):
+        """Archive one payload under the current season/gameweek partition."""
+        if endpoint.startswith("bootstrap-static"):
+            self.season, self.gameweek = self.season_and_gameweek(data)
+        if self.season is None:
+            raise RuntimeError("Archive a bootstrap-static payload first so the season and gameweek are known.")
+
+        body = json.dumps(data).encode()
+        digest = hashlib.sha1(body).hexdigest()
+        relative = Path(f"season={self.season}") / f"gameweek={self.gameweek}" / "responses.json.gz"
+
+        with self._lock:
+            latest = self._conn.execute(
+                "SELECT digest FROM payloads WHERE season = ? AND endpoint = ? ORDER BY fetched_at DESC LIMIT 1",
+                (self.season, endpoint),
+            ).fetchone()
+            if latest is not None and latest[0] == digest:
+                return
+
+            member = gzip.compress(body)
+            file = self.path / relative
+            file.parent.mkdir(parents=True, exist_ok=True)
+            with open(file, "ab") as f:
+                offset = f.tell()
+                f.write(member)
+
+            self._conn.execute(
+                "INSERT INTO payloads VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (self.season, self.gameweek, endpoint, time.time(), str(relative), offset, len(member), digest),
+            )
+            self._conn.commit()
+
+    def _read(self, file: str, offset: int, length: int):
+        with open(self.path / file, "rb") as f:
+            f.seek(offset)
+            return json.loads(gzip.decompress(f.read(length)))
+
+    def _latest(self, endpoint: str, season: str, gameweek: int) -> tp.Optional[tp.Tuple]:
+        with self._lock:
+            return self._conn.execute(
+                """
+                SELECT fetched_at, file, offset, length FROM payloads
+                WHERE season = ? AND endpoint = ? AND gameweek <= ?
+                ORDER BY gameweek DESC, fetched_at DESC
+                LIMIT 1
+                """,
+                (season, endpoint, gameweek),
+            ).fetchone()
+
+    def get(self, endpoint: str, season: str, gameweek: int):
+        """Latest payload for endpoint fetched at or before gameweek in season."""
+        row = self._latest(endpoint, season, gameweek)
+
+        # Per-gameweek fixtures can also be cut from a newer archived full fixture list
+        url = urlparse(endpoint)
+        if url.path == "fixtures/" and "event" in parse_qs(url.query):
+            full = self._latest("fixtures/", season, gameweek)
+            if full is not None and (row is None or full[0] > row[0]):
+                event = int(parse_qs(url.query)["event"][0])
+                return [f for f in self._read(*full[1:]) if f["event"] == event]
+
+        if row is None:
+            raise KeyError(f"No archived payload for {endpoint!r} in {season} up to gameweek {gameweek}.")
+
+        return self._read(*row[1:])
+
+    def snapshots(self) -> tp.List[tp.Tuple[str, int]]:
+        """(season, gameweek) partitions present in the archive."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT DISTINCT season, gameweek FROM payloads ORDER BY season, gameweek"
+            ).fetchall()
+
+    def close(self):
+        self._conn.close()
@@ -0,0 +1,139 @@
+import json
+import time
+import typing as tp
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+
+from fpl_modelling.SQLiteLRU import SQLiteLRU
+
+
+@dataclass
+class CacheEntry:
+    body: bytes
+    etag: tp.Optional[str]
+    last_modified: tp.Optional[str]
+    expires_at: float
+
+    @property
+    def data(self):
+        return json.loads(self.body)
+
+    def is_fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+
+class ResponseCache(SQLiteLRU):
+    """
+    Disk-backed cache of FPL API responses keyed by endpoint, stored in a small SQLite file.
+
+    Each endpoint gets a TTL from the longest matching prefix in ``ttls``; fixtures whose
+    games have all finished get ``finished_fixtures_ttl`` as they will not change again.
+    Stale entries are revalidated with If-None-Match / If-Modified-Since, and the least
+    recently used entries are evicted once the cache grows past ``max_size_mb`` (see SQLiteLRU).
+
+    Example usage:
+        cache = ResponseCache("data/01_raw/http_cache.sqlite")
+        client = FPLClient(cache=cache)
+    """
+
+    TABLE = "responses"
+    SCHEMA = (
+        "key TEXT PRIMARY KEY, body BLOB NOT NULL, etag TEXT, last_modified TEXT, "
+        "expires_at REAL NOT NULL, last_access REAL NOT NULL, size INTEGER NOT NULL"
+    )
+
+    DEFAULT_TTLS = {
+        "bootstrap-static/": 15 * 60,
+        "element-summary/": 60 * 60,
+        "fixtures/": 60 * 60,
+        "entry/": 6 * 60 * 60,
+    }
+
+    def __init__(self, path: str = "data/01_raw/http_cache.sqlite", max_size_mb: float = 256,
+                 ttls: tp.Optional[tp.Dict[str, float]] = None, default_ttl: float = 60 * 60,
+                 finished_fixtures_ttl: float = 30 * 24 * 60 * 60):
+        self.path = Path(path)
+        self.ttls = {**self.DEFAULT_TTLS, **(ttls or {})}
+        self.default_ttl = default_ttl
+        self.finished_fixtures_ttl = finished_fixtures_ttl
+        self.revalidated = 0
+        super().__init__(self.path, max_size_mb)
+
+    def ttl_for(self, key: str, data=None) -> float:
+        """TTL in seconds for an endpoint, using the longest matching prefix."""
+        if key.startswith("fixtures/") and isinstance(data, list) and data \
+                and all(fixture.get("finished") for fixture in data):
+            return self.finished_fixtures_ttl
+
+        matches = [prefix for prefix in self.ttls if key.startswith(prefix)]
+        if not matches:
+            return self.default_ttl
+        return self.ttls[max(matches, key=len)]
+
+    def lookup(self, key: str) -> tp.Tuple[tp.Any, tp.Optional[CacheEntry]]:
+        """
+        Return (data, entry). data is only set on a fresh hit; a stale entry is still
+        returned so its validators can be sent with the next request.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, etag, last_modified, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None, None
+
+            entry = CacheEntry(zlib.decompress(row[0]), row[1], row[2], row[3])
+            if not entry.is_fresh():
+                self.misses += 1
+                return None, entry
+
+            self.hits += 1
+            self._touch(key)
+        return entry.data, entry
+
+    @staticmethod
+    def conditional_headers(entry: tp.Optional[CacheEntry]) -> tp.Dict[str, str]:
+        headers = {}
+        if entry is not None and entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry is not None and entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def update(self, key: str, entry: tp.Optional[CacheEntry], response):
+        """
+        Store a response (requests or httpx) and return its parsed body. A 304 renews the
+        stale entry's TTL without re-downloading the body.
+        """
+        if response.status_code == 304 and entry is not None:
+            with self._lock:
+                self.revalidated += 1
+            data = entry.data
+            body, etag, last_modified = entry.body, entry.etag, entry.last_modified
+        else:
+            body = response.content
+            data = json.loads(body)
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+
+        self.put(key, body, etag, last_modified, self.ttl_for(key, data))
+        return data
+
+    def put(self, key: str, body: bytes, etag: tp.Optional[str] = None,
+            last_modified: tp.Optional[str] = None, ttl: tp.Optional[float] = None):
+        compressed = zlib.compress(body)
+        ttl = self.ttl_for(key) if ttl is None else ttl
+        now = time.time()
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, compressed, etag, last_modified, now + ttl, now, len(compressed)),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def stats(self) -> tp.Dict[str, int]:
+        return {**super().stats(), "revalidated": self.revalidated}
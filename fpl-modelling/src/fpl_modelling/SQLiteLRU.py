@@ -0,0 +1,74 @@
+import sqlite3
+import threading
+import time
+import typing as tp
+from pathlib import Path
+
+
+class SQLiteLRU:
+    """
+    Base for the disk caches: an SQLite table of entries with a ``size`` and a
+    ``last_access`` time, trimmed to ``max_size_mb`` by evicting the least recently
+    used entries.
+
+    Subclasses set ``TABLE`` and ``SCHEMA`` (the column definitions, which must include
+    ``key TEXT PRIMARY KEY``, ``size`` and ``last_access``), write their rows and call
+    ``_evict()`` under ``_lock``, and override ``_on_evict`` to remove anything kept
+    outside the table (e.g. a file per entry).
+
+    Example usage:
+        class BlobCache(SQLiteLRU):
+            TABLE = "blobs"
+            SCHEMA = "key TEXT PRIMARY KEY, body BLOB, size INTEGER NOT NULL, last_access REAL NOT NULL"
+    """
+
+    TABLE: str
+    SCHEMA: str
+
+    def __init__(self, db_path: tp.Union[str, Path], max_size_mb: float):
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute(f"CREATE TABLE IF NOT EXISTS {self.TABLE} ({self.SCHEMA})")
+        self._conn.commit()
+
+    def _touch(self, key: str):
+        """Mark key as just used; call under _lock."""
+        self._conn.execute(f"UPDATE {self.TABLE} SET last_access = ? WHERE key = ?", (time.time(), key))
+        self._conn.commit()
+
+    def _on_evict(self, key: str):
+        """Remove whatever the subclass keeps for key outside the table."""
+
+    def _evict(self):
+        """Drop least recently used entries until the cache fits in max_size_bytes; call under _lock."""
+        total = self._conn.execute(f"SELECT COALESCE(SUM(size), 0) FROM {self.TABLE}").fetchone()[0]
+        if total <= self.max_size_bytes:
+            return
+
+        for key, size in self._conn.execute(f"SELECT key, size FROM {self.TABLE} ORDER BY last_access").fetchall():
+            if total <= self.max_size_bytes:
+                break
+            self._conn.execute(f"DELETE FROM {self.TABLE} WHERE key = ?", (key,))
+            self._on_evict(key)
+            total -= size
+            self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            for (key,) in self._conn.execute(f"SELECT key FROM {self.TABLE}").fetchall():
+                self._on_evict(key)
+            self._conn.execute(f"DELETE FROM {self.TABLE}")
+            self._conn.commit()
+
+    def stats(self) -> tp.Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+    def close(self):
+        self._conn.close()
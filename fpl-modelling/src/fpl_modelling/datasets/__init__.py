@@ -0,0 +1,24 @@
+"""Custom Kedro datasets for the FPL tables."""
+
+from .duckdb_query_dataset import DuckDBQueryDataset
+from .lazy_source_dataset import LazySource, LazySourceDataset
+from .optional_yaml_dataset import OptionalYAMLDataset
+from .partitioned_parquet_dataset import PartitionedParquetDataset
+from .player_round_tensor_dataset import PlayerRoundTensorDataset
+from .players_hist_merged_dataset import PlayersHistMergedDataset
+from .sql_upsert_dataset import SQLUpsertDataset
+from .sqlite_schema import SQLiteSchema
+from .sqlite_table_dataset import SQLiteTableDataset
+
+__all__ = [
+    "DuckDBQueryDataset",
+    "LazySource",
+    "LazySourceDataset",
+    "OptionalYAMLDataset",
+    "PartitionedParquetDataset",
+    "PlayerRoundTensorDataset",
+    "PlayersHistMergedDataset",
+    "SQLiteSchema",
+    "SQLiteTableDataset",
+    "SQLUpsertDataset",
+]
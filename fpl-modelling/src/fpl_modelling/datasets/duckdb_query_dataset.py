@@ -0,0 +1,105 @@
+import typing as tp
+from pathlib import Path
+
+import duckdb
+import pandas as pd
+import pyarrow as pa
+from kedro.io import AbstractDataset
+
+
+class DuckDBQueryDataset(AbstractDataset[None, tp.Union[pd.DataFrame, pa.Table]]):
+    """
+    Read-only dataset that runs a query_tables-style SQL query with DuckDB's vectorised
+    engine, over either the SQLite database or partitioned Parquet tables.
+
+    - ``credentials`` (the same ``db_credentials`` SQLQueryDataset uses): the SQLite file
+      is attached read-only, so an entry switches engine by changing only its ``type``.
+      Integer division is turned on to match SQLite's ``/``.
+    - ``tables``: each entry becomes a view of the same name over its hive-partitioned
+      files (see PartitionedParquetDataset). When ``season`` is set, every view is
+      limited to that season.
+
+    Results come back as Arrow and are converted column-wise, never row by row;
+    ``return_type: arrow`` skips the pandas conversion altogether.
+
+    Example catalog entries:
+        players_merged:
+          type: fpl_modelling.datasets.DuckDBQueryDataset
+          credentials: db_credentials
+          sql: SELECT ... FROM players p LEFT JOIN teams t ON p.team_id = t.team_id
+
+        players_merged:
+          type: fpl_modelling.datasets.DuckDBQueryDataset
+          tables:
+            players: data/01_raw/parquet/players
+            teams: data/01_raw/parquet/teams
+          season: ${globals:season}
+          sql: SELECT ... FROM players p LEFT JOIN teams t ON p.team_id = t.team_id
+    """
+
+    def __init__(self, *, sql: str, credentials: tp.Optional[tp.Dict[str, tp.Any]] = None,
+                 tables: tp.Optional[tp.Dict[str, str]] = None, season: tp.Optional[str] = None,
+                 return_type: str = "pandas", load_args: tp.Optional[tp.Dict[str, tp.Any]] = None,
+                 metadata: tp.Optional[tp.Dict[str, tp.Any]] = None):
+        if (credentials is None) == (tables is None):
+            raise ValueError("DuckDBQueryDataset needs exactly one of credentials (SQLite) or tables (Parquet).")
+        if return_type not in ("pandas", "arrow"):
+            raise ValueError(f"Unknown return_type {return_type!r}")
+
+        self.sql = sql
+        self.sqlite_path = None
+        if credentials is not None:
+            con = credentials["con"]
+            if not con.startswith("sqlite:///"):
+                raise ValueError(f"DuckDBQueryDataset only attaches sqlite:/// databases, got {con!r}")
+            self.sqlite_path = Path(con[len("sqlite:///"):])
+        self.tables = {name: Path(path) for name, path in (tables or {}).items()}
+        self.season = season
+        self.return_type = return_type
+        self.load_args = load_args or {}
+        self.metadata = metadata
+
+    def _describe(self) -> tp.Dict[str, tp.Any]:
+        return {
+            "sql": self.sql, "sqlite": str(self.sqlite_path) if self.sqlite_path else None,
+            "tables": {k: str(v) for k, v in self.tables.items()}, "season": self.season,
+        }
+
+    def _attach_sqlite(self, conn: duckdb.DuckDBPyConnection):
+        path = self.sqlite_path.as_posix().replace("'", "''")
+        conn.execute(f"ATTACH '{path}' AS fpl (TYPE sqlite, READ_ONLY)")
+        conn.execute("USE fpl")
+        conn.execute("SET integer_division = true")
+
+    def _register_views(self, conn: duckdb.DuckDBPyConnection):
+        for name, path in self.tables.items():
+            source = f"read_parquet('{path.as_posix()}/**/*.parquet', hive_partitioning = true)"
+            if self.season is not None:
+                season = self.season.replace("'", "''")
+                source = f"(SELECT * EXCLUDE (season) FROM {source} WHERE season = '{season}')"
+            conn.execute(f'CREATE VIEW "{name}" AS SELECT * FROM {source}')
+
+    def load(self) -> tp.Union[pd.DataFrame, pa.Table]:
+        with duckdb.connect() as conn:
+            if self.sqlite_path is not None:
+                self._attach_sqlite(conn)
+            else:
+                self._register_views(conn)
+            result = conn.execute(self.sql).arrow()
+            # Older DuckDB returns a Table, newer a RecordBatchReader
+            table = result.read_all() if isinstance(result, pa.RecordBatchReader) else result
+
+        # SUM over integers is HUGEINT in DuckDB and arrives as decimal(38, 0); SQLite gives int64
+        for i, field in enumerate(table.schema):
+            if pa.types.is_decimal(field.type) and field.type.scale == 0:
+                table = table.set_column(i, field.name, table.column(i).cast(pa.int64()))
+
+        if self.return_type == "arrow":
+            return table
+
+        df = table.to_pandas()
+        index_col = self.load_args.get("index_col")
+        return df.set_index(index_col) if index_col else df
+
+    def save(self, data: None) -> None:
+        raise NotImplementedError("DuckDBQueryDataset is read-only.")
@@ -0,0 +1,86 @@
+import hashlib
+import json
+import typing as tp
+from pathlib import Path
+
+import pandas as pd
+from kedro.io import AbstractDataset
+
+from .sqlite_schema import SQLiteSchema
+
+
+class LazySource:
+    """A dataset that has not been loaded yet, and a version that changes whenever its data does."""
+
+    def __init__(self, dataset: AbstractDataset, version: tp.Optional[str]):
+        self.dataset = dataset
+        self.version = version
+
+    def load(self) -> pd.DataFrame:
+        return self.dataset.load()
+
+
+class LazySourceDataset(AbstractDataset[None, LazySource]):
+    """
+    Wraps another dataset so a node can decide whether it needs the data at all, e.g.
+    when a cache already holds what it would compute from it. Loading returns a
+    LazySource: ``version`` is cheap to get, ``load()`` runs the wrapped dataset.
+
+    The version is taken from:
+      - ``version_tables`` with ``credentials``: the write counters SQLiteSchema keeps
+        per table (see ``table_versions``)
+      - otherwise the wrapped dataset's Parquet ``tables`` (DuckDBQueryDataset) or
+        ``path``: every file's name, size and modification time
+    together with the wrapped dataset's description, so a changed query changes it too.
+    It is None when neither applies.
+
+    Example catalog entry:
+        players_hist_source:
+          type: fpl_modelling.datasets.LazySourceDataset
+          credentials: db_credentials
+          dataset:
+            type: fpl_modelling.datasets.PlayersHistMergedDataset
+          version_tables: [players_hist, players, teams, positions, fixtures]
+    """
+
+    def __init__(self, *, dataset: tp.Dict[str, tp.Any], credentials: tp.Optional[tp.Dict[str, tp.Any]] = None,
+                 version_tables: tp.Optional[tp.List[str]] = None,
+                 metadata: tp.Optional[tp.Dict[str, tp.Any]] = None):
+        config = dict(dataset)
+        if credentials is not None:
+            config["credentials"] = credentials
+        self.dataset = AbstractDataset.from_config("lazy_source", config)
+        self.config = dataset
+        self.schema = SQLiteSchema.from_credentials(credentials) if credentials and version_tables else None
+        self.version_tables = version_tables or []
+        self.metadata = metadata
+
+    def _describe(self) -> tp.Dict[str, tp.Any]:
+        return {"dataset": self.dataset._describe(), "version_tables": self.version_tables}
+
+    def _paths(self) -> tp.List[Path]:
+        if "tables" in self.config:
+            return [Path(p) for p in self.config["tables"].values()]
+        if "path" in self.config:
+            return [Path(self.config["path"])]
+        return []
+
+    def version(self) -> tp.Optional[str]:
+        if self.schema is not None:
+            data = {"sqlite": str(self.schema.path), **self.schema.data_version(self.version_tables)}
+        elif self._paths():
+            data = sorted(
+                (str(f), f.stat().st_size, f.stat().st_mtime_ns)
+                for path in self._paths() for f in path.rglob("*") if f.is_file()
+            )
+        else:
+            return None
+
+        payload = json.dumps([data, self.dataset._describe()], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def load(self) -> LazySource:
+        return LazySource(self.dataset, self.version())
+
+    def save(self, data: None) -> None:
+        raise NotImplementedError("LazySourceDataset is read-only.")
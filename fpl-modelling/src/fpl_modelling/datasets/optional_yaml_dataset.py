@@ -0,0 +1,25 @@
+import copy
+import typing as tp
+
+from kedro_datasets.yaml import YAMLDataset
+
+
+class OptionalYAMLDataset(YAMLDataset):
+    """
+    YAMLDataset that loads ``default`` (an empty dict unless set) while its file does not
+    exist yet, for outputs a later pipeline reads before any run has written them.
+
+    Example catalog entry:
+        tuned_model_config:
+          type: fpl_modelling.datasets.OptionalYAMLDataset
+          filepath: data/06_models/tuned_model_config.yml
+    """
+
+    def __init__(self, *, filepath: str, default: tp.Any = None, **kwargs):
+        super().__init__(filepath=filepath, **kwargs)
+        self.default = {} if default is None else default
+
+    def load(self) -> tp.Any:
+        if not self._exists():
+            return copy.deepcopy(self.default)
+        return super().load()
@@ -0,0 +1,168 @@
+import typing as tp
+import uuid
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from kedro.io import AbstractDataset
+
+
+class PartitionedParquetDataset(AbstractDataset[pd.DataFrame, pd.DataFrame]):
+    """
+    Parquet table partitioned into hive-style directories, e.g.
+    ``players_hist/season=2025-26/round=12/part-*.parquet``.
+
+    Loads read only the ``columns`` asked for and skip every partition and row group
+    ``filters`` rules out (pyarrow DNF filters, e.g. ``[[round, ">=", 10]]``). When
+    ``season`` is set, loads are limited to that season and the ``season`` column is
+    dropped so the frame looks like the SQLite table it replaces.
+
+    Saves fill in ``season`` if the data does not carry it, then:
+      - with ``key_columns``: upsert, rows matching on the keys are replaced wherever they are in
+        the season, so a row whose partition value changed (a rescheduled fixture) moves
+        partition instead of being duplicated
+      - with ``append``: add a new file to each partition
+      - otherwise: replace the touched partitions (``if_exists: replace`` per partition)
+
+    Example catalog entry:
+        players_hist:
+          type: fpl_modelling.datasets.PartitionedParquetDataset
+          path: data/01_raw/parquet/players_hist
+          partition_cols: [season, round]
+          season: ${globals:season}
+    """
+
+    def __init__(self, *, path: str, partition_cols: tp.Optional[tp.List[str]] = None,
+                 season: tp.Optional[str] = None, columns: tp.Optional[tp.List[str]] = None,
+                 filters: tp.Optional[tp.List] = None, index_col: tp.Optional[str] = None,
+                 key_columns: tp.Optional[tp.List[str]] = None, append: bool = False,
+                 metadata: tp.Optional[tp.Dict[str, tp.Any]] = None):
+        self.path = Path(path)
+        self.partition_cols = list(partition_cols or ["season"])
+        self.season = season
+        self.columns = columns
+        self.filters = filters
+        self.index_col = index_col
+        self.key_columns = list(key_columns) if key_columns else None
+        self.append = append
+        self.metadata = metadata
+
+    def _describe(self) -> tp.Dict[str, tp.Any]:
+        return {
+            "path": str(self.path), "partition_cols": self.partition_cols, "season": self.season,
+            "columns": self.columns, "filters": self.filters, "key_columns": self.key_columns,
+        }
+
+    def _exists(self) -> bool:
+        return self.path.exists() and any(self.path.rglob("*.parquet"))
+
+    def _dataset(self) -> ds.Dataset:
+        return ds.dataset(self.path, format="parquet", partitioning="hive")
+
+    def _season_filter(self, filters: tp.Optional[tp.List]) -> tp.Optional[tp.List]:
+        if self.season is None or "season" not in self.partition_cols:
+            return filters
+        season = ("season", "==", self.season)
+        if not filters:
+            return [[season]]
+        # Normalise a flat AND list to DNF and add the season to every conjunction
+        dnf = filters if isinstance(filters[0], list) else [filters]
+        return [[season, *(tuple(f) for f in conj)] for conj in dnf]
+
+    def load(self) -> pd.DataFrame:
+        return self.read()
+
+    def read(self, columns: tp.Optional[tp.List[str]] = None, filters: tp.Optional[tp.List] = None) -> pd.DataFrame:
+        """Load with columns/filters overriding the catalog's, e.g. one round's worth of five columns."""
+        if not self._exists():
+            return pd.DataFrame()
+
+        columns = columns or self.columns
+        if columns is not None and self.index_col and self.index_col not in columns:
+            columns = [self.index_col, *columns]
+
+        expression = pq.filters_to_expression(f) if (f := self._season_filter(filters or self.filters)) else None
+        table = self._dataset().to_table(columns=columns, filter=expression)
+        df = table.to_pandas()
+
+        if self.season is not None and "season" in df:
+            df = df.drop(columns="season")
+        for col in self.partition_cols:
+            # hive partition values come back as dictionary columns
+            if col in df and isinstance(df[col].dtype, pd.CategoricalDtype):
+                df[col] = df[col].astype(df[col].cat.categories.dtype)
+
+        return df.set_index(self.index_col) if self.index_col else df
+
+    def _read_partitions(self, columns: tp.Optional[tp.List[str]], filters: tp.Optional[tp.List]) -> pd.DataFrame:
+        """Rows of every season as stored (season column kept), partition columns decoded."""
+        expression = pq.filters_to_expression(filters) if filters else None
+        df = self._dataset().to_table(columns=columns, filter=expression).to_pandas()
+        for col in self.partition_cols:
+            if isinstance(df[col].dtype, pd.CategoricalDtype):
+                df[col] = df[col].astype(df[col].cat.categories.dtype)
+        return df
+
+    def _partition_filter(self, partitions: pd.MultiIndex) -> tp.List:
+        return [[(col, "==", value) for col, value in zip(self.partition_cols, partition)] for partition in partitions]
+
+    def _upsert(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        data plus the existing rows it does not replace in every partition it rewrites.
+        Key matches are looked up across the whole season (reading only key and
+        partition columns), so a row whose partition changed is removed from its old
+        one; a partition left with no rows is deleted here.
+        """
+        def partitions(df: pd.DataFrame) -> pd.MultiIndex:
+            return pd.MultiIndex.from_frame(df[self.partition_cols])
+
+        def keys(df: pd.DataFrame) -> pd.MultiIndex:
+            return pd.MultiIndex.from_frame(df[self.key_columns])
+
+        season_filter = None
+        if "season" in self.partition_cols:
+            season_filter = [[("season", "==", season)] for season in data["season"].unique()]
+        index = self._read_partitions(list(dict.fromkeys(self.key_columns + self.partition_cols)), season_filter)
+        if index.empty:
+            return data
+
+        rewritten = partitions(data).append(partitions(index[keys(index).isin(keys(data))])).unique()
+        existing = self._read_partitions(None, self._partition_filter(rewritten))
+        kept = existing[~keys(existing).isin(keys(data))]
+
+        emptied = rewritten[~rewritten.isin(partitions(data)) & ~rewritten.isin(partitions(kept))]
+        if len(emptied):
+            for fragment in self._dataset().get_fragments(filter=pq.filters_to_expression(self._partition_filter(emptied))):
+                Path(fragment.path).unlink()
+
+        return pd.concat([kept, data], ignore_index=True)
+
+    def save(self, data: pd.DataFrame) -> None:
+        if data.empty:
+            return
+
+        data = data.reset_index() if self.index_col and data.index.name == self.index_col else data
+        if "season" in self.partition_cols and "season" not in data:
+            if self.season is None:
+                raise ValueError(f"{self.path}: data has no season column and no season is configured.")
+            data = data.assign(season=self.season)
+
+        if self.key_columns and self._exists():
+            data = self._upsert(data)
+
+        # Categoricals from the dtype registry are stored as plain strings so every file in the
+        # table keeps one schema; the registry re-applies them on load
+        table = pa.Table.from_pandas(data, preserve_index=False)
+        for i, field in enumerate(table.schema):
+            if pa.types.is_dictionary(field.type):
+                table = table.set_column(i, field.name, table.column(i).cast(field.type.value_type))
+
+        pq.write_to_dataset(
+            table,
+            self.path,
+            partition_cols=self.partition_cols,
+            basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+            existing_data_behavior="overwrite_or_ignore" if self.append else "delete_matching",
+        )
@@ -0,0 +1,36 @@
+import typing as tp
+from pathlib import Path
+
+from kedro.io import AbstractDataset
+
+from fpl_modelling.PlayerRoundTensor import PlayerRoundTensor
+
+
+class PlayerRoundTensorDataset(AbstractDataset[PlayerRoundTensor, PlayerRoundTensor]):
+    """
+    PlayerRoundTensor store directory. Loads are memory-mapped read-only unless
+    ``mmap_mode`` is null, so nodes in parallel runner processes share the same pages.
+
+    Example catalog entry:
+        expected_points_matrix:
+          type: fpl_modelling.datasets.PlayerRoundTensorDataset
+          path: data/07_model_output/expected_points_matrix
+    """
+
+    def __init__(self, *, path: str, mmap_mode: tp.Optional[str] = "r",
+                 metadata: tp.Optional[tp.Dict[str, tp.Any]] = None):
+        self.path = Path(path)
+        self.mmap_mode = mmap_mode
+        self.metadata = metadata
+
+    def _describe(self) -> tp.Dict[str, tp.Any]:
+        return {"path": str(self.path), "mmap_mode": self.mmap_mode}
+
+    def _exists(self) -> bool:
+        return (self.path / "index.json").exists()
+
+    def load(self) -> PlayerRoundTensor:
+        return PlayerRoundTensor.load(self.path, self.mmap_mode)
+
+    def save(self, data: PlayerRoundTensor) -> None:
+        data.save(self.path)
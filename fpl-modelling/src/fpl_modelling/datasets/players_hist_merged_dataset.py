@@ -0,0 +1,222 @@
+import json
+import logging
+import time
+import typing as tp
+
+import pandas as pd
+from kedro.io import AbstractDataset
+
+from .sqlite_schema import SQLiteSchema, _transaction
+
+logger = logging.getLogger(__name__)
+
+MERGED_COLUMNS = [
+    "player_id", "player_name", "web_name", "first_name", "second_name", "team_id", "players_team",
+    "was_home", "players_team_score", "opponent_team_score", "round", "round_minutes", "round_points",
+    "transfer_cost", "transfers_balance", "selected", "transfers_in", "transfers_out", "ict_index",
+    "position_id", "position_name", "position_name_abbr", "cumsum_minutes", "cumsum_points",
+    "cumsum_ict_index", "cumsum_transfers_in", "cumsum_transfers_out", "next_week_is_home",
+    "next_week_opponent_team_name",
+]
+
+# Tables the merged rows are computed from; the refresh is skipped while none has been written
+SOURCE_TABLES = ["players_hist", "players", "teams", "positions", "fixtures"]
+
+# Both sides of every fixture, for the next-week fixture join
+NEXT_FIXTURES_SQL = """
+    SELECT gameweek, team_h AS team_id, team_a AS opponent_team_id, 1 AS is_home FROM fixtures
+    UNION ALL
+    SELECT gameweek, team_a AS team_id, team_h AS opponent_team_id, 0 AS is_home FROM fixtures
+"""
+
+# (cumulative column, players_hist column) pairs carried forward between refreshes
+CUMSUMS = [
+    ("cumsum_minutes", "minutes"),
+    ("cumsum_points", "total_points"),
+    ("cumsum_ict_index", "ict_index"),
+    ("cumsum_transfers_in", "transfers_in"),
+    ("cumsum_transfers_out", "transfers_out"),
+]
+
+# Each player's totals at the last round still materialised
+CARRY_SQL = f"""
+CREATE TEMP TABLE carry AS
+SELECT m.player_id, m.round AS last_round, {", ".join(f"MIN(m.{c}) AS {c}" for c, _ in CUMSUMS)}
+FROM players_hist_merged m
+JOIN (SELECT player_id, MAX(round) AS last_round FROM players_hist_merged GROUP BY player_id) l
+    ON m.player_id = l.player_id AND m.round = l.last_round
+GROUP BY m.player_id, m.round
+"""
+
+# Players whose materialised totals no longer add up to players_hist (revised or deleted rows).
+# The cumulative sums run over the view's rows, where a players_hist row appears once per
+# next-week fixture of its team (twice before a double gameweek), so each row is weighted
+# by that count here too.
+REVISED_SQL = f"""
+SELECT c.player_id
+FROM carry c
+LEFT JOIN (
+    SELECT ph.player_id, {", ".join(f"SUM(ph.{col} * COALESCE(nf.n, 1)) AS {col}" for _, col in CUMSUMS)}
+    FROM players_hist ph
+    JOIN carry c2 ON ph.player_id = c2.player_id AND ph.round <= c2.last_round
+    LEFT JOIN (
+        SELECT gameweek, team_id, COUNT(*) AS n FROM ({NEXT_FIXTURES_SQL}) GROUP BY gameweek, team_id
+    ) nf
+        ON ph.round + 1 = nf.gameweek
+        AND ph.team_id = nf.team_id
+    GROUP BY ph.player_id
+) s ON s.player_id = c.player_id
+WHERE s.player_id IS NULL OR {" OR ".join(f"ABS(s.{col} - c.{c}) > 1e-6" for c, col in CUMSUMS)}
+"""
+
+# Same rows as the players_hist_merged_view query, computed only for rounds after each
+# player's carried totals. Keep the two in step.
+INSERT_SQL = f"""
+INSERT INTO players_hist_merged ({", ".join(MERGED_COLUMNS)})
+SELECT
+    ph.player_id,
+    p.player_name,
+    p.web_name,
+    p.first_name,
+    p.second_name,
+    ph.team_id,
+    t.team_name AS players_team,
+    ph.was_home,
+    CASE WHEN ph.was_home = 1 THEN ph.team_h_score ELSE ph.team_a_score END AS players_team_score,
+    CASE WHEN ph.was_home = 1 THEN ph.team_a_score ELSE ph.team_h_score END AS opponent_team_score,
+    ph.round,
+    ph.minutes AS round_minutes,
+    ph.total_points AS round_points,
+    ph.value/10 AS transfer_cost,
+    ph.transfers_balance,
+    ph.selected,
+    ph.transfers_in,
+    ph.transfers_out,
+    ph.ict_index,
+    ph.position_id,
+    pos.position_name,
+    pos.singular_name_short AS position_name_abbr,
+    {(","+chr(10)+"    ").join(
+        f"COALESCE(c.{c}, 0) + SUM(ph.{col}) OVER (PARTITION BY ph.player_id ORDER BY ph.round) AS {c}"
+        for c, col in CUMSUMS
+    )},
+    nf.is_home AS next_week_is_home,
+    opp_team.team_name AS next_week_opponent_team_name
+FROM players_hist ph
+LEFT JOIN carry c ON ph.player_id = c.player_id
+LEFT JOIN players p ON ph.player_id = p.player_id
+LEFT JOIN teams t ON ph.team_id = t.team_id
+LEFT JOIN positions pos ON ph.position_id = pos.position_id
+LEFT JOIN ({NEXT_FIXTURES_SQL}) nf
+    ON ph.round + 1 = nf.gameweek
+    AND ph.team_id = nf.team_id
+LEFT JOIN teams opp_team ON opp_team.team_id = nf.opponent_team_id
+WHERE ph.round > COALESCE(c.last_round, -1)
+ORDER BY ph.player_id, ph.round
+"""
+
+
+class PlayersHistMergedDataset(AbstractDataset[None, pd.DataFrame]):
+    """
+    players_hist_merged kept as a physical table in the managed SQLite database instead
+    of re-running the window sums and joins of the view on every load.
+
+    Each refresh recomputes only what can have changed:
+      - every player's latest materialised round (live points, bonus, and the next-week
+        fixture can still move), plus all rounds of any player whose stored totals no
+        longer add up to players_hist (a revised earlier round)
+      - rows for rounds that landed since, with the cumulative sums carried forward
+        from the player's last remaining totals
+
+    so its cost stays roughly constant per gameweek. The source tables' write counters
+    (see SQLiteSchema.data_version) are recorded with each refresh, and a refresh with
+    none of them changed since writes nothing. Loads refresh first (when
+    ``refresh_on_load``) and are then a plain scan, of only the last ``recent_rounds``
+    rounds if set. ``refresh(full=True)`` rebuilds from scratch, e.g. after player names
+    or positions change.
+
+    Example catalog entry:
+        players_hist_merged:
+          type: fpl_modelling.datasets.PlayersHistMergedDataset
+          credentials: db_credentials
+    """
+
+    def __init__(self, *, credentials: tp.Dict[str, tp.Any], refresh_on_load: bool = True,
+                 recent_rounds: tp.Optional[int] = None, load_args: tp.Optional[tp.Dict[str, tp.Any]] = None,
+                 metadata: tp.Optional[tp.Dict[str, tp.Any]] = None):
+        self.schema = SQLiteSchema.from_credentials(credentials)
+        self.refresh_on_load = refresh_on_load
+        self.recent_rounds = recent_rounds
+        self.load_args = load_args or {}
+        self.metadata = metadata
+
+    def _describe(self) -> tp.Dict[str, tp.Any]:
+        return {"path": str(self.schema.path), "refresh_on_load": self.refresh_on_load,
+                "recent_rounds": self.recent_rounds}
+
+    def refresh(self, full: bool = False) -> int:
+        """Bring the table up to date with players_hist; returns the number of rows written."""
+        self.schema.migrate()
+        start = time.perf_counter()
+        conn = self.schema.connect()
+        try:
+            with _transaction(conn):
+                sources = json.dumps(dict(conn.execute(
+                    f"SELECT table_name, version FROM table_versions "
+                    f"WHERE table_name IN ({', '.join('?' * len(SOURCE_TABLES))}) ORDER BY table_name",
+                    SOURCE_TABLES
+                ).fetchall()))
+                stored = conn.execute(
+                    "SELECT source_versions FROM derived_sources WHERE table_name = 'players_hist_merged'"
+                ).fetchone()
+                if not full and stored is not None and stored[0] == sources:
+                    logger.info("players_hist_merged: up to date")
+                    return 0
+
+                if full:
+                    conn.execute("DELETE FROM players_hist_merged")
+                conn.execute(
+                    "DELETE FROM players_hist_merged WHERE (player_id, round) IN "
+                    "(SELECT player_id, MAX(round) FROM players_hist_merged GROUP BY player_id)"
+                )
+                conn.execute("DROP TABLE IF EXISTS temp.carry")
+                conn.execute(CARRY_SQL)
+
+                revised = [row[0] for row in conn.execute(REVISED_SQL)]
+                if revised:
+                    marks = ", ".join("?" * len(revised))
+                    conn.execute(f"DELETE FROM players_hist_merged WHERE player_id IN ({marks})", revised)
+                    conn.execute(f"DELETE FROM carry WHERE player_id IN ({marks})", revised)
+
+                written = conn.execute(INSERT_SQL).rowcount
+                conn.execute("DROP TABLE temp.carry")
+                conn.execute(
+                    "INSERT OR REPLACE INTO derived_sources VALUES ('players_hist_merged', ?, datetime('now'))",
+                    (sources,)
+                )
+        finally:
+            conn.close()
+
+        logger.info("players_hist_merged: %s rows written (%s players fully rebuilt) in %.2fs",
+                    written, len(revised), time.perf_counter() - start)
+        return written
+
+    def load(self) -> pd.DataFrame:
+        if self.refresh_on_load:
+            self.refresh()
+
+        where = ""
+        if self.recent_rounds:
+            where = f"WHERE round > (SELECT MAX(round) FROM players_hist_merged) - {int(self.recent_rounds)} "
+
+        conn = self.schema.connect()
+        try:
+            return pd.read_sql_query(
+                f"SELECT {', '.join(MERGED_COLUMNS)} FROM players_hist_merged {where}ORDER BY player_id, round, rowid",
+                conn, **self.load_args
+            )
+        finally:
+            conn.close()
+
+    def save(self, data: None) -> None:
+        raise NotImplementedError("players_hist_merged is derived from players_hist; call refresh() instead.")
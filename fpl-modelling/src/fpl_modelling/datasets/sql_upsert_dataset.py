@@ -0,0 +1,108 @@
+import typing as tp
+
+import pandas as pd
+from kedro.io import AbstractDataset
+from sqlalchemy import create_engine, inspect, text
+
+from .sqlite_schema import SQLiteSchema
+
+
+class SQLUpsertDataset(AbstractDataset[pd.DataFrame, pd.DataFrame]):
+    """
+    SQL table dataset that upserts on save instead of replacing the whole table.
+
+    Rows are matched on ``key_columns``; matching rows are replaced by the new versions
+    in a single transaction, so a save writes only the rows passed in. Columns missing
+    from the table are added on the fly. On SQLite this is a batched
+    ``INSERT ... ON CONFLICT`` through SQLiteSchema.
+
+    ``update`` changes a subset of columns on rows that already exist (e.g. live points)
+    without touching the rest of the row.
+
+    ``load_sql`` lets the same table be read through a narrower query (e.g. per-player
+    state for incremental ingestion). Loading a table that does not exist yet returns
+    an empty DataFrame.
+
+    Example catalog entry:
+        players_hist_updates:
+          type: fpl_modelling.datasets.SQLUpsertDataset
+          credentials: db_credentials
+          table_name: players_hist
+          key_columns: [player_id, fixture]
+    """
+
+    def __init__(self, *, table_name: str, credentials: tp.Dict[str, tp.Any], key_columns: tp.List[str],
+                 load_sql: tp.Optional[str] = None, metadata: tp.Optional[tp.Dict[str, tp.Any]] = None):
+        self.table_name = table_name
+        self.key_columns = list(key_columns)
+        self.load_sql = load_sql
+        self.metadata = metadata
+        self.engine = create_engine(credentials["con"])
+        self.schema = SQLiteSchema.from_credentials(credentials) if credentials["con"].startswith("sqlite:///") else None
+
+    def _describe(self) -> tp.Dict[str, tp.Any]:
+        return {"table_name": self.table_name, "key_columns": self.key_columns, "load_sql": self.load_sql}
+
+    def _exists(self) -> bool:
+        return inspect(self.engine).has_table(self.table_name)
+
+    def load(self) -> pd.DataFrame:
+        if not self._exists():
+            return pd.DataFrame()
+        return pd.read_sql_query(self.load_sql or f'SELECT * FROM "{self.table_name}"', self.engine)
+
+    def save(self, data: pd.DataFrame) -> None:
+        if data.empty:
+            return
+        if self.schema is not None:
+            self.schema.write(self.table_name, data, "upsert", self.key_columns)
+            return
+
+        staging = f"_staging_{self.table_name}"
+        columns = ", ".join(f'"{c}"' for c in data.columns)
+        key_match = " AND ".join(f'"{staging}"."{k}" = "{self.table_name}"."{k}"' for k in self.key_columns)
+
+        with self.engine.begin() as conn:
+            if not inspect(conn).has_table(self.table_name):
+                data.to_sql(self.table_name, conn, index=False)
+                return
+
+            existing = {c["name"] for c in inspect(conn).get_columns(self.table_name)}
+            for col in data.columns:
+                if col not in existing:
+                    conn.execute(text(f'ALTER TABLE "{self.table_name}" ADD COLUMN "{col}"'))
+
+            data.to_sql(staging, conn, index=False, if_exists="replace")
+            conn.execute(text(
+                f'DELETE FROM "{self.table_name}" WHERE EXISTS (SELECT 1 FROM "{staging}" WHERE {key_match})'
+            ))
+            conn.execute(text(
+                f'INSERT INTO "{self.table_name}" ({columns}) SELECT {columns} FROM "{staging}"'
+            ))
+            conn.execute(text(f'DROP TABLE "{staging}"'))
+
+    def update(self, data: pd.DataFrame, columns: tp.List[str]) -> int:
+        """
+        Set ``columns`` on existing rows matched on key_columns, in one transaction.
+        Rows with no match are ignored. Returns the number of rows updated.
+        """
+        if data.empty or not self._exists():
+            return 0
+
+        staging = f"_staging_{self.table_name}"
+        key_match = " AND ".join(f'"{staging}"."{k}" = "{self.table_name}"."{k}"' for k in self.key_columns)
+        assignments = ", ".join(
+            f'"{c}" = (SELECT "{staging}"."{c}" FROM "{staging}" WHERE {key_match})' for c in columns
+        )
+
+        with self.engine.begin() as conn:
+            data[self.key_columns + list(columns)].to_sql(staging, conn, index=False, if_exists="replace")
+            result = conn.execute(text(
+                f'UPDATE "{self.table_name}" SET {assignments} '
+                f'WHERE EXISTS (SELECT 1 FROM "{staging}" WHERE {key_match})'
+            ))
+            conn.execute(text(f'DROP TABLE "{staging}"'))
+
+        if self.schema is not None:
+            self.schema.touch(self.table_name)
+        return result.rowcount
@@ -0,0 +1,411 @@
+import itertools
+import logging
+import sqlite3
+import threading
+import typing as tp
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Core columns and keys of each managed table. Columns the API adds later are appended
+# on write (see SQLiteSchema.write), so these only need to cover keys, join columns
+# and what the queries in query_tables.yml rely on.
+TABLES: tp.Dict[str, tp.Dict[str, tp.Any]] = {
+    "players": {
+        "columns": {
+            "player_id": "INTEGER", "team_id": "INTEGER", "position_id": "INTEGER",
+            "first_name": "TEXT", "second_name": "TEXT", "web_name": "TEXT", "player_name": "TEXT",
+            "now_cost": "REAL", "points_per_game": "REAL", "total_points": "INTEGER", "minutes": "INTEGER",
+            "selected_by_percent": "TEXT", "transfers_in": "INTEGER", "transfers_out": "INTEGER",
+            "chance_of_playing_next_round": "REAL", "form": "TEXT", "status": "TEXT",
+        },
+        "key": ["player_id"],
+    },
+    "teams": {
+        "columns": {
+            "team_id": "INTEGER", "team_name": "TEXT", "short_name": "TEXT", "strength": "INTEGER",
+            "strength_overall_home": "INTEGER", "strength_overall_away": "INTEGER",
+        },
+        "key": ["team_id"],
+    },
+    "positions": {
+        "columns": {
+            "position_id": "INTEGER", "position_name": "TEXT", "singular_name_short": "TEXT",
+            "sub_positions_locked": "TEXT",
+        },
+        "key": ["position_id"],
+    },
+    "players_hist": {
+        "columns": {
+            "player_id": "INTEGER", "fixture": "INTEGER", "round": "INTEGER", "element": "INTEGER",
+            "opponent_team": "INTEGER", "total_points": "INTEGER", "was_home": "INTEGER",
+            "kickoff_time": "TEXT", "team_h_score": "INTEGER", "team_a_score": "INTEGER",
+            "minutes": "INTEGER", "ict_index": "REAL", "value": "INTEGER", "transfers_balance": "INTEGER",
+            "selected": "INTEGER", "transfers_in": "INTEGER", "transfers_out": "INTEGER",
+            "player_name": "TEXT", "team_id": "INTEGER", "position_id": "INTEGER",
+        },
+        "key": ["player_id", "fixture"],
+    },
+    "fixtures": {
+        "columns": {
+            "id": "INTEGER", "event": "INTEGER", "gameweek": "INTEGER", "team_h": "INTEGER",
+            "team_a": "INTEGER", "kickoff_time": "TEXT", "started": "INTEGER", "finished": "INTEGER",
+            "finished_provisional": "INTEGER", "team_h_score": "INTEGER", "team_a_score": "INTEGER",
+        },
+        "key": ["id"],
+    },
+    "my_current_team": {
+        "columns": {
+            "player_id": "INTEGER", "position_id": "INTEGER", "selling_price": "INTEGER",
+            "purchase_price": "INTEGER",
+        },
+        "key": ["player_id"],
+    },
+    "fixtures_changes": {
+        "columns": {
+            "fixture_id": "INTEGER", "change_type": "TEXT", "old_gameweek": "INTEGER",
+            "new_gameweek": "INTEGER", "old_kickoff_time": "TEXT", "new_kickoff_time": "TEXT",
+            "detected_at": "TEXT",
+        },
+        "key": None,  # append-only log
+    },
+    # Materialised players_hist_merged view (see PlayersHistMergedDataset); one row per
+    # players_hist row and next-week fixture, so no key
+    "players_hist_merged": {
+        "columns": {
+            "player_id": "INTEGER", "player_name": "TEXT", "web_name": "TEXT", "first_name": "TEXT",
+            "second_name": "TEXT", "team_id": "INTEGER", "players_team": "TEXT", "was_home": "INTEGER",
+            "players_team_score": "INTEGER", "opponent_team_score": "INTEGER", "round": "INTEGER",
+            "round_minutes": "INTEGER", "round_points": "INTEGER", "transfer_cost": "INTEGER",
+            "transfers_balance": "INTEGER", "selected": "INTEGER", "transfers_in": "INTEGER",
+            "transfers_out": "INTEGER", "ict_index": "REAL", "position_id": "INTEGER", "position_name": "TEXT",
+            "position_name_abbr": "TEXT", "cumsum_minutes": "INTEGER", "cumsum_points": "INTEGER",
+            "cumsum_ict_index": "REAL", "cumsum_transfers_in": "INTEGER", "cumsum_transfers_out": "INTEGER",
+            "next_week_is_home": "INTEGER", "next_week_opponent_team_name": "TEXT",
+        },
+        "key": None,
+    },
+    # Bumped on every write through SQLiteSchema, so caches can tell whether a table changed
+    # without reading it (see SQLiteSchema.data_version)
+    "table_versions": {
+        "columns": {"table_name": "TEXT", "version": "INTEGER", "updated_at": "TEXT"},
+        "key": ["table_name"],
+    },
+    # Ownership among crawled managers' picks (crawl_manager_picks)
+    "effective_ownership": {
+        "columns": {
+            "player_id": "INTEGER", "round": "INTEGER", "ownership": "REAL", "captaincy_rate": "REAL",
+            "effective_ownership": "REAL", "sample_size": "INTEGER",
+        },
+        "key": ["player_id", "round"],
+    },
+    # Incremental form features (update_features); feature columns are added on write
+    "players_features": {
+        "columns": {"player_id": "INTEGER", "seq": "INTEGER", "round": "INTEGER"},
+        "key": ["player_id", "seq"],
+    },
+    # table_versions of the tables a derived table was last refreshed from (JSON), so a
+    # refresh with nothing new to read can be skipped
+    "derived_sources": {
+        "columns": {"table_name": "TEXT", "source_versions": "TEXT", "updated_at": "TEXT"},
+        "key": ["table_name"],
+    },
+}
+
+INDEXES = {
+    "players_hist_player_round": ("players_hist", ["player_id", "round"]),
+    "players_hist_round": ("players_hist", ["round"]),
+    # The next-week fixture join unions both sides of each fixture; one index per side
+    "fixtures_gameweek_team_h": ("fixtures", ["gameweek", "team_h"]),
+    "fixtures_gameweek_team_a": ("fixtures", ["gameweek", "team_a"]),
+    "fixtures_changes_detected_at": ("fixtures_changes", ["detected_at"]),
+    "players_hist_merged_player_round": ("players_hist_merged", ["player_id", "round"]),
+    "players_features_round": ("players_features", ["round"]),
+}
+
+PRAGMAS = {
+    "journal_mode": "WAL",       # readers don't block the writer
+    "synchronous": "NORMAL",     # safe with WAL, far fewer fsyncs
+    "temp_store": "MEMORY",
+    "cache_size": -65536,        # 64 MB page cache
+    "mmap_size": 268435456,      # 256 MB
+}
+
+
+def _create_table_sql(table: str, spec: tp.Dict[str, tp.Any], name: tp.Optional[str] = None) -> str:
+    columns = [f'"{col}" {affinity}' for col, affinity in spec["columns"].items()]
+    if spec["key"]:
+        columns.append(f"PRIMARY KEY ({', '.join(spec['key'])})")
+    return f'CREATE TABLE IF NOT EXISTS "{name or table}" ({", ".join(columns)})'
+
+
+def _rebuild_tables(conn: sqlite3.Connection, tables: tp.Iterable[str]):
+    """
+    Move tables created implicitly by to_sql (no keys, every column TEXT/BIGINT/FLOAT) onto
+    the managed definitions, keeping extra columns and the latest row per key.
+    """
+    for table in tables:
+        spec = TABLES[table]
+        exists = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)).fetchone()
+        if not exists:
+            conn.execute(_create_table_sql(table, spec))
+            continue
+
+        old_columns = [row[1] for row in conn.execute(f'PRAGMA table_info("{table}")')]
+        extra = [col for col in old_columns if col not in spec["columns"]]
+        conn.execute(_create_table_sql(table, spec, name=f"_new_{table}"))
+        for col in extra:
+            conn.execute(f'ALTER TABLE "_new_{table}" ADD COLUMN "{col}"')
+
+        shared = ", ".join(f'"{col}"' for col in old_columns)
+        verb = "INSERT OR REPLACE" if spec["key"] else "INSERT"
+        conn.execute(f'{verb} INTO "_new_{table}" ({shared}) SELECT {shared} FROM "{table}" ORDER BY rowid')
+        conn.execute(f'DROP TABLE "{table}"')
+        conn.execute(f'ALTER TABLE "_new_{table}" RENAME TO "{table}"')
+
+
+def _create_indexes(conn: sqlite3.Connection, tables: tp.Optional[tp.Iterable[str]] = None,
+                    names: tp.Optional[tp.Iterable[str]] = None):
+    """Create the indexes on tables, or the named ones, or all of INDEXES."""
+    for name, (table, columns) in INDEXES.items():
+        if (tables is None or table in tables) and (names is None or name in names):
+            conn.execute(f'CREATE INDEX IF NOT EXISTS "{name}" ON "{table}" ({", ".join(columns)})')
+
+
+# What each released migration creates. TABLES and INDEXES keep growing, so migrations
+# name their tables and indexes instead of iterating over the live definitions.
+_V1_TABLES = ["players", "teams", "positions", "players_hist", "fixtures", "my_current_team", "fixtures_changes"]
+_V2_INDEXES = [
+    "players_hist_player_round", "players_hist_round", "fixtures_gameweek_team_h", "fixtures_gameweek_team_a",
+    "fixtures_changes_detected_at",
+]
+_V5_TABLES = ["effective_ownership", "players_features"]
+
+
+def _create_managed_tables(conn: sqlite3.Connection):
+    _rebuild_tables(conn, _V1_TABLES)
+
+
+def _create_indexes_and_analyze(conn: sqlite3.Connection):
+    _create_indexes(conn, names=_V2_INDEXES)
+    conn.execute("ANALYZE")
+
+
+def _create_players_hist_merged(conn: sqlite3.Connection):
+    conn.execute(_create_table_sql("players_hist_merged", TABLES["players_hist_merged"]))
+    _create_indexes(conn, names=["players_hist_merged_player_round"])
+
+
+def _create_table_versions(conn: sqlite3.Connection):
+    conn.execute(_create_table_sql("table_versions", TABLES["table_versions"]))
+
+
+def _manage_pipeline_tables(conn: sqlite3.Connection):
+    # Until now created on first write as unmanaged tables with a unique "<table>_key" index
+    _rebuild_tables(conn, _V5_TABLES)
+    _create_indexes(conn, names=["players_features_round"])
+
+
+def _create_derived_sources(conn: sqlite3.Connection):
+    conn.execute(_create_table_sql("derived_sources", TABLES["derived_sources"]))
+
+
+def _bump_version(conn: sqlite3.Connection, table: str):
+    conn.execute(
+        "INSERT INTO table_versions VALUES (?, 1, datetime('now')) "
+        "ON CONFLICT (table_name) DO UPDATE SET version = version + 1, updated_at = excluded.updated_at",
+        (table,)
+    )
+
+
+@contextmanager
+def _transaction(conn: sqlite3.Connection):
+    """DDL and DML in one transaction (the connection is in autocommit mode otherwise)."""
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
+# Applied in order to databases whose PRAGMA user_version is below the version number.
+# Add new steps at the end, never edit a released one.
+MIGRATIONS: tp.List[tp.Tuple[int, str, tp.Callable[[sqlite3.Connection], None]]] = [
+    (1, "managed tables with primary keys", _create_managed_tables),
+    (2, "composite indexes for the merged queries", _create_indexes_and_analyze),
+    (3, "materialised players_hist_merged table", _create_players_hist_merged),
+    (4, "per-table write counters", _create_table_versions),
+    (5, "effective_ownership and players_features with primary keys", _manage_pipeline_tables),
+    (6, "source versions of derived tables", _create_derived_sources),
+]
+
+
+class SQLiteSchema:
+    """
+    Owns the layout of the SQLite database: table definitions with primary keys,
+    the indexes the merged queries need, connection pragmas (WAL etc.) and migrations.
+
+    ``migrate()`` brings a database up to the latest version recorded in
+    ``PRAGMA user_version``; it is cheap when there is nothing to do and runs once per
+    database per process. ``write()`` inserts through batched ``executemany`` calls in
+    one transaction, so tables and indexes are never dropped and recreated the way
+    ``to_sql(if_exists="replace")`` does.
+
+    Example usage:
+        schema = SQLiteSchema("data/fantasy_football.db")
+        schema.migrate()
+        schema.write("players_hist", players_hist, if_exists="upsert")
+    """
+
+    _migrated: tp.Set[str] = set()
+    _lock = threading.Lock()
+
+    def __init__(self, path: tp.Union[str, Path], batch_size: int = 5000):
+        self.path = Path(path)
+        self.batch_size = batch_size
+
+    @classmethod
+    def from_credentials(cls, credentials: tp.Dict[str, tp.Any], **kwargs) -> "SQLiteSchema":
+        con = credentials["con"]
+        if not con.startswith("sqlite:///"):
+            raise ValueError(f"SQLiteSchema only manages sqlite:/// databases, got {con!r}")
+        return cls(con[len("sqlite:///"):], **kwargs)
+
+    def connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, isolation_level=None)
+        for pragma, value in PRAGMAS.items():
+            conn.execute(f"PRAGMA {pragma} = {value}")
+        return conn
+
+    @property
+    def version(self) -> int:
+        conn = self.connect()
+        try:
+            return conn.execute("PRAGMA user_version").fetchone()[0]
+        finally:
+            conn.close()
+
+    def migrate(self) -> int:
+        """Apply outstanding migrations; returns the database's schema version."""
+        key = str(self.path.resolve())
+        with self._lock:
+            conn = self.connect()
+            try:
+                version = conn.execute("PRAGMA user_version").fetchone()[0]
+                if key in self._migrated and version >= MIGRATIONS[-1][0]:
+                    return version
+                for target, description, step in MIGRATIONS:
+                    if version >= target:
+                        continue
+                    logger.info("Migrating %s to schema version %s: %s", self.path, target, description)
+                    with _transaction(conn):
+                        step(conn)
+                        conn.execute(f"PRAGMA user_version = {target}")
+                    version = target
+                self._migrated.add(key)
+                return version
+            finally:
+                conn.close()
+
+    def touch(self, table: str):
+        """Record a write to table made outside write(), e.g. through SQLAlchemy."""
+        self.migrate()
+        conn = self.connect()
+        try:
+            _bump_version(conn, table)
+        finally:
+            conn.close()
+
+    def data_version(self, tables: tp.Iterable[str]) -> tp.Dict[str, int]:
+        """Write counter of each table (0 if never written through SQLiteSchema)."""
+        self.migrate()
+        tables = list(tables)
+        conn = self.connect()
+        try:
+            versions = dict(conn.execute(
+                f"SELECT table_name, version FROM table_versions WHERE table_name IN ({', '.join('?' * len(tables))})",
+                tables
+            ).fetchall())
+        finally:
+            conn.close()
+        return {table: versions.get(table, 0) for table in tables}
+
+    @staticmethod
+    def _rows(data: pd.DataFrame) -> tp.Iterator[tp.Tuple]:
+        """DataFrame rows as plain Python values sqlite3 can bind (None for missing)."""
+        columns = []
+        for col in data.columns:
+            s = data[col]
+            if pd.api.types.is_bool_dtype(s):
+                s = s.astype("Int64")
+            elif pd.api.types.is_datetime64_any_dtype(s):
+                s = s.astype(str)
+            elif pd.api.types.is_object_dtype(s):
+                s = s.map(lambda v: str(v) if isinstance(v, (list, dict)) else v)
+            values = s.astype(object).to_numpy()
+            values[pd.isna(values)] = None
+            columns.append([v.item() if isinstance(v, np.generic) else v for v in values])
+        return zip(*columns)
+
+    def _add_missing_columns(self, conn: sqlite3.Connection, table: str, data: pd.DataFrame):
+        existing = {row[1] for row in conn.execute(f'PRAGMA table_info("{table}")')}
+        for col in data.columns:
+            if col not in existing:
+                affinity = ("INTEGER" if pd.api.types.is_integer_dtype(data[col]) or pd.api.types.is_bool_dtype(data[col])
+                            else "REAL" if pd.api.types.is_float_dtype(data[col]) else "TEXT")
+                conn.execute(f'ALTER TABLE "{table}" ADD COLUMN "{col}" {affinity}')
+
+    def write(self, table: str, data: pd.DataFrame, if_exists: str = "append",
+              key_columns: tp.Optional[tp.List[str]] = None) -> int:
+        """
+        Write data in one transaction. if_exists is "replace" (clear the table's rows,
+        keep its definition), "append" or "upsert" (insert or update on key_columns,
+        default the table's primary key). Returns the number of rows written.
+        """
+        if if_exists not in ("replace", "append", "upsert"):
+            raise ValueError(f"Unknown if_exists {if_exists!r}")
+        key_columns = key_columns or TABLES.get(table, {}).get("key")
+        if if_exists == "upsert" and not key_columns:
+            raise ValueError(f"Upserting into {table} needs key_columns")
+
+        self.migrate()
+        columns = ", ".join(f'"{col}"' for col in data.columns)
+        sql = f'INSERT INTO "{table}" ({columns}) VALUES ({", ".join("?" * len(data.columns))})'
+        if if_exists == "upsert":
+            updates = ", ".join(f'"{col}" = excluded."{col}"' for col in data.columns if col not in key_columns)
+            sql += f" ON CONFLICT ({', '.join(key_columns)}) DO " + (f"UPDATE SET {updates}" if updates else "NOTHING")
+
+        conn = self.connect()
+        try:
+            with _transaction(conn):
+                if table in TABLES:
+                    # Recreates the table and its indexes if something dropped it
+                    conn.execute(_create_table_sql(table, TABLES[table]))
+                    _create_indexes(conn, [table])
+                elif if_exists == "upsert":
+                    # Unmanaged table: the conflict target still needs a unique index
+                    conn.execute(f'CREATE TABLE IF NOT EXISTS "{table}" ({columns})')
+                    conn.execute(f'CREATE UNIQUE INDEX IF NOT EXISTS "{table}_key" ON "{table}" ({", ".join(key_columns)})')
+                else:
+                    conn.execute(f'CREATE TABLE IF NOT EXISTS "{table}" ({columns})')
+                self._add_missing_columns(conn, table, data)
+
+                if if_exists == "replace":
+                    conn.execute(f'DELETE FROM "{table}"')
+
+                rows = self._rows(data)
+                while batch := list(itertools.islice(rows, self.batch_size)):
+                    conn.executemany(sql, batch)
+                _bump_version(conn, table)
+        finally:
+            conn.close()
+
+        return len(data)
+
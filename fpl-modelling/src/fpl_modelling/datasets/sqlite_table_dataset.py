@@ -0,0 +1,65 @@
+import sqlite3
+import typing as tp
+
+import pandas as pd
+from kedro.io import AbstractDataset
+
+from .sqlite_schema import SQLiteSchema
+
+
+class SQLiteTableDataset(AbstractDataset[pd.DataFrame, pd.DataFrame]):
+    """
+    Table in the managed SQLite database (see SQLiteSchema), in place of
+    ``pandas.SQLTableDataset`` whose ``if_exists: replace`` drops the table, its keys
+    and its indexes on every save.
+
+    Saves go through batched ``executemany`` in one transaction: ``replace`` clears the
+    rows but keeps the table definition, ``append`` adds rows and ``upsert`` inserts or
+    updates on ``key_columns`` (default the table's primary key). Any outstanding schema
+    migrations run the first time the database is touched. Loading a table that does
+    not exist yet returns an empty DataFrame.
+
+    Example catalog entry:
+        players:
+          type: fpl_modelling.datasets.SQLiteTableDataset
+          credentials: db_credentials
+          table_name: players
+          if_exists: replace
+          load_args:
+            index_col: player_id
+    """
+
+    def __init__(self, *, table_name: str, credentials: tp.Dict[str, tp.Any], if_exists: str = "replace",
+                 key_columns: tp.Optional[tp.List[str]] = None, load_sql: tp.Optional[str] = None,
+                 load_args: tp.Optional[tp.Dict[str, tp.Any]] = None, batch_size: int = 5000,
+                 metadata: tp.Optional[tp.Dict[str, tp.Any]] = None):
+        self.table_name = table_name
+        self.if_exists = if_exists
+        self.key_columns = key_columns
+        self.load_sql = load_sql
+        self.load_args = load_args or {}
+        self.metadata = metadata
+        self.schema = SQLiteSchema.from_credentials(credentials, batch_size=batch_size)
+
+    def _describe(self) -> tp.Dict[str, tp.Any]:
+        return {"table_name": self.table_name, "if_exists": self.if_exists,
+                "key_columns": self.key_columns, "path": str(self.schema.path)}
+
+    def load(self) -> pd.DataFrame:
+        self.schema.migrate()
+        conn = self.schema.connect()
+        try:
+            return pd.read_sql_query(self.load_sql or f'SELECT * FROM "{self.table_name}"', conn, **self.load_args)
+        except (sqlite3.OperationalError, pd.errors.DatabaseError) as exc:
+            # Only a table not written yet loads as empty; locks, corruption or a broken view are raised
+            if self.load_sql or f"no such table: {self.table_name}" not in str(exc):
+                raise
+            return pd.DataFrame()
+        finally:
+            conn.close()
+
+    def save(self, data: pd.DataFrame) -> None:
+        index_col = self.load_args.get("index_col")
+        if index_col and data.index.name == index_col:
+            data = data.reset_index()
+        self.schema.write(self.table_name, data, self.if_exists, self.key_columns)
@@ -0,0 +1,104 @@
+import logging
+import typing as tp
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Repeated strings: a few hundred distinct values over hundreds of thousands of rows
+CATEGORICAL_COLUMNS = [
+    "player_name", "web_name", "first_name", "second_name",
+    "team_name", "players_team", "next_week_opponent_team_name",
+    "position_name", "position_name_abbr", "singular_name_short",
+]
+
+# Integer widths with headroom over a season's values. Per-round counts stay at int16 rather
+# than int8 so sums and differences across a few rounds cannot wrap.
+INTEGER_COLUMNS = {
+    "int8": [
+        "team_id", "position_id", "opponent_team", "team_h", "team_a", "was_home",
+        "team_h_score", "team_a_score", "players_team_score", "opponent_team_score",
+        "goals_scored", "assists", "clean_sheets", "goals_conceded", "own_goals", "penalties_saved",
+        "penalties_missed", "yellow_cards", "red_cards", "saves", "bonus", "starts",
+    ],
+    "int16": [
+        "player_id", "element", "fixture", "round", "gameweek", "event",
+        "minutes", "round_minutes", "total_points", "round_points", "bps", "value",
+        "clearances_blocks_interceptions", "recoveries", "tackles", "defensive_contribution",
+    ],
+    "int32": [
+        "cumsum_minutes", "cumsum_points", "selected", "transfers_in", "transfers_out",
+        "transfers_balance", "cumsum_transfers_in", "cumsum_transfers_out",
+    ],
+}
+
+COLUMN_DTYPES: tp.Dict[str, str] = {
+    **{col: "category" for col in CATEGORICAL_COLUMNS},
+    **{col: dtype for dtype, cols in INTEGER_COLUMNS.items() for col in cols},
+}
+
+
+def memory_mb(df: pd.DataFrame) -> float:
+    """Deep memory use of a frame (strings included) in MB."""
+    return df.memory_usage(deep=True).sum() / 1e6
+
+
+def _downcast(s: pd.Series, dtype: str) -> tp.Optional[pd.Series]:
+    """s as the narrower integer dtype, or None if it has gaps, fractions or values out of range."""
+    target = np.dtype(dtype)
+    if s.dtype == target or s.empty:
+        return None
+    if pd.api.types.is_bool_dtype(s):
+        return s.astype(target)
+    if pd.api.types.is_float_dtype(s):
+        values = s.to_numpy()
+        if np.isnan(values).any() or (values % 1 != 0).any():
+            return None
+    elif not pd.api.types.is_integer_dtype(s) or s.dtype.itemsize < target.itemsize:
+        return None
+
+    info = np.iinfo(target)
+    if s.min() < info.min or s.max() > info.max:
+        return None
+    return s.astype(target)
+
+
+def apply_dtypes(df: pd.DataFrame, dtypes: tp.Optional[tp.Dict[str, str]] = None) -> tp.List[str]:
+    """
+    Cast df's registry columns in place: repeated strings to category, integers to the
+    narrowest declared width. Columns that would lose information (missing values in an
+    integer column, out-of-range values, mixed types) are left as they are.
+
+    Returns the names of the columns that changed.
+    """
+    dtypes = COLUMN_DTYPES if dtypes is None else dtypes
+    changed = []
+    for col in df.columns.intersection(list(dtypes)):
+        s = df[col]
+        if isinstance(s, pd.DataFrame):  # duplicated column name
+            continue
+        if dtypes[col] == "category":
+            if not pd.api.types.is_object_dtype(s) or pd.api.types.infer_dtype(s, skipna=True) != "string":
+                continue
+            cast = s.astype("category")
+        else:
+            cast = _downcast(s, dtypes[col])
+            if cast is None:
+                continue
+        df[col] = cast
+        changed.append(col)
+
+    return changed
+
+
+def typed(df: pd.DataFrame, name: str = "frame") -> pd.DataFrame:
+    """apply_dtypes on df, logging memory before and after; returns df for chaining in nodes."""
+    if not isinstance(df, pd.DataFrame) or df.empty:
+        return df
+
+    before = memory_mb(df)
+    changed = apply_dtypes(df)
+    if changed:
+        logger.info("%s: %.1f MB -> %.1f MB (%s columns narrowed)", name, before, memory_mb(df), len(changed))
+    return df
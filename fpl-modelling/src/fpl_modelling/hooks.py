@@ -0,0 +1,33 @@
+import typing as tp
+
+import pandas as pd
+from kedro.framework.hooks import hook_impl
+
+from fpl_modelling.dtype_registry import typed
+
+# Read-only frames that nodes compute on. State tables (players_hist_state, fixtures_state)
+# are left alone: the ingestion nodes compare them value by value with fresh API rows.
+TYPED_DATASETS = frozenset({
+    "players", "teams", "positions", "players_hist", "fixtures", "my_current_team",
+    "players_merged", "current_team", "players_hist_merged", "players_hist_merged_recent",
+    "players_hist_merged_view", "expanded_df", "effective_ownership", "players_features",
+})
+
+
+class DtypeHooks:
+    """
+    Applies the dtype registry (see dtype_registry.COLUMN_DTYPES) to the DataFrames
+    loaded from the ``datasets`` allow-list, so nodes get categorical strings and narrow
+    integers whichever dataset type or environment the frame came from. Other datasets
+    are passed through as loaded.
+
+    Kedro ignores the hook's return value, so columns are replaced on the loaded frame itself.
+    """
+
+    def __init__(self, datasets: tp.Iterable[str] = TYPED_DATASETS):
+        self.datasets = frozenset(datasets)
+
+    @hook_impl
+    def after_dataset_loaded(self, dataset_name: str, data: tp.Any) -> None:
+        if dataset_name in self.datasets and isinstance(data, pd.DataFrame):
+            typed(data, dataset_name)
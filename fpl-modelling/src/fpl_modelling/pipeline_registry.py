@@ -5,15 +5,32 @@ from kedro.pipeline import Pipeline
 from fpl_modelling.pipelines.data_engineering.create_players_teams_pos_table_pipeline import create_players_teams_pos_table_pipeline
 from fpl_modelling.pipelines.optimisation.pick_team_pipelines import (
     create_pick_optimal_team_pipeline, 
+    create_pick_optimal_team_horizon_pipeline,
     create_pick_most_selected_team_pipeline
 )
-from fpl_modelling.pipelines.data_engineering.create_player_gw_hist_table_pipeline import create_player_gw_hist_table_pipeline
+from fpl_modelling.pipelines.data_engineering.create_player_gw_hist_table_pipeline import (
+    create_player_gw_hist_table_pipeline,
+    create_update_player_gw_hist_table_pipeline
+)
 from fpl_modelling.pipelines.data_engineering.get_team_pipeline import create_get_team_pipeline
+from fpl_modelling.pipelines.data_engineering.live_gameweek_pipeline import create_live_gameweek_pipeline
+from fpl_modelling.pipelines.data_engineering.manager_picks_pipeline import create_manager_picks_pipeline
 from fpl_modelling.pipelines.data_processing.prepare_model_data_pipeline import create_prepare_model_data_pipeline
-from fpl_modelling.pipelines.data_science.train_model_pipeline import create_train_model_pipeline
+from fpl_modelling.pipelines.data_processing.incremental_features_pipeline import (
+    create_update_features_pipeline,
+    create_rebuild_features_pipeline
+)
+from fpl_modelling.pipelines.data_science.train_model_pipeline import create_train_model_pipeline, create_backtest_pipeline
+from fpl_modelling.pipelines.data_science.hyperparameter_search_pipeline import create_hyperparameter_search_pipeline
 
-from fpl_modelling.pipelines.data_engineering.create_fixtures_table_pipeline import create_fixtures_table_pipeline
-from fpl_modelling.pipelines.data_science.gameweek_prediction_pipeline import create_gameweek_prediction_pipeline 
+from fpl_modelling.pipelines.data_engineering.create_fixtures_table_pipeline import (
+    create_fixtures_table_pipeline,
+    create_update_fixtures_table_pipeline
+)
+from fpl_modelling.pipelines.data_science.gameweek_prediction_pipeline import (
+    create_gameweek_prediction_pipeline,
+    create_horizon_prediction_pipeline
+)
 
 def register_pipelines() -> dict[str, Pipeline]:
     """Register the project's pipelines.
@@ -29,26 +46,54 @@ def register_pipelines() -> dict[str, Pipeline]:
  
     player_gw_hist_table_pipeline = create_player_gw_hist_table_pipeline()
 
+    update_player_gw_hist_table_pipeline = create_update_player_gw_hist_table_pipeline()
+
     get_team_pipeline = create_get_team_pipeline()
 
+    live_gameweek_pipeline = create_live_gameweek_pipeline()
+
+    manager_picks_pipeline = create_manager_picks_pipeline()
+
     prepare_model_data_pipeline = create_prepare_model_data_pipeline()
 
+    update_features_pipeline = create_update_features_pipeline()
+
+    rebuild_features_pipeline = create_rebuild_features_pipeline()
+
     train_model_pipeline = create_train_model_pipeline()
 
+    backtest_pipeline = create_backtest_pipeline()
+
+    hyperparameter_search_pipeline = create_hyperparameter_search_pipeline()
+
     fixtures_table_pipeline = create_fixtures_table_pipeline()
 
+    update_fixtures_table_pipeline = create_update_fixtures_table_pipeline()
+
     gameweek_prediction_pipeline = create_gameweek_prediction_pipeline()
 
+    horizon_prediction_pipeline = create_horizon_prediction_pipeline()
+
+    pick_optimal_team_horizon_pipeline = create_pick_optimal_team_horizon_pipeline()
+
     return {
         "create_players_teams_pos_tables": players_teams_pos_table_pipeline,
         "pick_optimal_team": pick_optimal_team_pipeline,
         "create_player_gw_hist_table": player_gw_hist_table_pipeline,
         "pick_most_selected_team": pick_most_selected_team_pipeline,
         "get_team": get_team_pipeline,
+        "live_gameweek": live_gameweek_pipeline, # RUNTIME PARAMS: gameweek
+        "crawl_manager_picks": manager_picks_pipeline, # RUNTIME PARAMS: gameweek
         "update_tables": players_teams_pos_table_pipeline + player_gw_hist_table_pipeline + fixtures_table_pipeline,
+        "update_tables_incremental": players_teams_pos_table_pipeline + update_player_gw_hist_table_pipeline + update_fixtures_table_pipeline,
         "prepare_model_data": prepare_model_data_pipeline, #RUNTIME PARAMS: current_gameweek
+        "update_features": update_features_pipeline, #RUNTIME PARAMS: model_num
+        "rebuild_features": rebuild_features_pipeline, #RUNTIME PARAMS: model_num
         "train_model": train_model_pipeline, #RUNTIME PARAMS: model_num
         "train_new_model": prepare_model_data_pipeline + train_model_pipeline,  #RUNTIME PARAMS: current_gameweek, model_num
+        "backtest": backtest_pipeline, #RUNTIME PARAMS: backtest.model_nums
+        "hyperparameter_search": hyperparameter_search_pipeline, #RUNTIME PARAMS: hyperparameter_search.model_num
         "create_fixtures_table": fixtures_table_pipeline,
-        "gameweek_prediction": gameweek_prediction_pipeline + pick_optimal_team_pipeline # RUNTIME PARAMS: model_num, gameweek 
+        "gameweek_prediction": gameweek_prediction_pipeline + pick_optimal_team_pipeline, # RUNTIME PARAMS: model_num, gameweek 
+        "horizon_prediction": gameweek_prediction_pipeline + horizon_prediction_pipeline + pick_optimal_team_horizon_pipeline # RUNTIME PARAMS: model_num, gameweek, prediction_horizon
     }
@@ -0,0 +1,133 @@
+import logging
+import time
+import typing as tp
+from datetime import datetime, timezone
+
+import pandas as pd
+
+from fpl_modelling.FPL_API import FPLClient
+
+logger = logging.getLogger(__name__)
+
+
+class LiveGameweekTracker:
+    """
+    Polls ``event/{gw}/live/`` (one request for every player) and turns successive
+    responses into per-player, per-fixture deltas.
+
+    Each delta is passed to every sink (e.g. updating in-round rows of players_hist, or
+    tracked squads' live scores) instead of refetching ~700 element-summary histories.
+    The poll interval adapts to the gameweek: ``live_interval`` while a match is in
+    progress, otherwise wait until the next kickoff (capped at ``idle_interval``), and
+    stop once every fixture has finished.
+
+    Example usage:
+        tracker = LiveGameweekTracker(client, gameweek=12, sinks=[print])
+        tracker.run()
+    """
+
+    # players_hist stats in each element's live "stats" block (totals over the gameweek)
+    STAT_COLUMNS = [
+        'minutes', 'goals_scored', 'assists', 'clean_sheets', 'goals_conceded', 'own_goals',
+        'penalties_saved', 'penalties_missed', 'yellow_cards', 'red_cards', 'saves', 'bonus',
+        'bps', 'influence', 'creativity', 'threat', 'ict_index', 'clearances_blocks_interceptions',
+        'recoveries', 'tackles', 'defensive_contribution', 'starts', 'expected_goals',
+        'expected_assists', 'expected_goal_involvements', 'expected_goals_conceded',
+    ]
+
+    def __init__(self, client: FPLClient, gameweek: int,
+                 sinks: tp.Optional[tp.List[tp.Callable[[pd.DataFrame], None]]] = None,
+                 live_interval: float = 60, idle_interval: float = 900, max_polls: tp.Optional[int] = None):
+        self.client = client
+        self.gameweek = gameweek
+        self.sinks = sinks or []
+        self.live_interval = live_interval
+        self.idle_interval = idle_interval
+        self.max_polls = max_polls
+
+        self.polls = 0
+        self.live = pd.DataFrame(
+            {col: pd.Series(dtype='float64') for col in ['player_id', 'fixture', 'total_points'] + self.STAT_COLUMNS}
+        )
+
+    def _live_to_df(self, elements: tp.List[tp.Dict]) -> pd.DataFrame:
+        """
+        One row per (player, fixture). A player with one fixture takes every stat from the
+        live "stats" block. In a double gameweek that block sums both fixtures, so each
+        fixture only gets the stats its "explain" breakdown itemises; the rest are left
+        missing (NaN) rather than guessed, and sinks should not overwrite them.
+        """
+        rows = []
+        for element in elements:
+            fixtures = element.get('explain', [])
+            for fixture in fixtures:
+                row = {'player_id': element['id'], 'fixture': fixture['fixture']}
+                if len(fixtures) == 1:
+                    stats = element.get('stats', {})
+                    row.update({col: stats.get(col) for col in self.STAT_COLUMNS})
+                    row['total_points'] = stats.get('total_points', sum(s['points'] for s in fixture['stats']))
+                else:
+                    row.update({s['identifier']: s['value'] for s in fixture['stats'] if s['identifier'] in self.STAT_COLUMNS})
+                    row['total_points'] = sum(s['points'] for s in fixture['stats'])
+                rows.append(row)
+
+        # influence, ict_index, expected_* etc. arrive as strings
+        return pd.DataFrame(rows, columns=self.live.columns).apply(pd.to_numeric).astype('float64')
+
+    def poll_once(self) -> pd.DataFrame:
+        """Fetch live stats and return rows that are new or changed since the last poll."""
+        current = self._live_to_df(self.client.get_event_live(self.gameweek))
+        self.polls += 1
+
+        merged = current.merge(self.live, on=['player_id', 'fixture'], how='left',
+                               suffixes=('', '_prev'), indicator=True)
+        value_cols = ['total_points'] + self.STAT_COLUMNS
+        changed = merged['_merge'] == 'left_only'
+        for col in value_cols:
+            changed |= (merged[col] != merged[f'{col}_prev']) & ~(merged[col].isna() & merged[f'{col}_prev'].isna())
+
+        deltas = merged.loc[changed, ['player_id', 'fixture'] + value_cols].copy()
+        deltas['points_delta'] = (
+            merged.loc[changed, 'total_points'] - merged.loc[changed, 'total_points_prev'].fillna(0)
+        )
+        deltas['round'] = self.gameweek
+        self.live = current
+
+        if not deltas.empty:
+            for sink in self.sinks:
+                sink(deltas)
+
+        return deltas.reset_index(drop=True)
+
+    def next_interval(self, fixtures: pd.DataFrame) -> tp.Optional[float]:
+        """Seconds until the next poll, or None when the gameweek is over."""
+        if fixtures.empty or fixtures['finished'].all():
+            return None
+
+        played = fixtures.get('finished_provisional', fixtures['finished']).astype(bool)
+        if (fixtures['started'].astype(bool) & ~played).any():
+            return self.live_interval
+
+        upcoming = pd.to_datetime(fixtures.loc[~fixtures['started'].astype(bool), 'kickoff_time'], utc=True)
+        if upcoming.empty:  # all played, waiting for bonus / final confirmation
+            return self.idle_interval
+
+        until_kickoff = (upcoming.min() - datetime.now(timezone.utc)).total_seconds()
+        return min(max(until_kickoff, self.live_interval), self.idle_interval)
+
+    def run(self) -> pd.DataFrame:
+        """Poll until the gameweek finishes (or max_polls), returning the final live table."""
+        while True:
+            deltas = self.poll_once()
+            logger.info("GW%s poll %s: %s player-fixture rows changed", self.gameweek, self.polls, len(deltas))
+
+            if self.max_polls is not None and self.polls >= self.max_polls:
+                break
+
+            fixtures = self.client.get_gameweek_fixtures(self.gameweek, force_refresh=True)
+            interval = self.next_interval(fixtures)
+            if interval is None:
+                break
+            time.sleep(interval)
+
+        return self.live
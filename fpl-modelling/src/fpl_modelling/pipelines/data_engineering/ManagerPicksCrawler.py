@@ -0,0 +1,142 @@
+import logging
+import typing as tp
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from fpl_modelling.FPL_API import FPLClient
+
+logger = logging.getLogger(__name__)
+
+
+class ManagerPicksCrawler:
+    """
+    Crawls many managers' picks for one gameweek and stores them as integer arrays.
+
+    Entries come from the top of classic leagues' standings (league 314 is the overall
+    ranking) and are fetched ``chunk_size`` at a time through the client's concurrent
+    path, so concurrency stays bounded by ``max_connections_per_host`` and the rate limiter.
+    Every finished chunk is written to ``<path>/gameweek=<gw>/chunk_<n>.npz`` holding
+    ``entry_ids`` (int32), ``elements`` and ``multipliers`` (entries x 15, int16/int8)
+    in pick order, so an interrupted crawl resumes by skipping entries already on disk.
+    Chunks are written to ``.chunk_<n>.npz.tmp`` first and renamed when complete; the
+    temporary name never matches the chunk glob, and leftovers from a crashed run are
+    removed when the next crawl starts.
+    Entries that fail (e.g. deleted teams) are logged and retried on the next run.
+
+    Example usage:
+        crawler = ManagerPicksCrawler(client, "data/02_intermediate/manager_picks")
+        crawler.crawl(gameweek=12, entry_ids=client.get_league_entries(314, 10000))
+        ownership = crawler.effective_ownership(gameweek=12)
+    """
+
+    SQUAD_SIZE = 15
+
+    def __init__(self, client: FPLClient, path: str = "data/02_intermediate/manager_picks",
+                 chunk_size: int = 1000):
+        self.client = client
+        self.path = Path(path)
+        self.chunk_size = chunk_size
+
+    def _gameweek_dir(self, gameweek: int) -> Path:
+        return self.path / f"gameweek={gameweek}"
+
+    def _chunks(self, gameweek: int) -> tp.List[Path]:
+        return sorted(self._gameweek_dir(gameweek).glob("chunk_*.npz"))
+
+    def crawled_entries(self, gameweek: int) -> np.ndarray:
+        """Entry ids already stored for gameweek."""
+        chunks = self._chunks(gameweek)
+        if not chunks:
+            return np.empty(0, dtype=np.int32)
+        return np.concatenate([np.load(chunk)["entry_ids"] for chunk in chunks])
+
+    @classmethod
+    def _picks_to_arrays(cls, responses: tp.List[tp.Dict]) -> tp.Tuple[np.ndarray, np.ndarray]:
+        elements = np.zeros((len(responses), cls.SQUAD_SIZE), dtype=np.int16)
+        multipliers = np.zeros((len(responses), cls.SQUAD_SIZE), dtype=np.int8)
+        for i, response in enumerate(responses):
+            picks = sorted(response["picks"], key=lambda p: p["position"])
+            elements[i, :len(picks)] = [p["element"] for p in picks]
+            multipliers[i, :len(picks)] = [p["multiplier"] for p in picks]
+
+        return elements, multipliers
+
+    def crawl(self, gameweek: int, entry_ids: tp.Iterable[int]) -> int:
+        """Fetch and store picks for every entry not yet crawled; returns the number stored."""
+        gw_dir = self._gameweek_dir(gameweek)
+        gw_dir.mkdir(parents=True, exist_ok=True)
+        for stale in gw_dir.glob(".chunk_*.tmp"):
+            stale.unlink()
+
+        done = set(self.crawled_entries(gameweek).tolist())
+        todo = list(dict.fromkeys(e for e in entry_ids if e not in done))
+        chunks = self._chunks(gameweek)
+        next_chunk = int(chunks[-1].stem.split("_")[1]) + 1 if chunks else 0
+        logger.info("GW%s: %s entries already crawled, %s to fetch", gameweek, len(done), len(todo))
+
+        stored = 0
+        for start in range(0, len(todo), self.chunk_size):
+            batch = todo[start:start + self.chunk_size]
+            responses = self.client.get_team_picks_many(batch, gameweek)
+
+            ok = [(entry, r) for entry, r in zip(batch, responses) if not isinstance(r, BaseException)]
+            failed = len(batch) - len(ok)
+            if failed:
+                logger.warning("GW%s: %s of %s entries failed, they will be retried next run",
+                               gameweek, failed, len(batch))
+            if not ok:
+                continue
+
+            elements, multipliers = self._picks_to_arrays([r for _, r in ok])
+            # Write then rename so a crash never leaves a half-written chunk behind
+            tmp = gw_dir / f".chunk_{next_chunk:05d}.npz.tmp"
+            with open(tmp, "wb") as f:  # a file object, so numpy does not append .npz
+                np.savez_compressed(
+                    f,
+                    entry_ids=np.array([entry for entry, _ in ok], dtype=np.int32),
+                    elements=elements,
+                    multipliers=multipliers,
+                )
+            tmp.rename(gw_dir / f"chunk_{next_chunk:05d}.npz")
+            next_chunk += 1
+            stored += len(ok)
+
+        return stored
+
+    def load(self, gameweek: int) -> tp.Dict[str, np.ndarray]:
+        """All stored picks for gameweek as {entry_ids, elements, multipliers} arrays."""
+        chunks = [np.load(chunk) for chunk in self._chunks(gameweek)]
+        if not chunks:
+            raise FileNotFoundError(f"No picks crawled for gameweek {gameweek} under {self.path}")
+
+        return {
+            key: np.concatenate([chunk[key] for chunk in chunks])
+            for key in ["entry_ids", "elements", "multipliers"]
+        }
+
+    def effective_ownership(self, gameweek: int) -> pd.DataFrame:
+        """
+        Per-player ownership, captaincy rate and effective ownership (multiplier-weighted,
+        so captains count twice and benched players not at all) across the crawled entries.
+        """
+        picks = self.load(gameweek)
+        elements, multipliers = picks["elements"], picks["multipliers"]
+        n_entries = len(picks["entry_ids"])
+        size = int(elements.max()) + 1
+
+        picked = elements > 0
+        owned = np.bincount(elements[picked], minlength=size)
+        captained = np.bincount(elements[multipliers >= 2], minlength=size)
+        effective = np.bincount(elements[picked], weights=multipliers[picked], minlength=size)
+
+        player_ids = np.flatnonzero(owned)
+        return pd.DataFrame({
+            "player_id": player_ids,
+            "round": gameweek,
+            "ownership": owned[player_ids] / n_entries,
+            "captaincy_rate": captained[player_ids] / n_entries,
+            "effective_ownership": effective[player_ids] / n_entries,
+            "sample_size": n_entries,
+        })
@@ -0,0 +1,116 @@
+import logging
+import typing as tp
+
+import pandas as pd
+import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+
+class PlayersHistBuilder:
+    """
+    Builds the players_hist table column by column from raw element-summary
+    ``history`` records, instead of one json_normalize'd DataFrame per player.
+
+    Each record is appended straight into per-column buffers for a fixed schema and a
+    single Arrow table is built at the end. Fields the API adds that are not in the
+    schema are dropped (logged once).
+
+    Example usage:
+        builder = PlayersHistBuilder()
+        builder.append(history, player_id=1, player_name="A Player", team_id=3, position_id=2)
+        players_hist = builder.to_pandas()
+    """
+
+    HISTORY_SCHEMA = pa.schema([
+        ("element", pa.int32()),
+        ("fixture", pa.int32()),
+        ("opponent_team", pa.int32()),
+        ("total_points", pa.int32()),
+        ("was_home", pa.bool_()),
+        ("kickoff_time", pa.string()),
+        ("team_h_score", pa.int32()),
+        ("team_a_score", pa.int32()),
+        ("round", pa.int32()),
+        ("modified", pa.bool_()),
+        ("minutes", pa.int32()),
+        ("goals_scored", pa.int32()),
+        ("assists", pa.int32()),
+        ("clean_sheets", pa.int32()),
+        ("goals_conceded", pa.int32()),
+        ("own_goals", pa.int32()),
+        ("penalties_saved", pa.int32()),
+        ("penalties_missed", pa.int32()),
+        ("yellow_cards", pa.int32()),
+        ("red_cards", pa.int32()),
+        ("saves", pa.int32()),
+        ("bonus", pa.int32()),
+        ("bps", pa.int32()),
+        ("influence", pa.float64()),
+        ("creativity", pa.float64()),
+        ("threat", pa.float64()),
+        ("ict_index", pa.float64()),
+        ("clearances_blocks_interceptions", pa.int32()),
+        ("recoveries", pa.int32()),
+        ("tackles", pa.int32()),
+        ("defensive_contribution", pa.int32()),
+        ("starts", pa.int32()),
+        ("expected_goals", pa.float64()),
+        ("expected_assists", pa.float64()),
+        ("expected_goal_involvements", pa.float64()),
+        ("expected_goals_conceded", pa.float64()),
+        ("value", pa.int32()),
+        ("transfers_balance", pa.int64()),
+        ("selected", pa.int64()),
+        ("transfers_in", pa.int64()),
+        ("transfers_out", pa.int64()),
+    ])
+
+    PLAYER_SCHEMA = pa.schema([
+        ("player_id", pa.int32()),
+        ("player_name", pa.string()),
+        ("team_id", pa.int32()),
+        ("position_id", pa.int32()),
+    ])
+
+    # The API sends decimals as strings, e.g. "ict_index": "4.3"
+    _FLOAT_FIELDS = frozenset(f.name for f in HISTORY_SCHEMA if pa.types.is_floating(f.type))
+
+    def __init__(self):
+        self.schema = pa.schema(list(self.HISTORY_SCHEMA) + list(self.PLAYER_SCHEMA))
+        self._columns: tp.Dict[str, tp.List] = {name: [] for name in self.schema.names}
+        self._warned_fields: tp.Set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._columns["player_id"])
+
+    def append(self, history: tp.List[tp.Dict], player_id: int, player_name: str,
+               team_id: int, position_id: int):
+        """Append one player's history records plus their player-level columns."""
+        if not history:
+            return
+
+        for field in self.HISTORY_SCHEMA.names:
+            if field in self._FLOAT_FIELDS:
+                self._columns[field].extend(
+                    None if rec.get(field) is None else float(rec[field]) for rec in history
+                )
+            else:
+                self._columns[field].extend(rec.get(field) for rec in history)
+
+        n = len(history)
+        self._columns["player_id"].extend([player_id] * n)
+        self._columns["player_name"].extend([player_name] * n)
+        self._columns["team_id"].extend([team_id] * n)
+        self._columns["position_id"].extend([position_id] * n)
+
+        unknown = history[0].keys() - set(self.HISTORY_SCHEMA.names) - self._warned_fields
+        if unknown:
+            logger.warning("Dropping element-summary fields not in PlayersHistBuilder schema: %s", sorted(unknown))
+            self._warned_fields |= unknown
+
+    def to_arrow(self) -> pa.Table:
+        return pa.Table.from_pydict(self._columns, schema=self.schema)
+
+    def to_pandas(self) -> pd.DataFrame:
+        return self.to_arrow().to_pandas()
@@ -0,0 +1,20 @@
+from kedro.pipeline import Pipeline, node, pipeline
+from .create_players_teams_pos_table_nodes import init_api_client
+
+
+def create_api_client_pipeline(**kwargs) -> Pipeline:
+    """
+    Node producing the shared ``client``. Every data_engineering pipeline includes it;
+    identical nodes collapse when pipelines are summed, so ``update_tables`` builds one client.
+    """
+    return pipeline([
+        node(
+            func=init_api_client,
+            inputs=dict(
+                base_url="params:base_url",
+                http_client="params:http_client"
+            ),
+            outputs="client",
+            name="fetch_client_node"
+        ),
+    ])
@@ -1,15 +1,108 @@
+from datetime import datetime, timezone
+import logging
+import typing as tp
 from fpl_modelling.FPL_API import FPLClient
+from fpl_modelling.dtype_registry import typed
 import pandas as pd 
 
-def get_fixtures() -> pd.DataFrame:
+logger = logging.getLogger(__name__)
+
+# Columns whose changes matter downstream (gameweek moves, kickoff moves, results)
+FIXTURE_TRACKED_COLUMNS = [
+    'gameweek', 'kickoff_time', 'started', 'finished', 'finished_provisional',
+    'team_h', 'team_a', 'team_h_score', 'team_a_score',
+]
+
+def get_fixtures(client: FPLClient) -> pd.DataFrame:
     """Fetch gameweek fixtures for all gameweeks."""
 
-    client = FPLClient()
-    df_list = []
+    gameweeks = range(1, 39)
+    df_list = client.get_fixtures_many(gameweeks)
 
-    for gw in range(1, 39):
-        fixtures_df = client.get_gameweek_fixtures(gw)
+    for gw, fixtures_df in zip(gameweeks, df_list):
         fixtures_df["gameweek"] = gw  # optional but often useful
-        df_list.append(fixtures_df)
 
-    return pd.concat(df_list, ignore_index=True)
\ No newline at end of file
+    return typed(pd.concat(df_list, ignore_index=True), 'fixtures')
+
+
+def _comparable(df: pd.DataFrame, cols: tp.List[str]) -> pd.DataFrame:
+    """
+    Coerce columns so API values and values read back from SQLite compare equal
+    (bools vs 0/1, ints vs floats, NaN vs None).
+    """
+    out = pd.DataFrame(index=df.index)
+    for col in cols:
+        s = df[col] if col in df else pd.Series(None, index=df.index, dtype=object)
+        if s.dtype == bool:
+            s = s.astype(float)
+        num = pd.to_numeric(s, errors='coerce')
+        out[col] = num if num.notna().sum() == s.notna().sum() else s.astype(object)
+
+    return out.astype(object).where(out.notna(), None)
+
+
+def _classify_change(old: tp.Optional[pd.Series], new: pd.Series) -> str:
+    if old is None:
+        return 'new'
+
+    changes = []
+    if new['gameweek'] is None and old['gameweek'] is not None:
+        changes.append('postponed')
+    elif new['gameweek'] != old['gameweek']:
+        changes.append('rescheduled')
+    if new['kickoff_time'] != old['kickoff_time']:
+        changes.append('kickoff_moved')
+    if new['finished'] and not old['finished']:
+        changes.append('finished')
+    if not changes:
+        changes.append('updated')
+
+    return ','.join(changes)
+
+
+def update_fixtures(client: FPLClient, fixtures_state: pd.DataFrame) -> tp.Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Pull the full fixture list in one request, split it by event locally and diff it
+    against the stored fixtures table.
+
+    Returns the changed rows to upsert and a change log with each changed fixture's
+    old and new gameweek and kickoff time.
+    """
+
+    fixtures = client.get_all_fixtures()
+    fixtures["gameweek"] = fixtures["event"]  # postponed fixtures have no event
+
+    new = _comparable(fixtures, FIXTURE_TRACKED_COLUMNS).set_index(fixtures['id'])
+    if fixtures_state.empty:
+        old = pd.DataFrame(columns=FIXTURE_TRACKED_COLUMNS)
+    else:
+        old = _comparable(fixtures_state, FIXTURE_TRACKED_COLUMNS).set_index(fixtures_state['id'])
+
+    detected_at = datetime.now(timezone.utc).isoformat()
+    changed_ids, change_log = [], []
+    for fixture_id, new_row in new.iterrows():
+        old_row = old.loc[fixture_id] if fixture_id in old.index else None
+        if old_row is not None and old_row.equals(new_row):
+            continue
+
+        changed_ids.append(fixture_id)
+        change_log.append({
+            'fixture_id': fixture_id,
+            'change_type': _classify_change(old_row, new_row),
+            'old_gameweek': None if old_row is None else old_row['gameweek'],
+            'new_gameweek': new_row['gameweek'],
+            'old_kickoff_time': None if old_row is None else old_row['kickoff_time'],
+            'new_kickoff_time': new_row['kickoff_time'],
+            'detected_at': detected_at,
+        })
+
+    logger.info("%d of %d fixtures changed", len(changed_ids), len(fixtures))
+
+    fixtures_updates = fixtures[fixtures['id'].isin(changed_ids)].reset_index(drop=True)
+    fixtures_changes = pd.DataFrame(change_log, columns=[
+        'fixture_id', 'change_type', 'old_gameweek', 'new_gameweek',
+        'old_kickoff_time', 'new_kickoff_time', 'detected_at',
+    ])
+
+    return typed(fixtures_updates, 'fixtures_updates'), typed(fixtures_changes, 'fixtures_changes')
+
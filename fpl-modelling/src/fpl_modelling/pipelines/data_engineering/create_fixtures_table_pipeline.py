@@ -1,16 +1,32 @@
-from fpl_modelling.FPL_API import FPLClient
-import pandas as pd 
-from .create_fixtures_table_nodes import get_fixtures
+from .api_client_pipeline import create_api_client_pipeline
+from .create_fixtures_table_nodes import get_fixtures, update_fixtures
 from kedro.pipeline import Pipeline, node
 
 def create_fixtures_table_pipeline(**kwargs):
-    return Pipeline(
+    return create_api_client_pipeline() + Pipeline(
         [
             node(
                 func=get_fixtures,
-                inputs=None,
+                inputs=dict(client="client"),
                 outputs="fixtures",
                 name="create_fixtures_table_node",
             ),
         ]
     )
+
+
+def create_update_fixtures_table_pipeline(**kwargs):
+    """Single-request fixtures refresh that upserts only changed fixtures and logs the changes."""
+    return create_api_client_pipeline() + Pipeline(
+        [
+            node(
+                func=update_fixtures,
+                inputs=dict(
+                    client="client",
+                    fixtures_state="fixtures_state"
+                ),
+                outputs=["fixtures_updates", "fixtures_changes"],
+                name="update_fixtures_table_node",
+            ),
+        ]
+    )
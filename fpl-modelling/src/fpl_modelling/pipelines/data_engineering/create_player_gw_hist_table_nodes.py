@@ -1,37 +1,129 @@
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import logging
+import typing as tp
 import pandas as pd
-import requests
 from fpl_modelling.FPL_API import FPLClient
+from fpl_modelling.dtype_registry import typed
+from .PlayersHistBuilder import PlayersHistBuilder
 
-def fetch_player(row, client) -> pd.DataFrame:
-    """Fetch gameweek history for a single player."""
+logger = logging.getLogger(__name__)
 
 
-    # extract 'history' data from response into dataframe
-    player_df = client.get_players_hist(row.Index)
-    player_df = player_df.rename(columns={'id':'player_id'})
-    player_df["player_id"] = row.Index
-    player_df["player_name"] = row.player_name
-    player_df['team_id'] = row.team_id
-    player_df['position_id'] = row.position_id
+def create_player_gw_hist_table(
+    db_players: pd.DataFrame, client: FPLClient
+) -> pd.DataFrame:
+    """Fetch gameweek history for all players and combine into one dataframe."""
 
-    return player_df
+    # Concurrent fetch on a single event loop; histories come back in db_players order
+    histories = client.get_players_hist_records_many(db_players.index)
 
+    # Append records straight into typed column buffers and build one table at the end
+    builder = PlayersHistBuilder()
+    for row, history in zip(db_players.itertuples(index=True), histories):
+        builder.append(history, row.Index, row.player_name, row.team_id, row.position_id)
 
-def create_player_gw_hist_table(
-    db_players: pd.DataFrame
+    return typed(builder.to_pandas(), 'players_hist')
+
+
+def get_current_round(client: FPLClient) -> int:
+    """Latest gameweek that has started, from bootstrap-static events."""
+
+    events = client.get_metadata()['events']
+    started = [e['id'] for e in events if e['finished'] or e['is_current']]
+
+    return max(started, default=0)
+
+
+def last_played_rounds(fixtures: pd.DataFrame, current_round: int) -> pd.Series:
+    """Each team's latest round with a started fixture, up to current_round, indexed by team_id."""
+
+    played = fixtures[fixtures['event'].notna() & fixtures['started'].astype(bool) & (fixtures['event'] <= current_round)]
+    rounds = pd.concat([
+        played[['team_h', 'event']].rename(columns={'team_h': 'team_id'}),
+        played[['team_a', 'event']].rename(columns={'team_a': 'team_id'}),
+    ])
+
+    return rounds.groupby('team_id')['event'].max()
+
+
+def select_players_to_refresh(db_players: pd.DataFrame, players_hist_state: pd.DataFrame,
+                              current_round: int, fixtures: tp.Optional[pd.DataFrame] = None) -> pd.DataFrame:
+    """
+    Players whose stored history is missing, behind their team's last played fixture,
+    or whose season totals in bootstrap-static no longer match the stored rows (e.g.
+    bonus added). Without fixtures, history is expected up to current_round, so players
+    whose team has a blank gameweek are refetched until their next fixture.
+    """
+
+    if players_hist_state.empty:
+        return db_players
+
+    state = players_hist_state.set_index('player_id')
+    merged = db_players[['team_id', 'total_points', 'minutes']].join(state, rsuffix='_stored')
+
+    if fixtures is None:
+        expected_round = pd.Series(current_round, index=merged.index)
+    else:
+        expected_round = merged['team_id'].map(last_played_rounds(fixtures, current_round)).fillna(0)
+
+    stale = (
+        merged['latest_round'].isna()
+        | (merged['latest_round'] < expected_round)
+        | (merged['total_points'] != merged['total_points_stored'])
+        | (merged['minutes'] != merged['minutes_stored'])
+    )
+
+    return db_players[stale]
+
+
+def select_changed_rows(player_gw_hist: pd.DataFrame, players_hist_state: pd.DataFrame) -> pd.DataFrame:
+    """
+    Keep rows from each player's last stored round onwards. If a player's earlier,
+    settled rounds no longer add up to what is stored, keep all of their rows.
+    """
+
+    if players_hist_state.empty or player_gw_hist.empty:
+        return player_gw_hist
+
+    hist = player_gw_hist.merge(
+        players_hist_state[['player_id', 'latest_round', 'settled_points', 'settled_minutes']],
+        on='player_id', how='left'
+    )
+
+    settled = hist[hist['round'] < hist['latest_round']]
+    settled_totals = settled.groupby('player_id')[['total_points', 'minutes']].sum()
+    stored_totals = players_hist_state.set_index('player_id')[['settled_points', 'settled_minutes']]
+    stored_totals.columns = ['total_points', 'minutes']
+
+    compared = settled_totals.join(stored_totals, rsuffix='_stored', how='inner')
+    revised_players = compared.index[
+        (compared['total_points'] != compared['total_points_stored'])
+        | (compared['minutes'] != compared['minutes_stored'])
+    ]
+
+    changed = (
+        hist['latest_round'].isna()
+        | (hist['round'] >= hist['latest_round'])
+        | hist['player_id'].isin(revised_players)
+    )
+
+    return player_gw_hist[changed.to_numpy()].reset_index(drop=True)
+
+
+def update_player_gw_hist_table(
+    db_players: pd.DataFrame, players_hist_state: pd.DataFrame, client: FPLClient
 ) -> pd.DataFrame:
-    """Fetch gameweek history for all players and combine into one dataframe."""
-    df_list = []
-
-    with ThreadPoolExecutor(max_workers=20) as executor:  # tune worker count
-        futures = [
-            executor.submit(fetch_player, row,  FPLClient())
-            for row in db_players.itertuples(index=True)
-        ]
-        for f in as_completed(futures):
-            df_list.append(f.result())
-
-    player_gw_hist = pd.concat(df_list, ignore_index=True)
-    
-    return player_gw_hist
+    """
+    Incremental alternative to create_player_gw_hist_table: fetch only players whose
+    history changed and return only the new or revised (player, fixture) rows to upsert.
+    """
+
+    current_round = get_current_round(client)
+    to_refresh = select_players_to_refresh(db_players, players_hist_state, current_round, client.get_all_fixtures())
+
+    logger.info("Refreshing history for %d of %d players (round %d)", len(to_refresh), len(db_players), current_round)
+    if to_refresh.empty:
+        return pd.DataFrame()
+
+    player_gw_hist = create_player_gw_hist_table(to_refresh, client)
+
+    return select_changed_rows(player_gw_hist, players_hist_state)
@@ -1,17 +1,37 @@
 
 from kedro.pipeline import Pipeline, node
 
-from .create_player_gw_hist_table_nodes import create_player_gw_hist_table
+from .api_client_pipeline import create_api_client_pipeline
+from .create_player_gw_hist_table_nodes import create_player_gw_hist_table, update_player_gw_hist_table
 def create_player_gw_hist_table_pipeline(**kwargs):
-    return Pipeline(
+    return create_api_client_pipeline() + Pipeline(
         [
             node(
                 func=create_player_gw_hist_table,
                 inputs=dict(
-                    db_players="players"
+                    db_players="players",
+                    client="client"
                     ),
                 outputs="players_hist",
                 name="create_players_gw_hist_node", 
             ),
         ]
     )
+
+
+def create_update_player_gw_hist_table_pipeline(**kwargs):
+    """Incremental players_hist refresh: upserts only new or revised rows."""
+    return create_api_client_pipeline() + Pipeline(
+        [
+            node(
+                func=update_player_gw_hist_table,
+                inputs=dict(
+                    db_players="players",
+                    players_hist_state="players_hist_state",
+                    client="client"
+                    ),
+                outputs="players_hist_updates",
+                name="update_players_gw_hist_node",
+            ),
+        ]
+    )
@@ -2,10 +2,12 @@ import sqlite3
 import pandas as pd
 import requests
 from fpl_modelling.FPL_API import FPLClient
+from fpl_modelling.dtype_registry import typed
 
-def init_api_client(base_url: str):
+def init_api_client(base_url: str, http_client: dict):
+    """Build the single pooled client shared by every data_engineering node."""
 
-    return FPLClient(base_url)
+    return FPLClient(base_url, **http_client)
 
 def process_players_data(client) -> pd.DataFrame:
     """Extract and clean players data"""
@@ -22,19 +24,19 @@ def process_players_data(client) -> pd.DataFrame:
 
     players['points_per_game'] = players['points_per_game'].astype(float)
 
-    return players
+    return typed(players, 'players')
 
 def process_teams_data(client) -> pd.DataFrame:
     """Extract and clean teams data"""
     teams = client.get_teams()
-    return teams.rename(columns={'id': 'team_id', 'name': 'team_name'})
+    return typed(teams.rename(columns={'id': 'team_id', 'name': 'team_name'}), 'teams')
 
 def process_positions_data(client) -> pd.DataFrame:
     """Extract and clean positions data"""
     positions = client.get_positions()
     positions["sub_positions_locked"] = positions["sub_positions_locked"].astype(str)
 
-    return positions.rename(columns={
+    return typed(positions.rename(columns={
         'id': 'position_id', 
         'singular_name': 'position_name'
-    })
\ No newline at end of file
+    }), 'positions')
\ No newline at end of file
@@ -1,6 +1,6 @@
 from kedro.pipeline import Pipeline, node, pipeline
+from .api_client_pipeline import create_api_client_pipeline
 from .create_players_teams_pos_table_nodes import (
-    init_api_client,
     process_players_data,
     process_teams_data,
     process_positions_data,
@@ -8,14 +8,7 @@ from .create_players_teams_pos_table_nodes import (
 
 
 def create_players_teams_pos_table_pipeline(**kwargs) -> Pipeline:
-    return pipeline([
-        # Fetch raw data from APIs
-        node(
-            func=init_api_client,
-            inputs="params:base_url",
-            outputs="client",
-            name="fetch_client_node"
-        ),
+    return create_api_client_pipeline() + pipeline([
         # Process and store reference data in SQLite
         node(
             func=process_players_data,
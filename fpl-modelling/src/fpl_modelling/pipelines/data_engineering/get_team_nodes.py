@@ -1,9 +1,7 @@
 from fpl_modelling.FPL_API import FPLClient
 import pandas as pd 
 
-def get_current_team(base_url: str, team_id: int, bearer: str):
-
-    client = FPLClient(base_url)
+def get_current_team(client: FPLClient, team_id: int, bearer: str):
 
     res = client.get_current_team(team_id, bearer)
 
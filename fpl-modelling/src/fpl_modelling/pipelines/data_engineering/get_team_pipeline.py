@@ -1,14 +1,15 @@
 
 from kedro.pipeline import Pipeline, node
 
+from .api_client_pipeline import create_api_client_pipeline
 from .get_team_nodes import get_current_team
 def create_get_team_pipeline(**kwargs):
-    return Pipeline(
+    return create_api_client_pipeline() + Pipeline(
         [
             node(
                 func=get_current_team,
                 inputs=dict(
-                    base_url="params:base_url",
+                    client="client",
                     bearer = "params:bearer",
                     team_id = "params:my_team_id"
                     ),
@@ -0,0 +1,68 @@
+import logging
+import typing as tp
+import pandas as pd
+from datetime import datetime, timezone
+from fpl_modelling.FPL_API import FPLClient
+from fpl_modelling.datasets import SQLUpsertDataset
+from .LiveGameweekTracker import LiveGameweekTracker
+
+logger = logging.getLogger(__name__)
+
+
+def squad_live_points(picks: pd.DataFrame, live: pd.DataFrame) -> int:
+    """Live points for a squad's picks, applying captain/bench multipliers."""
+
+    player_points = live.groupby('player_id')['total_points'].sum()
+    points = picks['element'].map(player_points).fillna(0) * picks['multiplier']
+
+    return int(points.sum())
+
+
+def stream_live_points(client: FPLClient, gameweek: int, database: tp.Dict, live_polling: tp.Dict) -> pd.DataFrame:
+    """
+    Follow a live gameweek from the single event-live endpoint. Every change updates the
+    in-round rows of players_hist and the live score of each tracked squad, without
+    refetching player histories. Returns the final live table.
+    """
+
+    con = {'con': f"sqlite:///{database['path']}"}
+    players_hist = SQLUpsertDataset(table_name='players_hist', credentials=con, key_columns=['player_id', 'fixture'])
+    squad_points_table = SQLUpsertDataset(table_name='live_squad_points', credentials=con, key_columns=['squad', 'round'])
+
+    tracked_squads = {
+        name: client.get_team_on_gameweek(entry_id, gameweek)['gameweek_team']
+        for name, entry_id in (live_polling.get('tracked_squads') or {}).items()
+    }
+
+    def update_players_hist(deltas: pd.DataFrame):
+        # Only the stats the live payload reported for a row; double-gameweek rows lack some
+        columns = ['total_points'] + LiveGameweekTracker.STAT_COLUMNS
+        updated = 0
+        for reported, rows in deltas.groupby(deltas[columns].notna().apply(tuple, axis=1)):
+            updated += players_hist.update(rows, [c for c, present in zip(columns, reported) if present])
+        logger.info("GW%s: updated %s players_hist rows, %+.0f points", gameweek, updated, deltas['points_delta'].sum())
+
+    def update_squads(deltas: pd.DataFrame):
+        if not tracked_squads:
+            return
+        squad_points = pd.DataFrame([
+            {
+                'squad': name,
+                'round': gameweek,
+                'points': squad_live_points(picks, tracker.live),
+                'updated_at': datetime.now(timezone.utc).isoformat(),
+            }
+            for name, picks in tracked_squads.items()
+        ])
+        squad_points_table.save(squad_points)
+
+    tracker = LiveGameweekTracker(
+        client,
+        gameweek,
+        sinks=[update_players_hist, update_squads],
+        live_interval=live_polling['live_interval'],
+        idle_interval=live_polling['idle_interval'],
+        max_polls=live_polling.get('max_polls'),
+    )
+
+    return tracker.run()
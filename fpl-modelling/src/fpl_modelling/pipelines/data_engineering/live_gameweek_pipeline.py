@@ -0,0 +1,22 @@
+from kedro.pipeline import Pipeline, node
+
+from .api_client_pipeline import create_api_client_pipeline
+from .live_gameweek_nodes import stream_live_points
+
+
+def create_live_gameweek_pipeline(**kwargs):
+    return create_api_client_pipeline() + Pipeline(
+        [
+            node(
+                func=stream_live_points,
+                inputs=dict(
+                    client="client",
+                    gameweek="params:gameweek",
+                    database="params:database",
+                    live_polling="params:live_polling"
+                    ),
+                outputs="players_live",
+                name="stream_live_points_node",
+            ),
+        ]
+    )
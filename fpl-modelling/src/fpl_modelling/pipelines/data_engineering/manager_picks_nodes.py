@@ -0,0 +1,24 @@
+import logging
+import typing as tp
+import pandas as pd
+from fpl_modelling.FPL_API import FPLClient
+from .ManagerPicksCrawler import ManagerPicksCrawler
+
+logger = logging.getLogger(__name__)
+
+
+def crawl_manager_picks(client: FPLClient, gameweek: int, manager_picks: tp.Dict) -> pd.DataFrame:
+    """
+    Crawl picks for the top entries of each configured league (resuming any earlier,
+    interrupted crawl) and return per-player effective ownership and captaincy rates.
+    """
+
+    entry_ids = []
+    for league_id in manager_picks['league_ids']:
+        entry_ids += client.get_league_entries(league_id, manager_picks['max_entries_per_league'])
+
+    crawler = ManagerPicksCrawler(client, manager_picks['path'], manager_picks['chunk_size'])
+    stored = crawler.crawl(gameweek, entry_ids)
+    logger.info("GW%s: stored picks for %s new entries", gameweek, stored)
+
+    return crawler.effective_ownership(gameweek)
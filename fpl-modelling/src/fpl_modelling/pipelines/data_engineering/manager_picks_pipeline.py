@@ -0,0 +1,21 @@
+from kedro.pipeline import Pipeline, node
+
+from .api_client_pipeline import create_api_client_pipeline
+from .manager_picks_nodes import crawl_manager_picks
+
+
+def create_manager_picks_pipeline(**kwargs):
+    return create_api_client_pipeline() + Pipeline(
+        [
+            node(
+                func=crawl_manager_picks,
+                inputs=dict(
+                    client="client",
+                    gameweek="params:gameweek",
+                    manager_picks="params:manager_picks"
+                    ),
+                outputs="effective_ownership",
+                name="crawl_manager_picks_node",
+            ),
+        ]
+    )
@@ -1,3 +1,6 @@
+import typing as tp
+
+import numpy as np
 import pandas as pd 
 
 class ExpandingDF:
@@ -26,10 +29,80 @@ class ExpandingDF:
                 f"Max available GW is {max_gw_in_data}."
             )
 
-    def expand_df(self):
+    def _future_sums(self, horizons: tp.List[int]) -> tp.Tuple[tp.Dict[int, np.ndarray], tp.Dict[int, np.ndarray]]:
+        """
+        For every row of arg_df, the player's sum of target_col over the next h rounds and
+        whether the player has any rows in that window, per horizon h.
+
+        Rows are collapsed to one value per (player_id, round) on a dense players x rounds
+        grid, then each horizon is a running sum over the next rounds, so the whole frame is
+        covered in one pass however many gameweeks it spans.
+        """
+        df = self.arg_df
+        player_codes, _ = pd.factorize(df['player_id'])
+        rounds = df['round'].to_numpy(dtype=np.int64)
+        first_round = rounds.min()
+        n_players, n_rounds = player_codes.max() + 1, rounds.max() - first_round + 1
+        max_horizon = max(horizons)
+
+        per_round = df[self.target_col].groupby([player_codes, rounds - first_round]).sum()
+        dtype = per_round.dtype  # same result dtype as the loop's groupby().sum()
+        codes, offsets = (per_round.index.get_level_values(i).to_numpy() for i in (0, 1))
+        totals = np.zeros((n_players, n_rounds + max_horizon + 1), dtype=dtype)
+        present = np.zeros(totals.shape, dtype=bool)
+        totals[codes, offsets] = per_round.to_numpy()
+        present[codes, offsets] = True
+
+        row_offsets = rounds - first_round
+        sums, has_rows = {}, {}
+        running = np.zeros(len(df), dtype=dtype)
+        seen = np.zeros(len(df), dtype=bool)
+        for h in range(1, max_horizon + 1):
+            running = running + totals[player_codes, row_offsets + h]
+            seen = seen | present[player_codes, row_offsets + h]
+            if h in horizons:
+                sums[h], has_rows[h] = running, seen
+
+        return sums, has_rows
+
+    def expand_df(self, horizons: tp.Optional[tp.List[int]] = None):
+        """
+        One training row per (player, gameweek) row up to current_gameweek, with the player's
+        target_col summed over the following gameweeks.
+
+        With no ``horizons`` the target covers the next num_games_to_predict gameweeks in a
+        ``target`` column, and players with no rows in that window are dropped, exactly as
+        expand_df_loop does. With ``horizons`` (e.g. [1, 3, 5]) there is a ``target_<h>``
+        column per horizon, NaN where the player has no rows in that window; rows are kept
+        if any horizon has data.
+
+        Rows come out in the same order as the loop: latest gameweek first, and in arg_df
+        order within a gameweek.
+        """
+        single = horizons is None
+        horizons = [self.num_games_to_predict] if single else sorted(set(horizons))
+        sums, has_rows = self._future_sums(horizons)
+
+        rounds = self.arg_df['round'].to_numpy()
+        keep = (rounds >= 1) & (rounds <= self.current_gameweek) & np.logical_or.reduce(list(has_rows.values()))
+        rows = np.flatnonzero(keep)
+        rows = rows[np.argsort(-rounds[rows], kind='stable')]
+
+        expanded_df = self.arg_df.iloc[rows].reset_index(drop=True)
+        if single:
+            expanded_df['target'] = sums[horizons[0]][rows]
+        else:
+            for h in horizons:
+                expanded_df[f'target_{h}'] = np.where(has_rows[h][rows], sums[h][rows], np.nan)
+
+        return expanded_df
+
+    def expand_df_loop(self):
 
         """
         Loop backwards from current gameweek setting target as total points equal to the num_test_gameweeks gameweeks after it
+
+        Original per-gameweek implementation, O(gameweeks x rows). Kept to check expand_df against.
         """
         Xs = []
 
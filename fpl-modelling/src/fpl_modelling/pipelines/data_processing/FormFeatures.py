@@ -0,0 +1,167 @@
+import re
+import typing as tp
+
+import numpy as np
+import pandas as pd
+
+
+class FormFeatures:
+    """
+    Player form features computed from each player's gameweeks up to and including the
+    current round, named so they can be listed straight in model_config feature lists:
+
+        <col>_last<k>_sum     sum of col over the player's last k gameweeks
+        <col>_last<k>_mean    mean of col over the player's last k gameweeks (missing values skipped)
+        <col>_ewm<span>       exponentially weighted mean of col, alpha = 2 / (span + 1)
+        <col>_per90_last<k>   col per 90 minutes over the last k gameweeks (0 with no minutes)
+        <col>_streak          consecutive gameweeks, ending at the current one, with col > 0
+
+    e.g. ``round_points_last3_mean``, ``ict_index_ewm5``, ``round_minutes_streak``.
+
+    players_hist_merged can hold several rows for one player and round: one per match in
+    a double gameweek, each repeated once per next-week fixture. A gameweek's value of col
+    is the sum over its distinct matches (rows that differ only in their ``next_week_*``
+    columns are the same match; ``fixture`` identifies matches when present), and every
+    row of the gameweek gets that gameweek's features. Rounds a player has no rows for
+    (blank gameweeks) are skipped rather than counted as zero.
+
+    The gameweeks are sorted by (player_id, round) once and every feature is computed on
+    the resulting contiguous per-player numpy arrays: window sums are k shifted adds, EWMs
+    step through the k-th gameweek of every player at once, streaks are an accumulated max.
+
+    Example usage:
+        form = FormFeatures(df)
+        df = form.add(["round_points_last3_mean", "ict_index_ewm5", "round_minutes_streak"])
+    """
+
+    PATTERN = re.compile(
+        r"^(?P<col>\w+?)_(?:last(?P<k>\d+)_(?P<agg>sum|mean)|ewm(?P<span>\d+)|per90_last(?P<k90>\d+)|(?P<streak>streak))$"
+    )
+
+    def __init__(self, df: pd.DataFrame, minutes_col: str = "round_minutes"):
+        self.df = df
+        self.minutes_col = minutes_col if minutes_col in df else "minutes"
+
+        # Gameweek of each row, and the rows that are a match's first appearance
+        gameweeks = pd.MultiIndex.from_arrays([df["player_id"].to_numpy(), df["round"].to_numpy()])
+        self.codes, uniques = pd.factorize(gameweeks)
+        self.distinct = ~df.duplicated(self.match_columns(df)).to_numpy()
+        self.gw_player_ids = uniques.get_level_values(0).to_numpy()
+        self.gw_rounds = uniques.get_level_values(1).to_numpy()
+
+        self.order = np.lexsort((self.gw_rounds, self.gw_player_ids))
+        player_ids = self.gw_player_ids[self.order]
+        n = len(player_ids)
+        starts = np.r_[True, player_ids[1:] != player_ids[:-1]] if n else np.zeros(0, dtype=bool)
+        # Index of each gameweek's first gameweek in the player's block, and its position within it
+        self.block_start = np.maximum.accumulate(np.where(starts, np.arange(n), 0))
+        self.position = np.arange(n) - self.block_start
+
+    @staticmethod
+    def match_columns(df: pd.DataFrame) -> tp.List[str]:
+        """Columns that identify one player's match: a row repeated for each next-week fixture shares them."""
+        if "fixture" in df:
+            return ["player_id", "fixture"]
+        return [c for c in df.columns if not c.startswith("next_week_")]
+
+    @classmethod
+    def parse(cls, name: str) -> tp.Optional[tp.Dict[str, tp.Any]]:
+        """Spec for a feature name, or None if it is not a form feature."""
+        match = cls.PATTERN.match(name)
+        if not match:
+            return None
+        spec = {k: v for k, v in match.groupdict().items() if v is not None}
+        for key in ("k", "span", "k90"):
+            if key in spec:
+                spec[key] = int(spec[key])
+        return spec
+
+    def gameweek_values(self, col: str) -> np.ndarray:
+        """col summed over each gameweek's distinct matches (NaN if all missing), in factorized gameweek order."""
+        values = self.df[col].to_numpy(dtype=np.float64, na_value=np.nan)[self.distinct]
+        codes = self.codes[self.distinct]
+        n = len(self.gw_player_ids)
+        present = ~np.isnan(values)
+        total = np.bincount(codes, weights=np.where(present, values, 0.0), minlength=n)
+        count = np.bincount(codes, weights=present.astype(np.float64), minlength=n)
+        return np.where(count > 0, total, np.nan)
+
+    def _values(self, col: str) -> np.ndarray:
+        return self.gameweek_values(col)[self.order]
+
+    def _window_sum(self, values: np.ndarray, k: int) -> np.ndarray:
+        """Sum of the last k gameweeks' values within each player's block, NaN counted as 0."""
+        filled = np.nan_to_num(values)
+        total = filled.copy()
+        for lag in range(1, k):
+            shifted = np.zeros_like(filled)
+            shifted[lag:] = filled[:-lag]
+            total += np.where(self.position >= lag, shifted, 0.0)
+        return total
+
+    def rolling(self, col: str, k: int, agg: str = "sum") -> np.ndarray:
+        values = self._values(col)
+        total = self._window_sum(values, k)
+        if agg == "sum":
+            return total
+        count = self._window_sum((~np.isnan(values)).astype(np.float64), k)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(count > 0, total / count, np.nan)
+
+    def ewm(self, col: str, span: int) -> np.ndarray:
+        """adjust=False EWM per player; missing values carry the previous level forward."""
+        values = self._values(col)
+        alpha = 2.0 / (span + 1)
+        out = np.empty_like(values)
+        rows_by_position = np.argsort(self.position, kind="stable")
+        bounds = np.searchsorted(self.position[rows_by_position], np.arange(self.position.max(initial=-1) + 2))
+
+        first = rows_by_position[bounds[0]:bounds[1]]
+        out[first] = values[first]
+        for p in range(1, len(bounds) - 1):
+            rows = rows_by_position[bounds[p]:bounds[p + 1]]
+            prev, x = out[rows - 1], values[rows]
+            level = np.where(np.isnan(prev), x, alpha * x + (1 - alpha) * prev)
+            out[rows] = np.where(np.isnan(x), prev, level)
+        return out
+
+    def per90(self, col: str, k: int) -> np.ndarray:
+        total = self._window_sum(self._values(col), k)
+        minutes = self._window_sum(self._values(self.minutes_col), k)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(minutes > 0, total / minutes * 90, 0.0)
+
+    def streak(self, col: str) -> np.ndarray:
+        values = self._values(col)
+        idx = np.arange(len(values))
+        # Last gameweek at or before each gameweek that broke the streak; block starts reset it
+        breaks = np.where(~(values > 0), idx, np.where(self.position == 0, idx - 1, -1))
+        return (idx - np.maximum.accumulate(breaks)).astype(np.int32)
+
+    def compute(self, name: str) -> np.ndarray:
+        """Feature values in the frame's original row order."""
+        spec = self.parse(name)
+        if spec is None:
+            raise ValueError(f"{name!r} is not a form feature name")
+        if spec["col"] not in self.df:
+            raise KeyError(f"Form feature {name!r} needs column {spec['col']!r}")
+
+        if "agg" in spec:
+            values = self.rolling(spec["col"], spec["k"], spec["agg"])
+        elif "span" in spec:
+            values = self.ewm(spec["col"], spec["span"])
+        elif "k90" in spec:
+            values = self.per90(spec["col"], spec["k90"])
+        else:
+            values = self.streak(spec["col"])
+
+        out = np.empty_like(values)
+        out[self.order] = values
+        return out[self.codes]
+
+    def add(self, names: tp.Iterable[str]) -> pd.DataFrame:
+        """Copy of the frame with each named feature added (existing columns are left alone)."""
+        new = {name: self.compute(name) for name in names if name not in self.df and self.parse(name)}
+        if not new:
+            return self.df
+        return self.df.assign(**new)
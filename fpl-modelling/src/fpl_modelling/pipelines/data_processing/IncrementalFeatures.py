@@ -0,0 +1,199 @@
+import json
+import shutil
+import typing as tp
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .FormFeatures import FormFeatures
+
+TARGET_COL = "next_week_round_points"
+
+
+class IncrementalFeatures:
+    """
+    Keeps FormFeatures-style features (and the next_week_round_points target) up to date
+    from per-player running state, so a weekly refresh touches one round of rows instead
+    of re-running window sums and shifts over the whole history.
+
+    State per player: rows seen (``seq``), the last few gameweek values of every windowed
+    column, EWM levels, streak counters, and the player's last row. ``update(rows)`` takes
+    rows for rounds after the state's round, steps the state once per player and round
+    (a double gameweek's matches summed, as in FormFeatures), gives every row of that
+    gameweek its features and returns them, plus each affected player's previous row with
+    its target back-filled from the new row. Upserting the result on (player_id, seq) gives the same table as
+    FormFeatures over the full history followed by ``groupby('player_id').shift(-1)``.
+
+    The latest round is never folded into the saved state: live points and bonus can
+    still move, so every update recomputes it from the state before it.
+
+    Rebuild (``reset()``, then update with the full history) after earlier rounds are
+    revised or the feature list changes.
+
+    The update_features pipeline writes the result to the players_features table, which
+    stands on its own: the training and prediction pipelines compute the same features
+    with FormFeatures through the feature cache instead.
+
+    Example usage:
+        features = IncrementalFeatures("data/04_feature/incremental_features",
+                                       ["round_points_last3_mean", "ict_index_ewm5"])
+        changed = features.update(players_hist_merged_recent)
+        features.save()
+    """
+
+    def __init__(self, path: str, features: tp.List[str], minutes_col: str = "round_minutes"):
+        self.path = Path(path)
+        self.features = [f for f in features if FormFeatures.parse(f)]
+        self.minutes_col = minutes_col
+
+        self.specs = {name: FormFeatures.parse(name) for name in self.features}
+        # Longest window each column needs (per90 also reads the minutes column)
+        self.windows: tp.Dict[str, int] = {}
+        for spec in self.specs.values():
+            k = spec.get("k", spec.get("k90"))
+            if k:
+                self.windows[spec["col"]] = max(self.windows.get(spec["col"], 0), k)
+            if "k90" in spec:
+                self.windows[minutes_col] = max(self.windows.get(minutes_col, 0), spec["k90"])
+        self.ewms = sorted({(s["col"], s["span"]) for s in self.specs.values() if "span" in s})
+        self.streaks = sorted({s["col"] for s in self.specs.values() if "streak" in s})
+
+        self.reset()
+        if (self.path / "meta.json").exists():
+            self._load()
+
+    def _empty_arrays(self, n: int) -> tp.Dict[str, np.ndarray]:
+        arrays = {"seq": np.zeros(n, dtype=np.int64)}
+        for col, k in self.windows.items():
+            arrays[f"window__{col}"] = np.full((n, k), np.nan)
+        for col, span in self.ewms:
+            arrays[f"ewm__{col}__{span}"] = np.full(n, np.nan)
+        for col in self.streaks:
+            arrays[f"streak__{col}"] = np.zeros(n, dtype=np.int64)
+        return arrays
+
+    def reset(self):
+        """Forget all state; the next update has to start from round 1."""
+        self.round = 0
+        self.player_ids = pd.Index([], dtype=np.int64)
+        self.arrays = self._empty_arrays(0)
+        self.last_rows = pd.DataFrame()
+
+    def _load(self):
+        meta = json.loads((self.path / "meta.json").read_text())
+        if meta["features"] != self.features or meta["minutes_col"] != self.minutes_col:
+            raise ValueError(
+                f"{self.path} was built for features {meta['features']}; delete it to rebuild for {self.features}"
+            )
+        self.round = meta["round"]
+        with np.load(self.path / "state.npz") as state:
+            self.player_ids = pd.Index(state["player_ids"])
+            self.arrays = {name: state[name] for name in self.arrays}
+        self.last_rows = pd.read_parquet(self.path / "last_rows.parquet")
+
+    def save(self):
+        """Write the state, replacing the previous one only once the new files are complete."""
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        shutil.rmtree(tmp, ignore_errors=True)
+        tmp.mkdir(parents=True)
+
+        np.savez(tmp / "state.npz", player_ids=self.player_ids.to_numpy(), **self.arrays)
+        self.last_rows.to_parquet(tmp / "last_rows.parquet", index=False)
+        (tmp / "meta.json").write_text(json.dumps(
+            {"round": self.round, "features": self.features, "minutes_col": self.minutes_col}
+        ))
+
+        shutil.rmtree(self.path, ignore_errors=True)
+        tmp.rename(self.path)
+
+    def _positions(self, player_ids: np.ndarray) -> np.ndarray:
+        """State rows for player_ids, adding any players not seen before."""
+        new = pd.Index(player_ids).difference(self.player_ids)
+        if len(new):
+            self.player_ids = self.player_ids.append(new) if len(self.player_ids) else new
+            grown = self._empty_arrays(len(new))
+            self.arrays = {name: np.concatenate([arr, grown[name]]) for name, arr in self.arrays.items()}
+        return self.player_ids.get_indexer(player_ids)
+
+    def _step(self, rows: pd.DataFrame) -> pd.DataFrame:
+        """Advance the state by one gameweek for each player in rows (all from one round)."""
+        form = FormFeatures(rows, self.minutes_col)
+        pos = self._positions(form.gw_player_ids)
+        arrays = self.arrays
+        for col in self.windows:
+            window = arrays[f"window__{col}"]
+            window[pos, 1:] = window[pos, :-1]
+            window[pos, 0] = form.gameweek_values(col)
+        for col, span in self.ewms:
+            alpha = 2.0 / (span + 1)
+            x = form.gameweek_values(col)
+            prev = arrays[f"ewm__{col}__{span}"][pos]
+            level = np.where(np.isnan(prev), x, alpha * x + (1 - alpha) * prev)
+            arrays[f"ewm__{col}__{span}"][pos] = np.where(np.isnan(x), prev, level)
+        for col in self.streaks:
+            x = form.gameweek_values(col)
+            arrays[f"streak__{col}"][pos] = np.where(x > 0, arrays[f"streak__{col}"][pos] + 1, 0)
+
+        # seq still numbers rows, so (player_id, seq) stays a key when a gameweek has several
+        seq = arrays["seq"][pos][form.codes] + rows.groupby("player_id").cumcount().to_numpy() + 1
+        arrays["seq"][pos] += np.bincount(form.codes, minlength=len(pos))
+
+        out = {}
+        with np.errstate(invalid="ignore", divide="ignore"):
+            for name, spec in self.specs.items():
+                col = spec["col"]
+                if "agg" in spec:
+                    window = arrays[f"window__{col}"][pos, :spec["k"]]
+                    total = np.nansum(window, axis=1)
+                    count = (~np.isnan(window)).sum(axis=1)
+                    out[name] = total if spec["agg"] == "sum" else np.where(count > 0, total / count, np.nan)
+                elif "span" in spec:
+                    out[name] = arrays[f"ewm__{col}__{spec['span']}"][pos].copy()
+                elif "k90" in spec:
+                    total = np.nansum(arrays[f"window__{col}"][pos, :spec["k90"]], axis=1)
+                    minutes = np.nansum(arrays[f"window__{self.minutes_col}"][pos, :spec["k90"]], axis=1)
+                    out[name] = np.where(minutes > 0, total / minutes * 90, 0.0)
+                else:
+                    out[name] = arrays[f"streak__{col}"][pos].astype(np.int32)
+        return rows.assign(seq=seq, **{name: values[form.codes] for name, values in out.items()})
+
+    def update(self, rows: pd.DataFrame) -> pd.DataFrame:
+        """
+        Features for rows in rounds after the state's round (earlier rows are ignored),
+        plus the back-filled previous row of every player with a new row. Leaves the state
+        just before the latest round in rows; call save() to keep it.
+        """
+        rows = rows[rows["round"] > self.round]
+        if rows.empty:
+            return pd.DataFrame()
+        if rows["round"].min() > self.round + 1:
+            raise ValueError(
+                f"Rows start at round {rows['round'].min()} but the feature state is at round {self.round}; "
+                "load more rounds or rebuild the state"
+            )
+
+        rows = rows.sort_values(["round", "player_id"], kind="stable")
+        latest_round = rows["round"].max()
+
+        parts = []
+        for round_, round_rows in rows.groupby("round", sort=True):
+            if round_ == latest_round:
+                snapshot = (self.player_ids, {name: arr.copy() for name, arr in self.arrays.items()})
+            parts.append(self._step(round_rows))
+        new = pd.concat(parts, ignore_index=True)
+
+        # Each row's target is the player's next row's points, whether that row is in this
+        # batch or the player's last row is in the state
+        previous = pd.concat([self.last_rows, new], ignore_index=True) if len(self.last_rows) else new
+        previous[TARGET_COL] = previous.groupby("player_id")["round_points"].shift(-1)
+        from_state = np.arange(len(previous)) < len(self.last_rows)
+        changed = previous[~from_state | previous["player_id"].isin(new["player_id"])]
+
+        # State as of just before the latest round, so the next update recomputes it
+        kept = previous[previous["round"] < latest_round]
+        self.last_rows = kept.groupby("player_id").tail(1).reset_index(drop=True)
+        self.player_ids, self.arrays = snapshot
+        self.round = int(latest_round) - 1
+
+        return changed.reset_index(drop=True)
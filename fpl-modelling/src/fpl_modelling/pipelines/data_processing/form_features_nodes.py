@@ -0,0 +1,66 @@
+import logging
+import typing as tp
+from pathlib import Path
+
+import pandas as pd
+
+from fpl_modelling.FeatureCache import FeatureCache
+from fpl_modelling.datasets import LazySource
+from fpl_modelling.dtype_registry import typed
+from .FormFeatures import FormFeatures
+
+logger = logging.getLogger(__name__)
+
+# Code that shapes players_hist_features; editing any of it invalidates cached frames
+_PACKAGE = Path(__file__).resolve().parents[2]
+FEATURE_CODE = [
+    Path(__file__),
+    _PACKAGE / "pipelines" / "data_processing" / "FormFeatures.py",
+    _PACKAGE / "dtype_registry.py",
+    _PACKAGE / "datasets" / "players_hist_merged_dataset.py",
+]
+
+
+def add_form_features(players_hist_merged: pd.DataFrame, model_config: tp.Dict, model_num: int) -> pd.DataFrame:
+    """
+    Add the form features (see FormFeatures) named in the model's feature lists that are
+    not already columns of players_hist_merged.
+    """
+
+    features = model_config[model_num]['features']
+    names = [f for f in features['num_features'] + features['cat_features'] if FormFeatures.parse(f)]
+
+    return FormFeatures(players_hist_merged).add(names)
+
+
+def form_features_key(players_hist_source: LazySource, model_config: tp.Dict, model_num: int) -> str:
+    """FeatureCache key of players_hist_features: the source data's version, the model's feature and threshold settings and FEATURE_CODE."""
+
+    config = model_config[model_num]
+    settings = {'features': config['features'], 'minute_threshold': config.get('minute_threshold')}
+    return FeatureCache.key(data=players_hist_source.version, settings=settings,
+                            code=FeatureCache.file_digest(FEATURE_CODE))
+
+
+def cached_form_features(players_hist_source: LazySource, model_config: tp.Dict, model_num: int,
+                         feature_cache: tp.Dict) -> pd.DataFrame:
+    """
+    add_form_features through the FeatureCache (see form_features_key), so training and
+    prediction for the same data share one build and a hit never touches the database.
+    """
+
+    def build() -> pd.DataFrame:
+        return add_form_features(typed(players_hist_source.load(), 'players_hist_merged'), model_config, model_num)
+
+    if players_hist_source.version is None:
+        return build()
+
+    cache = FeatureCache(**feature_cache)
+    try:
+        key = form_features_key(players_hist_source, model_config, model_num)
+        features = cache.get_or_put(key, build)
+        logger.info("players_hist_features cache %s (key %s)", "hit" if cache.hits else "miss", key[:12])
+    finally:
+        cache.close()
+
+    return features
@@ -0,0 +1,25 @@
+from kedro.pipeline import Pipeline, node, pipeline
+from .form_features_nodes import cached_form_features
+from .model_config_pipeline import create_model_config_pipeline
+
+
+def create_form_features_pipeline(**kwargs) -> Pipeline:
+    """
+    Node producing ``players_hist_features``: players_hist_merged plus the model's form
+    features. Training and prediction both include it, so they see the same columns,
+    and it goes through the feature cache so a run that follows another on the same data
+    skips the load and the feature build.
+    """
+    return create_model_config_pipeline() + pipeline([
+        node(
+            func=cached_form_features,
+            inputs=dict(
+                players_hist_source="players_hist_source",
+                model_config="merged_model_config",
+                model_num="params:model_num",
+                feature_cache="params:feature_cache"
+            ),
+            outputs="players_hist_features",
+            name="add_form_features_node"
+        ),
+    ])
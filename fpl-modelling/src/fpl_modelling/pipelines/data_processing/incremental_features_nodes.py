@@ -0,0 +1,44 @@
+import logging
+import shutil
+import typing as tp
+from pathlib import Path
+
+import pandas as pd
+
+from .IncrementalFeatures import IncrementalFeatures
+
+logger = logging.getLogger(__name__)
+
+
+def _state_path(incremental_features: tp.Dict, model_num: int) -> Path:
+    """One state directory per model, since each model_config entry has its own feature list."""
+    return Path(incremental_features['path']) / f"model_{model_num}"
+
+
+def _incremental_features(model_config: tp.Dict, model_num: int, incremental_features: tp.Dict) -> IncrementalFeatures:
+    features = model_config[model_num]['features']
+    return IncrementalFeatures(str(_state_path(incremental_features, model_num)),
+                               features['num_features'] + features['cat_features'])
+
+
+def update_features(players_hist_merged_recent: pd.DataFrame, model_config: tp.Dict, model_num: int,
+                    incremental_features: tp.Dict) -> pd.DataFrame:
+    """
+    Features for rounds ingested since the last run, plus the previous rows whose
+    next_week_round_points they fill in. Returns the rows to upsert into players_features.
+    """
+
+    state = _incremental_features(model_config, model_num, incremental_features)
+    changed = state.update(players_hist_merged_recent)
+    state.save()
+
+    logger.info("Feature rows written: %d (state now at round %d)", len(changed), state.round)
+    return changed
+
+
+def rebuild_features(players_hist_merged: pd.DataFrame, model_config: tp.Dict, model_num: int,
+                     incremental_features: tp.Dict) -> pd.DataFrame:
+    """update_features from empty state over the full history, e.g. after the feature list changes."""
+
+    shutil.rmtree(_state_path(incremental_features, model_num), ignore_errors=True)
+    return update_features(players_hist_merged, model_config, model_num, incremental_features)
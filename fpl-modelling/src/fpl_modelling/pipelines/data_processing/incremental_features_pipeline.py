@@ -0,0 +1,35 @@
+from kedro.pipeline import Pipeline, node, pipeline
+from .incremental_features_nodes import update_features, rebuild_features
+from .model_config_pipeline import create_model_config_pipeline
+
+
+def create_update_features_pipeline(**kwargs) -> Pipeline:
+    return create_model_config_pipeline() + pipeline([
+        node(
+            func=update_features,
+            inputs=dict(
+                players_hist_merged_recent="players_hist_merged_recent",
+                model_config="merged_model_config",
+                model_num="params:model_num",
+                incremental_features="params:incremental_features"
+            ),
+            outputs="players_features",
+            name="update_features_node"
+        ),
+    ])
+
+
+def create_rebuild_features_pipeline(**kwargs) -> Pipeline:
+    return create_model_config_pipeline() + pipeline([
+        node(
+            func=rebuild_features,
+            inputs=dict(
+                players_hist_merged="players_hist_merged",
+                model_config="merged_model_config",
+                model_num="params:model_num",
+                incremental_features="params:incremental_features"
+            ),
+            outputs="players_features",
+            name="rebuild_features_node"
+        ),
+    ])
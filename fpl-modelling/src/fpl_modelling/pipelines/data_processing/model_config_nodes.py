@@ -0,0 +1,10 @@
+import typing as tp
+
+
+def merge_tuned_model_config(model_config: tp.Dict, tuned_model_config: tp.Dict) -> tp.Dict:
+    """
+    model_config with the hyperparameter search's tuned entries (tuned_model_config, keyed
+    by model_num) added, a tuned entry replacing a configured one with the same model_num.
+    """
+
+    return {**model_config, **(tuned_model_config or {})}
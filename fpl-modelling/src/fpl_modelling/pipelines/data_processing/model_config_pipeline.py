@@ -0,0 +1,21 @@
+from kedro.pipeline import Pipeline, node, pipeline
+from .model_config_nodes import merge_tuned_model_config
+
+
+def create_model_config_pipeline(**kwargs) -> Pipeline:
+    """
+    Node producing ``merged_model_config``: params:model_config plus the entries the
+    hyperparameter search wrote to tuned_model_config. Every pipeline that looks up
+    model_config[model_num] reads it, so a tuned model_num can be trained and predicted with.
+    """
+    return pipeline([
+        node(
+            func=merge_tuned_model_config,
+            inputs=dict(
+                model_config="params:model_config",
+                tuned_model_config="tuned_model_config"
+            ),
+            outputs="merged_model_config",
+            name="merge_tuned_model_config_node"
+        ),
+    ])
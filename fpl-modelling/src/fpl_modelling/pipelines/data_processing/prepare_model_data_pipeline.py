@@ -1,14 +1,15 @@
 from kedro.pipeline import Pipeline, node, pipeline
 from .prepare_model_data_nodes import init_transformations
+from .model_config_pipeline import create_model_config_pipeline
 
 
 def create_prepare_model_data_pipeline(**kwargs) -> Pipeline:
-    return pipeline([
+    return create_model_config_pipeline() + pipeline([
         node(
             func=init_transformations,
             inputs = dict(
                 players_hist_merged_orig = "players_hist_merged",
-                model_config = "params:model_config",
+                model_config = "merged_model_config",
                 model_num = "params:model_num"
             ),
             outputs="expanded_df",
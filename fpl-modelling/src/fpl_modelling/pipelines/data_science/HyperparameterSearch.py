@@ -0,0 +1,132 @@
+import copy
+import logging
+import math
+import typing as tp
+
+import numpy as np
+import pandas as pd
+
+from .WalkForwardBacktest import WalkForwardBacktest
+
+logger = logging.getLogger(__name__)
+
+
+class HyperparameterSearch:
+    """
+    Random search over a model_config entry's ``search_space``, pruned by successive
+    halving on walk-forward folds.
+
+    The search space sits next to the entry's model settings and names model
+    hyperparameters:
+
+        search_space:
+          max_depth: {type: int, low: 3, high: 8}
+          learning_rate: {type: float, low: 0.005, high: 0.3, log: true}
+          booster: {type: choice, values: [gbtree, dart]}
+
+    Trial 0 is the entry's current hyperparameters, so the incumbent competes on the
+    same folds as the samples. Every trial is scored on a few folds spread over the
+    season (pooled walk-forward ``metric``), the best 1/eta go on to eta times as many
+    folds, and so on until the survivors have seen every fold. The fold sets are nested,
+    so a rung only fits the folds the previous one did not. Each rung's folds run in
+    parallel through WalkForwardBacktest.
+
+    Example usage:
+        search = HyperparameterSearch(players_hist_features, model_config[4], n_trials=27)
+        trials = search.run()
+        search.best_config()
+    """
+
+    def __init__(self, df: pd.DataFrame, config: tp.Dict, n_trials: int = 27, eta: int = 3, min_folds: int = 2,
+                 metric: str = 'mae', seed: int = 42, min_train_rounds: int = 5,
+                 first_gameweek: tp.Optional[int] = None, last_gameweek: tp.Optional[int] = None,
+                 n_jobs: tp.Optional[int] = None):
+        if not config.get('search_space'):
+            raise ValueError("The model_config entry has no search_space")
+        self.config = config
+        self.space = config['search_space']
+        self.n_trials = n_trials
+        self.eta = eta
+        self.min_folds = min_folds
+        self.metric = metric
+        self.rng = np.random.default_rng(seed)
+
+        self.trials = [self._params(config)] + [self.sample() for _ in range(n_trials - 1)]
+        self.backtest = WalkForwardBacktest(df, {i: self.trial_config(i) for i in range(len(self.trials))},
+                                            min_train_rounds=min_train_rounds, n_jobs=n_jobs)
+        self.gameweeks = self.backtest.folds(first_gameweek, last_gameweek)
+        self.results: tp.Optional[pd.DataFrame] = None
+
+    @staticmethod
+    def _params(config: tp.Dict) -> tp.Dict[str, tp.Any]:
+        return dict(config['model'].get('hyperparams', {}))
+
+    def sample(self) -> tp.Dict[str, tp.Any]:
+        """Hyperparameters drawn from the search space, on top of the entry's own."""
+        params = self._params(self.config)
+        for name, spec in self.space.items():
+            if spec['type'] == 'int':
+                params[name] = int(self.rng.integers(spec['low'], spec['high'] + 1))
+            elif spec['type'] == 'float' and spec.get('log'):
+                params[name] = float(math.exp(self.rng.uniform(math.log(spec['low']), math.log(spec['high']))))
+            elif spec['type'] == 'float':
+                params[name] = float(self.rng.uniform(spec['low'], spec['high']))
+            elif spec['type'] == 'choice':
+                params[name] = spec['values'][int(self.rng.integers(len(spec['values'])))]
+            else:
+                raise ValueError(f"Unknown search space type {spec['type']!r} for {name}")
+        return params
+
+    def trial_config(self, trial: int) -> tp.Dict:
+        config = copy.deepcopy(self.config)
+        config.pop('search_space')
+        config['model']['hyperparams'] = self.trials[trial]
+        return config
+
+    def rungs(self) -> tp.List[tp.List[int]]:
+        """Nested fold sets: every eta**k-th gameweek, from the sparsest with min_folds down to all."""
+        n = len(self.gameweeks)
+        k = 0
+        while math.ceil(n / self.eta ** (k + 1)) >= self.min_folds:
+            k += 1
+        return [self.gameweeks[::self.eta ** step] for step in range(k, -1, -1)]
+
+    def _rank(self, folds: pd.DataFrame) -> pd.DataFrame:
+        summary = WalkForwardBacktest.summarise(folds)
+        ascending = self.metric != 'spearman'
+        return summary.sort_values(self.metric, ascending=ascending, ignore_index=True)
+
+    def run(self) -> pd.DataFrame:
+        """Run the search; one row per trial with its hyperparameters, last rung and score there."""
+        alive = list(range(len(self.trials)))
+        done: tp.List[int] = []
+        folds = []
+        reached = {}
+
+        for rung, gameweeks in enumerate(self.rungs()):
+            new = [g for g in gameweeks if g not in done]
+            folds.append(self.backtest.run_folds(alive, new))
+            done += new
+
+            seen = pd.concat(folds, ignore_index=True)
+            ranked = self._rank(seen[seen['model_num'].isin(alive)])
+            for row in ranked.itertuples(index=False):
+                reached[row.model_num] = {'rung': rung, 'folds': len(gameweeks), self.metric: getattr(row, self.metric)}
+            logger.info("Rung %s: %s trials on %s folds, best %s %.4f (trial %s)", rung, len(alive), len(gameweeks),
+                        self.metric, ranked[self.metric].iloc[0], ranked['model_num'].iloc[0])
+
+            if len(alive) == 1 or len(gameweeks) == len(self.gameweeks):
+                break
+            alive = ranked['model_num'].head(max(1, math.ceil(len(alive) / self.eta))).tolist()
+
+        self.results = pd.DataFrame([
+            {'trial': trial, **reached[trial], **{f'param_{k}': v for k, v in self.trials[trial].items() if k in self.space}}
+            for trial in reached
+        ]).sort_values(['rung', self.metric], ascending=[False, self.metric != 'spearman'], ignore_index=True)
+        return self.results
+
+    def best_config(self, **extra: tp.Any) -> tp.Dict:
+        """The winning trial's model_config entry, without the search space, plus any extra keys."""
+        if self.results is None:
+            raise RuntimeError("Call run() first")
+        return {**self.trial_config(int(self.results['trial'].iloc[0])), **extra}
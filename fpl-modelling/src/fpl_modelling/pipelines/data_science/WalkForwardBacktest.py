@@ -0,0 +1,206 @@
+import logging
+import os
+import time
+import typing as tp
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .ModelPipelineBuilder import ModelPipelineBuilder
+from .WarmStartTrainer import WarmStartTrainer
+
+logger = logging.getLogger(__name__)
+
+# Set in each worker by _init_worker; with fork the frame is inherited, not copied
+_SHARED: tp.Dict[str, tp.Any] = {}
+
+
+def _init_worker(df: pd.DataFrame, model_config: tp.Dict, target_col: str, threads: int):
+    _SHARED.update(df=df, model_config=model_config, target_col=target_col, threads=threads)
+
+
+def _features(config: tp.Dict) -> tp.List[str]:
+    return config['features']['num_features'] + config['features']['cat_features']
+
+
+def fold_metrics(y_true: np.ndarray, y_pred: np.ndarray) -> tp.Dict[str, float]:
+    """Error and rank-correlation metrics for one fold's predictions."""
+    err = y_pred - y_true
+    # Spearman as the Pearson correlation of ranks (ties averaged)
+    ranks_true = pd.Series(y_true).rank().to_numpy()
+    ranks_pred = pd.Series(y_pred).rank().to_numpy()
+    if len(y_true) > 1 and ranks_true.std() > 0 and ranks_pred.std() > 0:
+        spearman = float(np.corrcoef(ranks_true, ranks_pred)[0, 1])
+    else:
+        spearman = np.nan
+    return {
+        'mae': float(np.abs(err).mean()),
+        'rmse': float(np.sqrt((err ** 2).mean())),
+        'bias': float(err.mean()),
+        'spearman': spearman,
+    }
+
+
+def _split(config: tp.Dict, gameweek: int) -> tp.Tuple[pd.DataFrame, pd.DataFrame]:
+    """Rows with targets known before gameweek, and the rows that predict it."""
+    df, target_col = _SHARED['df'], _SHARED['target_col']
+    rows = (df['cumsum_minutes'] > config['minute_threshold']) & df[target_col].notna()
+    return df[rows & (df['round'] < gameweek - 1)], df[rows & (df['round'] == gameweek - 1)]
+
+
+def _pipeline(config: tp.Dict):
+    pipeline = ModelPipelineBuilder(config).build_pipeline()
+    model = pipeline.named_steps['model']
+    if 'n_jobs' in model.get_params():
+        model.set_params(n_jobs=_SHARED['threads'])
+    return pipeline
+
+
+def _score(pipeline, test: pd.DataFrame, features: tp.List[str]) -> tp.Dict[str, float]:
+    y_pred = np.asarray(pipeline.predict(test[features]), dtype=np.float64)
+    y_true = test[_SHARED['target_col']].to_numpy(dtype=np.float64)
+    return {
+        **fold_metrics(y_true, y_pred),
+        # For pooled metrics across folds
+        'abs_error_sum': float(np.abs(y_pred - y_true).sum()),
+        'sq_error_sum': float(((y_pred - y_true) ** 2).sum()),
+    }
+
+
+def _run_fold(model_num: int, gameweek: int) -> tp.List[tp.Dict[str, tp.Any]]:
+    """Fit model_num from scratch on rows known before gameweek and score the rows that predict it."""
+    config = _SHARED['model_config'][model_num]
+    features = _features(config)
+    train, test = _split(config, gameweek)
+
+    pipeline = _pipeline(config)
+    start = time.perf_counter()
+    pipeline.fit(train[features], train[_SHARED['target_col']])
+    fit_seconds = time.perf_counter() - start
+
+    return [{
+        'model_num': model_num, 'training': 'full', 'gameweek': gameweek, 'fit_mode': 'full',
+        'n_train': len(train), 'n_test': len(test), 'fit_seconds': fit_seconds, **_score(pipeline, test, features),
+    }]
+
+
+def _run_warm_chain(model_num: int, gameweeks: tp.List[int], warm_start: tp.Dict) -> tp.List[tp.Dict[str, tp.Any]]:
+    """model_num trained week after week with WarmStartTrainer; the folds run in order, so one task."""
+    config = _SHARED['model_config'][model_num]
+    features = _features(config)
+    trainer = WarmStartTrainer(refit_every=warm_start['refit_every'], extra_estimators=warm_start['extra_estimators'],
+                               recent_rounds=warm_start['recent_rounds'], target_col=_SHARED['target_col'])
+
+    results = []
+    for gameweek in gameweeks:
+        train, test = _split(config, gameweek)
+        start = time.perf_counter()
+        mode = trainer.fit(_pipeline(config), train, features, gameweek)
+        fit_seconds = time.perf_counter() - start
+        results.append({
+            'model_num': model_num, 'training': 'warm_start', 'gameweek': gameweek, 'fit_mode': mode,
+            'n_train': len(train), 'n_test': len(test), 'fit_seconds': fit_seconds,
+            **_score(trainer.pipeline, test, features),
+        })
+    return results
+
+
+def _run_task(task: tp.Tuple) -> tp.List[tp.Dict[str, tp.Any]]:
+    return _run_warm_chain(*task[1:]) if task[0] == 'warm_chain' else _run_fold(*task[1:])
+
+
+class WalkForwardBacktest:
+    """
+    Walk-forward evaluation of model_config entries without MLflow: for each fold gameweek
+    g, the model is fitted on the rows whose targets were known before g (round < g - 1)
+    and scored on round g - 1, the rows points_prediction uses to predict g.
+
+    Folds for every (model_num, gameweek) pair run in a process pool. The feature matrix
+    (the union of every model's features, the target, round and cumsum_minutes) is built
+    once and handed to the workers when they start, so with fork they read the parent's
+    copy instead of each unpickling their own; tasks are just (model_num, gameweek).
+    With warm_start settings each model also gets one task training it gameweek after
+    gameweek with WarmStartTrainer, reported under training="warm_start" next to the
+    full refits ("full").
+
+    Example usage:
+        backtest = WalkForwardBacktest(players_hist_features, model_config)
+        folds, summary = backtest.run([4, 5])
+    """
+
+    def __init__(self, df: pd.DataFrame, model_config: tp.Dict, target_col: str = 'next_week_round_points',
+                 min_train_rounds: int = 5, n_jobs: tp.Optional[int] = None):
+        self.df = df
+        self.model_config = model_config
+        self.target_col = target_col
+        self.min_train_rounds = min_train_rounds
+        self.n_jobs = n_jobs or os.cpu_count() or 1
+
+    def folds(self, first_gameweek: tp.Optional[int] = None, last_gameweek: tp.Optional[int] = None) -> tp.List[int]:
+        """Fold gameweeks: each needs min_train_rounds of training rows and played target points."""
+        rounds = self.df['round']
+        first = max(first_gameweek or 0, int(rounds.min()) + self.min_train_rounds + 1)
+        last = min(last_gameweek or np.iinfo(np.int64).max, int(rounds.max()))
+        return list(range(first, last + 1))
+
+    def matrix(self, model_nums: tp.Sequence[int]) -> pd.DataFrame:
+        """The columns every fold of model_nums reads, in one frame."""
+        columns = ['round', 'cumsum_minutes', self.target_col]
+        for model_num in model_nums:
+            columns += [f for f in _features(self.model_config[model_num]) if f not in columns]
+        return self.df[columns].reset_index(drop=True)
+
+    def run_folds(self, model_nums: tp.Sequence[int], gameweeks: tp.Sequence[int],
+                  warm_start: tp.Optional[tp.Dict] = None) -> pd.DataFrame:
+        """One row per fold of model_nums on gameweeks, with the error sums summarise pools."""
+        tasks = [('fold', m, g) for m in model_nums for g in gameweeks]
+        if warm_start and gameweeks:
+            # Chains are the longest tasks; submit them first
+            tasks = [('warm_chain', m, list(gameweeks), warm_start) for m in model_nums] + tasks
+        if not tasks:
+            raise ValueError(f"No folds to run: data covers rounds {self.df['round'].min()}-{self.df['round'].max()}")
+
+        workers = min(self.n_jobs, len(tasks))
+        threads = max(1, (os.cpu_count() or 1) // workers)
+        args = (self.matrix(model_nums), self.model_config, self.target_col, threads)
+        logger.info("Backtesting models %s on %s gameweeks %s-%s (%s tasks, %s workers)",
+                    list(model_nums), len(gameweeks), min(gameweeks), max(gameweeks), len(tasks), workers)
+
+        if workers == 1:
+            _init_worker(*args)
+            results = [_run_task(task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=args) as pool:
+                results = list(pool.map(_run_task, tasks))
+
+        folds = pd.DataFrame([fold for result in results for fold in result])
+        return folds.sort_values(['model_num', 'training', 'gameweek'], ignore_index=True)
+
+    def run(self, model_nums: tp.Sequence[int], first_gameweek: tp.Optional[int] = None,
+            last_gameweek: tp.Optional[int] = None,
+            warm_start: tp.Optional[tp.Dict] = None) -> tp.Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Per-fold metrics and a per-model summary, best (lowest pooled MAE) first. With
+        warm_start settings, each model is also trained week by week as train_model does
+        with warm starts, so the two can be compared on the same folds.
+        """
+        folds = self.run_folds(model_nums, self.folds(first_gameweek, last_gameweek), warm_start)
+        return folds.drop(columns=['abs_error_sum', 'sq_error_sum']), self.summarise(folds)
+
+    @staticmethod
+    def summarise(folds: pd.DataFrame) -> pd.DataFrame:
+        """Pooled MAE/RMSE over every scored row, and the mean and spread of per-fold rank correlation."""
+        grouped = folds.groupby(['model_num', 'training'])
+        n_test = grouped['n_test'].sum()
+        summary = pd.DataFrame({
+            'folds': grouped.size(),
+            'n_test': n_test,
+            'mae': grouped['abs_error_sum'].sum() / n_test,
+            'rmse': np.sqrt(grouped['sq_error_sum'].sum() / n_test),
+            'mean_fold_mae': grouped['mae'].mean(),
+            'spearman': grouped['spearman'].mean(),
+            'spearman_std': grouped['spearman'].std(),
+            'fit_seconds': grouped['fit_seconds'].sum(),
+        })
+        return summary.sort_values('mae').reset_index()
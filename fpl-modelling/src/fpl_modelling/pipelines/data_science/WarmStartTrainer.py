@@ -0,0 +1,119 @@
+import json
+import logging
+import shutil
+import typing as tp
+from pathlib import Path
+
+import joblib
+import pandas as pd
+from sklearn.pipeline import Pipeline
+
+logger = logging.getLogger(__name__)
+
+
+class WarmStartTrainer:
+    """
+    Trains a model pipeline week by week, continuing the previous gameweek's booster
+    instead of refitting from scratch.
+
+    On a warm week the fitted preprocessor is kept and ``extra_estimators`` trees are
+    added to the previous booster, fitted on the last ``recent_rounds`` rounds of training
+    rows (the new round plus a little context). A full refit runs instead when:
+        - there is no previous model, or it is not from an earlier gameweek
+        - the model config changed (config_key differs)
+        - refit_every gameweeks have passed since the last full refit
+        - the model is not an XGBoost-style booster (no get_booster)
+        - the new rows hold categories the fitted preprocessor has not seen
+
+    ``save``/``load`` keep the fitted pipeline and its bookkeeping in a directory, so the
+    weekly train_model run picks up where last week's left off.
+
+    Example usage:
+        trainer = WarmStartTrainer.load("data/06_models/warm_start/model_4", refit_every=4)
+        mode = trainer.fit(pipeline, train_df, features, predicting_gameweek, config_key)
+        trainer.save("data/06_models/warm_start/model_4")
+        trainer.pipeline.predict(...)
+    """
+
+    def __init__(self, refit_every: int = 4, extra_estimators: int = 60, recent_rounds: int = 3,
+                 target_col: str = 'next_week_round_points'):
+        self.refit_every = refit_every
+        self.extra_estimators = extra_estimators
+        self.recent_rounds = recent_rounds
+        self.target_col = target_col
+
+        self.pipeline: tp.Optional[Pipeline] = None
+        self.config_key: tp.Optional[str] = None
+        self.gameweek = 0
+        self.last_refit = 0
+
+    def _can_warm_start(self, gameweek: int, config_key: tp.Optional[str]) -> bool:
+        return (
+            self.pipeline is not None
+            and self.config_key == config_key
+            and self.gameweek < gameweek
+            and gameweek - self.last_refit < self.refit_every
+            and hasattr(self.pipeline.named_steps['model'], 'get_booster')
+        )
+
+    def _continue(self, train_df: pd.DataFrame, features: tp.List[str]):
+        """Add extra_estimators trees to the fitted booster, fitted on the recent rows."""
+        recent = train_df[train_df['round'] > train_df['round'].max() - self.recent_rounds]
+        X = recent[features]
+        if len(self.pipeline) > 1:
+            X = self.pipeline[:-1].transform(X)
+
+        model = self.pipeline.named_steps['model']
+        model.set_params(n_estimators=self.extra_estimators)
+        model.fit(X, recent[self.target_col], xgb_model=model.get_booster())
+
+    def fit(self, pipeline: Pipeline, train_df: pd.DataFrame, features: tp.List[str], gameweek: int,
+            config_key: tp.Optional[str] = None) -> str:
+        """
+        Train for gameweek and return the mode used, "warm" or "full". pipeline is the
+        unfitted pipeline used for a full refit; the trained one is self.pipeline.
+        """
+        mode = 'full'
+        if self._can_warm_start(gameweek, config_key):
+            try:
+                self._continue(train_df, features)
+                mode = 'warm'
+            except ValueError as e:  # e.g. OneHotEncoder meeting a new category
+                logger.warning("Warm start for gameweek %s failed (%s); refitting", gameweek, e)
+
+        if mode == 'full':
+            pipeline.fit(train_df[features], train_df[self.target_col])
+            self.pipeline = pipeline
+            self.last_refit = gameweek
+
+        self.gameweek = gameweek
+        self.config_key = config_key
+        return mode
+
+    def save(self, path: tp.Union[str, Path]):
+        """Write the state, replacing the previous one only once the new files are complete."""
+        path = Path(path)
+        tmp = path.with_name(path.name + ".tmp")
+        shutil.rmtree(tmp, ignore_errors=True)
+        tmp.mkdir(parents=True)
+
+        joblib.dump(self.pipeline, tmp / "pipeline.joblib")
+        (tmp / "meta.json").write_text(json.dumps(
+            {"gameweek": self.gameweek, "last_refit": self.last_refit, "config_key": self.config_key}
+        ))
+
+        shutil.rmtree(path, ignore_errors=True)
+        tmp.rename(path)
+
+    @classmethod
+    def load(cls, path: tp.Union[str, Path], **kwargs) -> "WarmStartTrainer":
+        """Trainer with the state saved at path, or a fresh one if there is none."""
+        trainer = cls(**kwargs)
+        path = Path(path)
+        if (path / "meta.json").exists():
+            meta = json.loads((path / "meta.json").read_text())
+            trainer.pipeline = joblib.load(path / "pipeline.joblib")
+            trainer.gameweek = meta["gameweek"]
+            trainer.last_refit = meta["last_refit"]
+            trainer.config_key = meta["config_key"]
+        return trainer
@@ -1,5 +1,16 @@
+import logging
 import pandas as pd
 import typing as tp 
+from pathlib import Path
+
+from fpl_modelling.FeatureCache import FeatureCache
+from fpl_modelling.datasets import LazySource
+from fpl_modelling.pipelines.data_processing.form_features_nodes import cached_form_features, form_features_key
+
+logger = logging.getLogger(__name__)
+
+# Code that shapes df_processed on top of players_hist_features
+PREPROCESS_CODE = [Path(__file__)]
 
 def preprocess_data(df: pd.DataFrame, model_config: tp.Dict, model_num: int):
     """
@@ -12,4 +23,31 @@ def preprocess_data(df: pd.DataFrame, model_config: tp.Dict, model_num: int):
     minute_threshold = model_config[model_num]['minute_threshold']
     players_hist_merged_clean = df[df['cumsum_minutes']>minute_threshold]    
 
-    return players_hist_merged_clean
\ No newline at end of file
+    return players_hist_merged_clean
+
+
+def cached_preprocess_data(players_hist_source: LazySource, model_config: tp.Dict, model_num: int,
+                           feature_cache: tp.Dict) -> pd.DataFrame:
+    """
+    preprocess_data on players_hist_features through the FeatureCache, keyed on the form
+    features' key and PREPROCESS_CODE, so retraining on unchanged data skips the target
+    shift and threshold filter as well as the feature build.
+    """
+
+    def build() -> pd.DataFrame:
+        features = cached_form_features(players_hist_source, model_config, model_num, feature_cache)
+        return preprocess_data(features, model_config, model_num)
+
+    if players_hist_source.version is None:
+        return build()
+
+    cache = FeatureCache(**feature_cache)
+    try:
+        key = FeatureCache.key(features=form_features_key(players_hist_source, model_config, model_num),
+                               code=FeatureCache.file_digest(PREPROCESS_CODE))
+        df = cache.get_or_put(key, build)
+        logger.info("df_processed cache %s (key %s)", "hit" if cache.hits else "miss", key[:12])
+    finally:
+        cache.close()
+
+    return df
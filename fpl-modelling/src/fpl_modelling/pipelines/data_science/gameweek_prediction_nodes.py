@@ -1,15 +1,22 @@
+import logging
+import numpy as np
 import pandas as pd 
 import sklearn 
 import typing as tp  
-import mlflow 
+from fpl_modelling.ModelStore import ModelStore
+from fpl_modelling.PlayerRoundTensor import PlayerRoundTensor
 
-def points_prediction(df: pd.DataFrame, model_config: tp.Dict, model_num: int, mlflow_tracking_uri: str, predicting_gameweek: int):
+logger = logging.getLogger(__name__)
+
+def points_prediction(df: pd.DataFrame, model_config: tp.Dict, model_num: int, mlflow_tracking_uri: str, predicting_gameweek: int,
+                      model_store: tp.Optional[tp.Dict] = None):
     """
-    Predict expected points for all players in the specified gameweek
+    Predict expected points for all players in the specified gameweek. The model comes
+    from the local ModelStore; the registry is only asked for the latest version.
     """
 
-    mlflow.set_tracking_uri(mlflow_tracking_uri)
-    trained_pipeline= mlflow.sklearn.load_model(f"models:/model_gameweek_{predicting_gameweek}/latest")
+    store = ModelStore.shared(tracking_uri=mlflow_tracking_uri, **(model_store or {}))
+    trained_pipeline = store.load(f"model_gameweek_{predicting_gameweek}")
 
     features = model_config[model_num]['features']['num_features'] + model_config[model_num]['features']['cat_features']
 
@@ -24,3 +31,63 @@ def points_prediction(df: pd.DataFrame, model_config: tp.Dict, model_num: int, m
 
     return players_df
 
+
+def team_fixtures(fixtures: pd.DataFrame, teams: pd.DataFrame, first_gameweek: int, horizon: int) -> pd.DataFrame:
+    """
+    One row per (team, fixture) in gameweeks first_gameweek .. first_gameweek + horizon - 1,
+    as the next_week_* columns the models read.
+    """
+
+    window = fixtures[(fixtures['gameweek'] >= first_gameweek) & (fixtures['gameweek'] < first_gameweek + horizon)]
+    sides = [
+        window[['gameweek', 'team_h', 'team_a']].set_axis(['gameweek', 'team_id', 'opponent_id'], axis=1).assign(next_week_is_home=1),
+        window[['gameweek', 'team_a', 'team_h']].set_axis(['gameweek', 'team_id', 'opponent_id'], axis=1).assign(next_week_is_home=0),
+    ]
+    team_names = teams['team_name'].astype(str)
+    return (
+        pd.concat(sides, ignore_index=True)
+        .assign(next_week_opponent_team_name=lambda d: d['opponent_id'].map(team_names))
+        .astype({'gameweek': 'int64', 'team_id': 'int64'})
+        .drop(columns='opponent_id')
+    )
+
+
+def horizon_points_prediction(df: pd.DataFrame, fixtures: pd.DataFrame, teams: pd.DataFrame, model_config: tp.Dict,
+                              model_num: int, mlflow_tracking_uri: str, predicting_gameweek: int, prediction_horizon: int,
+                              model_store: tp.Optional[tp.Dict] = None) -> PlayerRoundTensor:
+    """
+    Expected points for every player over the next prediction_horizon gameweeks, as a
+    players x gameweeks PlayerRoundTensor with features expected_points and n_fixtures.
+
+    Each player's latest row (the one points_prediction scores) is paired with every
+    fixture of their team in the window, with the fixture columns (next_week_is_home,
+    next_week_opponent_team_name) swapped in, and the whole stack is scored with one
+    predict call. Double gameweeks sum their fixtures; blank gameweeks are 0.
+    """
+
+    store = ModelStore.shared(tracking_uri=mlflow_tracking_uri, **(model_store or {}))
+    trained_pipeline = store.load(f"model_gameweek_{predicting_gameweek}")
+    features = model_config[model_num]['features']['num_features'] + model_config[model_num]['features']['cat_features']
+
+    latest = df[df['round'] == predicting_gameweek - 1].groupby('player_id').tail(1)
+    schedule = team_fixtures(fixtures, teams, predicting_gameweek, prediction_horizon)
+    fixture_cols = [c for c in schedule.columns if c not in ('gameweek', 'team_id')]
+    rows = (
+        latest.drop(columns=fixture_cols, errors='ignore')
+        .astype({'team_id': 'int64'})
+        .merge(schedule, on='team_id', how='inner')
+    )
+
+    player_ids = np.sort(latest['player_id'].to_numpy())
+    values = np.zeros((len(player_ids), prediction_horizon, 2), dtype=np.float32)
+    if len(rows):
+        y_pred = trained_pipeline.predict(rows[features])
+        p = np.searchsorted(player_ids, rows['player_id'].to_numpy())
+        h = rows['gameweek'].to_numpy() - predicting_gameweek
+        np.add.at(values[..., 0], (p, h), y_pred)
+        np.add.at(values[..., 1], (p, h), 1)
+
+    logger.info("Expected points for %s players over gameweeks %s-%s (%s player fixtures)", len(player_ids),
+                predicting_gameweek, predicting_gameweek + prediction_horizon - 1, len(rows))
+    present = np.ones(values.shape[:2], dtype=bool)
+    return PlayerRoundTensor(values, present, player_ids, predicting_gameweek, ['expected_points', 'n_fixtures'])
@@ -1,23 +1,50 @@
-from .gameweek_prediction_nodes import points_prediction
+from .gameweek_prediction_nodes import points_prediction, horizon_points_prediction
 
 from kedro.pipeline import Pipeline, node, pipeline
+from fpl_modelling.pipelines.data_processing.form_features_pipeline import create_form_features_pipeline
 
 
 def create_gameweek_prediction_pipeline(**kwargs) -> Pipeline:
     """
     Create a Kedro pipeline for model training using a flexible model config dict.
     """
-    return pipeline([
+    return create_form_features_pipeline() + pipeline([
         node(
             func=points_prediction,
             inputs=dict(
-                df = "players_hist_merged",
-                model_config = "params:model_config",
+                df = "players_hist_features",
+                model_config = "merged_model_config",
                 model_num = "params:model_num",
                 mlflow_tracking_uri = "params:mlflow_tracking_uri",
-                predicting_gameweek="params:predicting_gameweek"
+                predicting_gameweek="params:predicting_gameweek",
+                model_store="params:model_store"
             ),  
             outputs="opt_input_df",
             name="points_prediction_pipeline",
         ),
     ])
+
+
+def create_horizon_prediction_pipeline(**kwargs) -> Pipeline:
+    """
+    Expected points matrix (players x the next params:prediction_horizon gameweeks) for
+    the optimizers, from the predicting_gameweek model and the fixture list.
+    """
+    return create_form_features_pipeline() + pipeline([
+        node(
+            func=horizon_points_prediction,
+            inputs=dict(
+                df = "players_hist_features",
+                fixtures = "fixtures",
+                teams = "teams",
+                model_config = "merged_model_config",
+                model_num = "params:model_num",
+                mlflow_tracking_uri = "params:mlflow_tracking_uri",
+                predicting_gameweek = "params:predicting_gameweek",
+                prediction_horizon = "params:prediction_horizon",
+                model_store = "params:model_store"
+            ),
+            outputs="expected_points_matrix",
+            name="horizon_points_prediction_node",
+        ),
+    ])
@@ -0,0 +1,40 @@
+import logging
+import typing as tp
+
+import pandas as pd
+
+from .HyperparameterSearch import HyperparameterSearch
+from .train_model_nodes import backtest_frame
+
+logger = logging.getLogger(__name__)
+
+
+def search_hyperparameters(df: pd.DataFrame, model_config: tp.Dict, hyperparameter_search: tp.Dict):
+    """
+    Search hyperparameter_search['model_num']'s search_space (see HyperparameterSearch)
+    and add the winner to model_config as a new model_num.
+
+    model_config is merged_model_config, so earlier tuned entries are in it. Returns the
+    trials table and the new tuned_model_config: every earlier tuned entry (marked with
+    tuned_from) plus the new one.
+    """
+
+    settings = dict(hyperparameter_search)
+    base_num = settings.pop('model_num')
+    df = backtest_frame(df, model_config, [base_num])
+
+    search = HyperparameterSearch(df, model_config[base_num], **settings)
+    trials = search.run()
+
+    new_num = max(model_config) + 1
+    best = trials.iloc[0]
+    tuned = {num: config for num, config in model_config.items() if 'tuned_from' in config}
+    tuned[new_num] = search.best_config(
+        tuned_from=base_num,
+        search_score={'metric': search.metric, 'value': float(best[search.metric]), 'folds': int(best['folds']),
+                      'trials': search.n_trials},
+    )
+    logger.info("Best trial %s (%s %.4f) saved as model_num %s",
+                int(best['trial']), search.metric, best[search.metric], new_num)
+
+    return trials, tuned
@@ -0,0 +1,22 @@
+from kedro.pipeline import Pipeline, node, pipeline
+from fpl_modelling.pipelines.data_processing.form_features_pipeline import create_form_features_pipeline
+from .hyperparameter_search_nodes import search_hyperparameters
+
+
+def create_hyperparameter_search_pipeline(**kwargs) -> Pipeline:
+    """
+    Successive-halving hyperparameter search over params:hyperparameter_search.model_num's
+    search_space, writing the best configuration to tuned_model_config as a new model_num.
+    """
+    return create_form_features_pipeline() + pipeline([
+        node(
+            func=search_hyperparameters,
+            inputs=dict(
+                df="players_hist_features",
+                model_config="merged_model_config",
+                hyperparameter_search="params:hyperparameter_search"
+            ),
+            outputs=["hyperparameter_search_trials", "updated_tuned_model_config"],
+            name="hyperparameter_search_node",
+        ),
+    ])
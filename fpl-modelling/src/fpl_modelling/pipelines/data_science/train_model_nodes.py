@@ -1,10 +1,19 @@
 from fpl_modelling.pipelines.data_processing.ExpandingDF import ExpandingDF
+from fpl_modelling.pipelines.data_processing.FormFeatures import FormFeatures
+from fpl_modelling.FeatureCache import FeatureCache
 from .ModelPipelineBuilder import ModelPipelineBuilder
+from .WalkForwardBacktest import WalkForwardBacktest
+from .WarmStartTrainer import WarmStartTrainer
+import logging
+import time
 import typing as tp 
+from pathlib import Path
 import pandas as pd 
 import sklearn 
 import mlflow
 
+logger = logging.getLogger(__name__)
+
 def load_config(model_config: tp.Dict, model_num: int):
     """
     Load model pipeline
@@ -30,7 +39,14 @@ def train_test_split(df:pd.DataFrame, predicting_gameweek: int):
 
 
 def train_model(train_df: pd.DataFrame, pipeline: sklearn.pipeline.Pipeline, features: tp.List[str], 
-                mlflow_tracking_uri: str, predicting_gameweek: int, target_col: str='next_week_round_points'):
+                mlflow_tracking_uri: str, predicting_gameweek: int, target_col: str='next_week_round_points',
+                model_config: tp.Optional[tp.Dict] = None, model_num: tp.Optional[int] = None,
+                warm_start: tp.Optional[tp.Dict] = None):
+    """
+    Fit the pipeline and register it as model_gameweek_{predicting_gameweek}. With
+    warm_start enabled, continue last gameweek's booster instead (see WarmStartTrainer),
+    refitting in full every warm_start['refit_every'] gameweeks.
+    """
 
     mlflow.set_tracking_uri(mlflow_tracking_uri)
     mlflow.set_experiment(f"gameweek_{predicting_gameweek}")
@@ -38,7 +54,21 @@ def train_model(train_df: pd.DataFrame, pipeline: sklearn.pipeline.Pipeline, fea
     y = train_df[target_col]
 
     with mlflow.start_run(run_name="fpl_model_training") as run:
-        pipeline.fit(X, y)
+        if warm_start and warm_start.get('enabled'):
+            path = Path(warm_start['path']) / f"model_{model_num}"
+            trainer = WarmStartTrainer.load(path, refit_every=warm_start['refit_every'],
+                                            extra_estimators=warm_start['extra_estimators'],
+                                            recent_rounds=warm_start['recent_rounds'], target_col=target_col)
+            start = time.perf_counter()
+            mode = trainer.fit(pipeline, train_df, features, predicting_gameweek,
+                               FeatureCache.key(config=model_config[model_num]))
+            logger.info("Trained model %s for gameweek %s (%s) in %.1fs",
+                        model_num, predicting_gameweek, mode, time.perf_counter() - start)
+            trainer.save(path)
+            pipeline = trainer.pipeline
+            mlflow.log_params({"training_mode": mode, "last_full_refit": trainer.last_refit})
+        else:
+            pipeline.fit(X, y)
 
         model_info = mlflow.sklearn.log_model(
             sk_model=pipeline,
@@ -48,4 +78,34 @@ def train_model(train_df: pd.DataFrame, pipeline: sklearn.pipeline.Pipeline, fea
 
     return pipeline
 
-# def eval_model_walk_forward_cross_val():
+def backtest_frame(df: pd.DataFrame, model_config: tp.Dict, model_nums: tp.List[int]) -> pd.DataFrame:
+    """
+    df with the target and the form features any of model_nums need that it does not
+    have yet, so models with different feature lists can be evaluated together.
+    """
+
+    if "next_week_round_points" not in df:
+        df["next_week_round_points"] = df.groupby('player_id')['round_points'].shift(-1)
+
+    names = [f for m in model_nums for f in model_config[m]['features']['num_features'] + model_config[m]['features']['cat_features']]
+    return FormFeatures(df).add(dict.fromkeys(f for f in names if FormFeatures.parse(f)))
+
+
+def eval_model_walk_forward_cross_val(df: pd.DataFrame, model_config: tp.Dict, backtest: tp.Dict,
+                                      warm_start: tp.Optional[tp.Dict] = None):
+    """
+    Walk-forward backtest of backtest['model_nums'] (see WalkForwardBacktest): per-fold
+    metrics and a per-model summary. With backtest['compare_warm_start'], warm-started
+    weekly training is scored too.
+    """
+
+    model_nums = backtest['model_nums']
+    df = backtest_frame(df, model_config, model_nums)
+
+    runner = WalkForwardBacktest(df, model_config, min_train_rounds=backtest.get('min_train_rounds', 5),
+                                 n_jobs=backtest.get('n_jobs'))
+    folds, summary = runner.run(model_nums, backtest.get('first_gameweek'), backtest.get('last_gameweek'),
+                                warm_start if backtest.get('compare_warm_start') else None)
+    logger.info("Backtest summary:\n%s", summary.to_string(index=False))
+
+    return folds, summary
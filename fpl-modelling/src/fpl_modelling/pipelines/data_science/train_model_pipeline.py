@@ -1,28 +1,32 @@
 from kedro.pipeline import Pipeline, node, pipeline
-from .train_model_nodes import load_config, train_test_split, train_model
-from .data_processing_nodes import preprocess_data
+from fpl_modelling.pipelines.data_processing.form_features_pipeline import create_form_features_pipeline
+from fpl_modelling.pipelines.data_processing.model_config_pipeline import create_model_config_pipeline
+from .train_model_nodes import load_config, train_test_split, train_model, eval_model_walk_forward_cross_val
+from .data_processing_nodes import cached_preprocess_data
 
 def create_train_model_pipeline(**kwargs) -> Pipeline:
     """
     Create a Kedro pipeline for model training using a flexible model config dict.
+    The preprocessed frame comes from the feature cache when the data and code are unchanged.
     """
-    return pipeline([
+    return create_model_config_pipeline() + pipeline([
         node(
-            func=preprocess_data,
+            func=cached_preprocess_data,
             inputs=dict(
-                df = "players_hist_merged",
-                model_config = "params:model_config",
-                model_num = "params:model_num"
-            ),  # model_config is passed as dict param
+                players_hist_source = "players_hist_source",
+                model_config = "merged_model_config",
+                model_num = "params:model_num",
+                feature_cache = "params:feature_cache"
+            ),
             outputs="df_processed",
             name="preprocess_data_pipeline",
         ),  
         node(
             func=load_config,
             inputs=dict(
-                model_config = "params:model_config",
+                model_config = "merged_model_config",
                 model_num = "params:model_num"
-            ),  # model_config is passed as dict param
+            ),
             outputs=["pipeline", "features"],
             name="load_model_pipeline",
         ),
@@ -42,9 +46,32 @@ def create_train_model_pipeline(**kwargs) -> Pipeline:
                 pipeline="pipeline",
                 features="features",
                 mlflow_tracking_uri = "params:mlflow_tracking_uri",
-                predicting_gameweek = "params:predicting_gameweek"
+                predicting_gameweek = "params:predicting_gameweek",
+                model_config = "merged_model_config",
+                model_num = "params:model_num",
+                warm_start = "params:warm_start"
             ),
             outputs="trained_pipeline",
             name="train_model_node",
         ),
     ])
+
+
+def create_backtest_pipeline(**kwargs) -> Pipeline:
+    """
+    Walk-forward backtest of the model_config entries in params:backtest, writing per-fold
+    and per-model metrics to data/08_reporting.
+    """
+    return create_form_features_pipeline() + pipeline([
+        node(
+            func=eval_model_walk_forward_cross_val,
+            inputs=dict(
+                df="players_hist_features",
+                model_config="merged_model_config",
+                backtest="params:backtest",
+                warm_start="params:warm_start"
+            ),
+            outputs=["backtest_folds", "backtest_summary"],
+            name="walk_forward_backtest_node",
+        ),
+    ])
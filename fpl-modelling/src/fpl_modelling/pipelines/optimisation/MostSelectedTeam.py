@@ -1,12 +1,21 @@
+import typing as tp
 import pandas as pd
 from .TeamOptimizer import TeamOptimizer
 
 class MostSelectedTeam:
-    def __init__(self, players_hist_merged: pd.DataFrame, gameweek: int):
+    def __init__(self, players_hist_merged: pd.DataFrame, gameweek: int,
+                 effective_ownership: tp.Optional[pd.DataFrame] = None):
         self.gameweek = gameweek
         self.p_hist_gameweek = players_hist_merged[
             players_hist_merged['round'] == gameweek
         ]
+        # Crawled ownership (crawl_manager_picks) allows objective_col='effective_ownership'
+        if effective_ownership is not None and not effective_ownership.empty:
+            ownership = effective_ownership[effective_ownership['round'] == gameweek]
+            self.p_hist_gameweek = self.p_hist_gameweek.merge(
+                ownership[['player_id', 'ownership', 'captaincy_rate', 'effective_ownership']],
+                on='player_id', how='left'
+            ).fillna({'ownership': 0, 'captaincy_rate': 0, 'effective_ownership': 0})
         self.result = None
 
     def get_most_selected_team(self, objective_col: str = 'selected'):
@@ -1,4 +1,5 @@
 from .TeamOptimizer import TeamOptimizer
+import typing as tp
 import pandas as pd 
 import numpy as np 
 from .MostSelectedTeam import MostSelectedTeam
@@ -18,11 +19,27 @@ def pick_optimal_team(players_df: pd.DataFrame, objective_col: str='points'):
 
     return res
 
-def pick_most_selected_team(players_hist_merged: pd.DataFrame, gameweek:int, objective_col = 'selected'):
+def pick_optimal_team_horizon(players_df: pd.DataFrame, expected_points_matrix):
+    """
+    pick_optimal_team on expected points summed over the whole expected_points_matrix
+    horizon instead of next week's alone.
+    """
 
-    team_picker = MostSelectedTeam(players_hist_merged, gameweek)
+    totals = pd.Series(expected_points_matrix.feature('expected_points').sum(axis=1),
+                       index=expected_points_matrix.player_ids)
+    sub_df = players_df.assign(predicted_horizon_points=players_df['player_id'].map(totals).fillna(0))
+    optimizer = TeamOptimizer(sub_df, "predicted_horizon_points")
 
-    team_picker.get_most_selected_team()
+    res = optimizer.solve(budget=1e6)
+
+    return res
+
+def pick_most_selected_team(players_hist_merged: pd.DataFrame, gameweek:int, objective_col = 'selected',
+                            effective_ownership: tp.Optional[pd.DataFrame] = None):
+
+    team_picker = MostSelectedTeam(players_hist_merged, gameweek, effective_ownership)
+
+    team_picker.get_most_selected_team(objective_col)
 
     print('Team points:',team_picker.get_selected_team_points())
 
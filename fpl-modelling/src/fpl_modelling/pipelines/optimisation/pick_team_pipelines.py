@@ -1,7 +1,8 @@
 from kedro.pipeline import Pipeline, node, pipeline
 from .pick_team_nodes import (
     pick_most_selected_team,
-    pick_optimal_team
+    pick_optimal_team,
+    pick_optimal_team_horizon
 )
 
 def create_pick_optimal_team_pipeline(**kwargs) -> Pipeline:
@@ -18,13 +19,28 @@ def create_pick_optimal_team_pipeline(**kwargs) -> Pipeline:
         ),
     ])
     
+def create_pick_optimal_team_horizon_pipeline(**kwargs) -> Pipeline:
+    return pipeline([
+        node(
+            func=pick_optimal_team_horizon,
+            inputs=dict(
+                players_df="opt_input_df",
+                expected_points_matrix="expected_points_matrix"
+                ),
+            outputs="optimal_team_horizon",
+            name="pick_optimal_team_horizon_node"
+        ),
+    ])
+
 def create_pick_most_selected_team_pipeline(**kwargs) -> Pipeline:
     return pipeline([
         node(
             func=pick_most_selected_team,
             inputs=dict(
                 players_hist_merged="players_hist_merged",
-                gameweek = "params:gameweek"
+                gameweek = "params:gameweek",
+                objective_col="params:most_selected_objective_col",
+                effective_ownership="effective_ownership"
                 ),
             outputs="most_selected_team",
             name="pick_most_selected_team_node"
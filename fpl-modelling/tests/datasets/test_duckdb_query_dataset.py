@@ -0,0 +1,54 @@
+import sqlite3
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+from kedro.io import DatasetError
+
+from fpl_modelling.datasets import DuckDBQueryDataset
+from fpl_modelling.QueryBenchmark import generate_league_history, merged_query, write_managed
+
+
+@pytest.fixture(scope="module")
+def db(tmp_path_factory):
+    db = tmp_path_factory.mktemp("duckdb") / "fpl.db"
+    write_managed(db, generate_league_history(1, n_players=20, n_teams=4))
+    return db
+
+
+def sqlite_query(db, sql):
+    with sqlite3.connect(db) as conn:
+        return pd.read_sql_query(sql, conn)
+
+
+def duckdb_query(db, sql, **kwargs):
+    return DuckDBQueryDataset(sql=sql, credentials={"con": f"sqlite:///{db}"}, **kwargs).load()
+
+
+def test_merged_query_matches_sqlite(db):
+    order = ["player_id", "round", "next_week_opponent_team_name"]
+    reference = sqlite_query(db, merged_query()).sort_values(order, ignore_index=True)
+    result = duckdb_query(db, merged_query()).sort_values(order, ignore_index=True)
+
+    assert len(result) == len(reference)
+    assert result.dtypes.to_dict() == reference.dtypes.to_dict()
+    pd.testing.assert_frame_equal(result, reference)
+
+
+def test_integer_division_and_sums_follow_sqlite(db):
+    sql = ("SELECT player_id, MIN(value) / 10 AS transfer_cost, SUM(minutes) / 90 AS full_games, "
+           "SUM(total_points) AS points FROM players_hist GROUP BY player_id ORDER BY player_id")
+    reference = sqlite_query(db, sql)
+    result = duckdb_query(db, sql)
+
+    minutes = sqlite_query(db, "SELECT player_id, SUM(minutes) AS minutes FROM players_hist GROUP BY player_id")
+    assert result["full_games"].tolist() == (minutes.sort_values("player_id")["minutes"] // 90).tolist()
+    pd.testing.assert_frame_equal(result, reference)
+    # SUM over integers is a DuckDB HUGEINT; it comes back as int64, not decimal
+    assert duckdb_query(db, sql, return_type="arrow").schema.field("points").type == pa.int64()
+
+
+def test_database_is_attached_read_only(db):
+    with pytest.raises(DatasetError, match="read-only"):
+        duckdb_query(db, "DELETE FROM players_hist")
+    assert len(sqlite_query(db, "SELECT * FROM players_hist")) > 0
@@ -0,0 +1,15 @@
+from fpl_modelling.datasets import OptionalYAMLDataset
+
+
+def test_loads_default_until_written(tmp_path):
+    dataset = OptionalYAMLDataset(filepath=str(tmp_path / "tuned_model_config.yml"))
+    assert dataset.load() == {}
+
+    dataset.save({6: {"tuned_from": 4}})
+    assert dataset.load() == {6: {"tuned_from": 4}}
+
+
+def test_default_is_not_shared_between_loads(tmp_path):
+    dataset = OptionalYAMLDataset(filepath=str(tmp_path / "missing.yml"), default={"entries": []})
+    dataset.load()["entries"].append(1)
+    assert dataset.load() == {"entries": []}
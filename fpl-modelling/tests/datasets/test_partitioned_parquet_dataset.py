@@ -0,0 +1,45 @@
+import pandas as pd
+
+from fpl_modelling.datasets import PartitionedParquetDataset
+
+
+def fixtures_dataset(path):
+    return PartitionedParquetDataset(path=str(path), partition_cols=["season", "gameweek"],
+                                     season="2025-26", key_columns=["id"])
+
+
+def test_upsert_replaces_rows_in_the_touched_partition(tmp_path):
+    dataset = fixtures_dataset(tmp_path / "fixtures")
+    dataset.save(pd.DataFrame({"id": [1, 2], "gameweek": [3, 3], "finished": [False, False]}))
+    dataset.save(pd.DataFrame({"id": [2], "gameweek": [3], "finished": [True]}))
+
+    fixtures = dataset.load().set_index("id")
+    assert fixtures["finished"].to_dict() == {1: False, 2: True}
+
+
+def test_upsert_moves_rescheduled_fixture(tmp_path):
+    dataset = fixtures_dataset(tmp_path / "fixtures")
+    dataset.save(pd.DataFrame({"id": [1, 2, 3], "gameweek": [3, 3, 4], "finished": [False] * 3}))
+
+    # Fixture 3 moves from gameweek 4 (its only fixture) to 6, fixture 1 from 3 to 4
+    dataset.save(pd.DataFrame({"id": [3, 1], "gameweek": [6, 4], "finished": [False, False]}))
+
+    fixtures = dataset.load().sort_values("id")
+    assert fixtures["id"].tolist() == [1, 2, 3]
+    assert fixtures["gameweek"].tolist() == [4, 3, 6]
+
+    dataset.save(pd.DataFrame({"id": [3], "gameweek": [7], "finished": [False]}))
+    assert not list((tmp_path / "fixtures" / "season=2025-26" / "gameweek=6").glob("*.parquet"))
+    assert dataset.load().set_index("id")["gameweek"].to_dict() == {1: 4, 2: 3, 3: 7}
+
+
+def test_upsert_leaves_other_seasons_alone(tmp_path):
+    PartitionedParquetDataset(path=str(tmp_path / "fixtures"), partition_cols=["season", "gameweek"],
+                              season="2024-25", key_columns=["id"]).save(
+        pd.DataFrame({"id": [1], "gameweek": [3], "finished": [True]})
+    )
+    dataset = fixtures_dataset(tmp_path / "fixtures")
+    dataset.save(pd.DataFrame({"id": [1], "gameweek": [5], "finished": [False]}))
+
+    everything = PartitionedParquetDataset(path=str(tmp_path / "fixtures"), partition_cols=["season", "gameweek"]).load()
+    assert sorted(zip(everything["season"], everything["gameweek"])) == [("2024-25", 3), ("2025-26", 5)]
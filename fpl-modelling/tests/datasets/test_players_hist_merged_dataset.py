@@ -0,0 +1,71 @@
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from fpl_modelling.datasets import PlayersHistMergedDataset, SQLiteSchema
+from fpl_modelling.datasets.players_hist_merged_dataset import MERGED_COLUMNS
+from fpl_modelling.QueryBenchmark import generate_league_history, merged_query, write_managed
+
+
+@pytest.fixture
+def league():
+    tables = generate_league_history(1, n_players=60, n_teams=6)
+    fixtures = tables["fixtures"]
+    # Blank gameweek for the teams of one round-5 fixture, double gameweek for two teams in round 6
+    blank = fixtures.index[fixtures["gameweek"] == 5][0]
+    double = fixtures[fixtures["gameweek"] == 6].iloc[[0]].assign(id=fixtures["id"].max() + 1)
+    tables["fixtures"] = pd.concat([fixtures.drop(index=blank), double], ignore_index=True)
+    return tables
+
+
+def view(db):
+    with sqlite3.connect(db) as conn:
+        return pd.read_sql_query(merged_query(), conn)
+
+
+def assert_same_rows(materialised, reference):
+    order = ["player_id", "round", "next_week_opponent_team_name"]
+    materialised = materialised[MERGED_COLUMNS].sort_values(order, ignore_index=True)
+    reference = reference[MERGED_COLUMNS].sort_values(order, ignore_index=True)
+    pd.testing.assert_frame_equal(materialised, reference, check_dtype=False)
+
+
+def test_materialised_table_matches_view(tmp_path, league):
+    db = tmp_path / "fpl.db"
+    write_managed(db, league)
+
+    assert_same_rows(PlayersHistMergedDataset(credentials={"con": f"sqlite:///{db}"}).load(), view(db))
+
+
+def test_incremental_refresh_matches_view(tmp_path, league):
+    db = tmp_path / "fpl.db"
+    players_hist = league.pop("players_hist")
+    write_managed(db, {**league, "players_hist": players_hist[players_hist["round"] <= 10]})
+    dataset = PlayersHistMergedDataset(credentials={"con": f"sqlite:///{db}"})
+    dataset.load()
+
+    # New rounds arrive and an earlier round is revised for one player
+    revised = players_hist[players_hist["round"] <= 12].copy()
+    revised.loc[(revised["player_id"] == 1) & (revised["round"] == 3), "total_points"] += 5
+    SQLiteSchema(db).write("players_hist", revised, if_exists="upsert")
+
+    assert_same_rows(dataset.load(), view(db))
+
+
+def test_double_gameweek_is_not_mistaken_for_a_revision(tmp_path, league):
+    db = tmp_path / "fpl.db"
+    players_hist = league.pop("players_hist")
+    write_managed(db, {**league, "players_hist": players_hist[players_hist["round"] <= 10]})
+    dataset = PlayersHistMergedDataset(credentials={"con": f"sqlite:///{db}"})
+    assert dataset.refresh() == len(view(db))
+
+    # Nothing written since: nothing to recompute
+    assert dataset.refresh() == 0
+
+    # New rounds only rewrite each player's latest round and the new ones, even for players
+    # whose round-5 rows appear twice (double gameweek 6)
+    SQLiteSchema(db).write("players_hist", players_hist[players_hist["round"].between(11, 12)], if_exists="upsert")
+    reference = view(db)
+    assert dataset.refresh() == (reference["round"] >= 10).sum()
+    assert dataset.refresh() == 0
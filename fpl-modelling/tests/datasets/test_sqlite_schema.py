@@ -0,0 +1,73 @@
+import sqlite3
+
+import pandas as pd
+
+from fpl_modelling.datasets.sqlite_schema import _V1_TABLES, MIGRATIONS, SQLiteSchema
+
+
+def tables(path):
+    with sqlite3.connect(path) as conn:
+        return {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+
+
+def indexes(path):
+    with sqlite3.connect(path) as conn:
+        return {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL")}
+
+
+def primary_key(path, table):
+    with sqlite3.connect(path) as conn:
+        return [row[1] for row in sorted(conn.execute(f'PRAGMA table_info("{table}")'), key=lambda r: r[5]) if row[5]]
+
+
+def test_released_migrations_only_create_their_own_tables(tmp_path):
+    conn = sqlite3.connect(tmp_path / "fpl.db", isolation_level=None)
+    for version, _, step in MIGRATIONS[:2]:
+        step(conn)
+    conn.close()
+
+    assert tables(tmp_path / "fpl.db") - {"sqlite_stat1"} == set(_V1_TABLES)
+    assert "players_hist_merged_player_round" not in indexes(tmp_path / "fpl.db")
+
+
+def test_migrate_keys_implicit_tables_and_keeps_latest_rows(tmp_path):
+    db = tmp_path / "fpl.db"
+    with sqlite3.connect(db) as conn:
+        # As to_sql left them before the managed schema: no keys, duplicate rows
+        pd.DataFrame({"player_id": [1, 1], "total_points": [3, 5], "extra": ["a", "b"]}).to_sql("players", conn, index=False)
+        pd.DataFrame({"player_id": [7, 7], "round": [2, 2], "ownership": [0.1, 0.2]}).to_sql(
+            "effective_ownership", conn, index=False)
+
+    schema = SQLiteSchema(db)
+    assert schema.migrate() == MIGRATIONS[-1][0]
+
+    assert primary_key(db, "players") == ["player_id"]
+    assert primary_key(db, "effective_ownership") == ["player_id", "round"]
+    assert primary_key(db, "players_features") == ["player_id", "seq"]
+    assert {"players_hist_round", "players_hist_merged_player_round", "players_features_round"} <= indexes(db)
+    with sqlite3.connect(db) as conn:
+        assert conn.execute("SELECT total_points, extra FROM players").fetchall() == [(5, "b")]
+        assert conn.execute("SELECT ownership FROM effective_ownership").fetchall() == [(0.2,)]
+
+
+def test_migrate_from_an_older_version_runs_only_newer_steps(tmp_path):
+    db = tmp_path / "fpl.db"
+    conn = sqlite3.connect(db, isolation_level=None)
+    for version, _, step in MIGRATIONS[:4]:
+        step(conn)
+    conn.execute("PRAGMA user_version = 4")
+    # Written before migration 5: an unmanaged table with the "<table>_key" unique index
+    conn.execute('CREATE TABLE players_features (player_id, seq, round, form_3)')
+    conn.execute('CREATE UNIQUE INDEX players_features_key ON players_features (player_id, seq)')
+    conn.execute("INSERT INTO players_features VALUES (1, 0, 1, 2.5)")
+    conn.close()
+
+    schema = SQLiteSchema(db)
+    assert schema.migrate() == MIGRATIONS[-1][0]
+    assert primary_key(db, "players_features") == ["player_id", "seq"]
+    assert "players_features_key" not in indexes(db)
+
+    schema.write("players_features", pd.DataFrame({"player_id": [1], "seq": [0], "round": [1], "form_3": [4.0]}),
+                 if_exists="upsert")
+    with sqlite3.connect(db) as conn:
+        assert conn.execute("SELECT form_3 FROM players_features").fetchall() == [(4.0,)]
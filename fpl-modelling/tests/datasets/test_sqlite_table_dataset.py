@@ -0,0 +1,31 @@
+import sqlite3
+
+import pandas as pd
+import pytest
+from kedro.io import DatasetError
+
+from fpl_modelling.datasets import SQLiteTableDataset
+
+
+def dataset(db, table_name):
+    return SQLiteTableDataset(table_name=table_name, credentials={"con": f"sqlite:///{db}"}, if_exists="append")
+
+
+def test_missing_table_loads_empty(tmp_path):
+    db = tmp_path / "fpl.db"
+    assert dataset(db, "picks").load().empty
+
+    dataset(db, "picks").save(pd.DataFrame({"entry": [1, 2], "element": [10, 20]}))
+    assert dataset(db, "picks").load()["element"].tolist() == [10, 20]
+
+
+def test_other_database_errors_are_raised(tmp_path):
+    db = tmp_path / "fpl.db"
+    dataset(db, "picks").save(pd.DataFrame({"entry": [1], "element": [10]}))
+    with sqlite3.connect(db) as conn:
+        conn.execute("CREATE VIEW squad AS SELECT entry FROM picks")
+        conn.execute("DROP TABLE picks")
+
+    # The view exists but reads a dropped table: not the same as squad never being written
+    with pytest.raises(DatasetError, match="no such table: main.picks"):
+        dataset(db, "squad").load()
@@ -0,0 +1,29 @@
+import pandas as pd
+
+from fpl_modelling.pipelines.data_engineering.create_fixtures_table_nodes import update_fixtures
+
+
+class FixturesClient:
+    def __init__(self, fixtures):
+        self.fixtures = fixtures
+
+    def get_all_fixtures(self):
+        return pd.DataFrame(self.fixtures)
+
+
+def fixture(id, event, kickoff, finished=False):
+    return {"id": id, "event": event, "team_h": 1, "team_a": 2, "kickoff_time": kickoff, "started": finished,
+            "finished": finished, "finished_provisional": finished, "team_h_score": None, "team_a_score": None}
+
+
+def test_update_fixtures_returns_changed_rows_typed():
+    stored = pd.DataFrame([fixture(1, 3, "2025-09-01"), fixture(2, 4, "2025-09-08")]).assign(gameweek=[3, 4])
+    client = FixturesClient([fixture(1, 3, "2025-09-01"), fixture(2, 6, "2025-09-29")])
+
+    updates, changes = update_fixtures(client, stored)
+
+    assert updates["id"].tolist() == [2]
+    assert updates["gameweek"].dtype == "int16"
+    assert updates["team_h"].dtype == "int8"
+    assert changes["change_type"].tolist() == ["rescheduled,kickoff_moved"]
+    assert (changes["old_gameweek"].item(), changes["new_gameweek"].item()) == (4, 6)
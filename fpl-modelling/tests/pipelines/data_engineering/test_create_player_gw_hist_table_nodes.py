@@ -0,0 +1,24 @@
+import pandas as pd
+
+from fpl_modelling.pipelines.data_engineering.create_player_gw_hist_table_nodes import select_players_to_refresh
+
+
+def test_blank_gameweek_player_is_not_refetched():
+    # Team 2 has no fixture in round 3 (blank gameweek); team 1 played it
+    db_players = pd.DataFrame({"team_id": [1, 2], "total_points": [10, 8], "minutes": [270, 180]},
+                              index=pd.Index([11, 22], name="player_id"))
+    state = pd.DataFrame({"player_id": [11, 22], "latest_round": [3, 2],
+                          "total_points": [10, 8], "minutes": [270, 180]})
+    fixtures = pd.DataFrame({
+        "event": [1, 2, 3, 4],
+        "team_h": [1, 2, 1, 2],
+        "team_a": [2, 1, 3, 1],
+        "started": [True, True, True, False],
+    })
+
+    assert select_players_to_refresh(db_players, state, 3, fixtures).empty
+    # Without fixtures the old behaviour stands: expect every player to reach current_round
+    assert select_players_to_refresh(db_players, state, 3).index.tolist() == [22]
+
+    state.loc[state["player_id"] == 11, "latest_round"] = 2
+    assert select_players_to_refresh(db_players, state, 3, fixtures).index.tolist() == [11]
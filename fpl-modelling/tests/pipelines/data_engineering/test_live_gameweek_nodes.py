@@ -0,0 +1,97 @@
+import copy
+import sqlite3
+
+import pandas as pd
+
+from fpl_modelling.datasets import SQLiteSchema
+from fpl_modelling.pipelines.data_engineering.live_gameweek_nodes import stream_live_points
+from fpl_modelling.pipelines.data_engineering.LiveGameweekTracker import LiveGameweekTracker
+
+
+def stat(identifier, value, points):
+    return {"identifier": identifier, "points": points, "value": value, "points_modification": 0}
+
+
+# Trimmed event/7/live/ response: player 1 with one fixture, player 2 in a double gameweek
+EVENT_LIVE = {"elements": [
+    {"id": 1, "modified": False,
+     "stats": {"minutes": 90, "goals_scored": 1, "assists": 0, "clean_sheets": 0, "goals_conceded": 1,
+               "own_goals": 0, "penalties_saved": 0, "penalties_missed": 0, "yellow_cards": 0, "red_cards": 0,
+               "saves": 0, "bonus": 2, "bps": 31, "influence": "42.6", "creativity": "12.1", "threat": "35.0",
+               "ict_index": "9.0", "clearances_blocks_interceptions": 1, "recoveries": 4, "tackles": 1,
+               "defensive_contribution": 6, "starts": 1, "expected_goals": "0.54", "expected_assists": "0.10",
+               "expected_goal_involvements": "0.64", "expected_goals_conceded": "1.21", "total_points": 9,
+               "in_dreamteam": False},
+     "explain": [{"fixture": 10, "stats": [stat("minutes", 90, 2), stat("goals_scored", 1, 5), stat("bonus", 2, 2)]}]},
+    {"id": 2, "modified": False,
+     "stats": {"minutes": 150, "goals_scored": 1, "assists": 0, "clean_sheets": 0, "goals_conceded": 3,
+               "own_goals": 0, "penalties_saved": 0, "penalties_missed": 0, "yellow_cards": 1, "red_cards": 0,
+               "saves": 0, "bonus": 0, "bps": 22, "influence": "30.2", "creativity": "8.4", "threat": "21.0",
+               "ict_index": "6.0", "clearances_blocks_interceptions": 2, "recoveries": 7, "tackles": 3,
+               "defensive_contribution": 12, "starts": 2, "expected_goals": "0.41", "expected_assists": "0.05",
+               "expected_goal_involvements": "0.46", "expected_goals_conceded": "2.70", "total_points": 9,
+               "in_dreamteam": False},
+     "explain": [{"fixture": 11, "stats": [stat("minutes", 90, 2), stat("goals_scored", 1, 5)]},
+                 {"fixture": 12, "stats": [stat("minutes", 60, 2), stat("yellow_cards", 1, -1)]}]},
+]}
+
+
+class LiveClient:
+    """Serves the recorded live payloads in turn, repeating the last one."""
+
+    def __init__(self, *payloads):
+        self.payloads = list(payloads)
+
+    def get_event_live(self, gameweek):
+        payload = self.payloads.pop(0) if len(self.payloads) > 1 else self.payloads[0]
+        return copy.deepcopy(payload["elements"])
+
+    def get_gameweek_fixtures(self, gameweek, force_refresh=False):
+        return pd.DataFrame({"finished": [True]})
+
+
+def late_bonus():
+    payload = copy.deepcopy(EVENT_LIVE)
+    stats = payload["elements"][0]["stats"]
+    stats.update(bonus=3, bps=34, total_points=10)
+    payload["elements"][0]["explain"][0]["stats"][2] = stat("bonus", 3, 3)
+    return payload
+
+
+def test_polls_return_only_changed_fixtures():
+    tracker = LiveGameweekTracker(LiveClient(EVENT_LIVE, late_bonus()), gameweek=7)
+
+    first = tracker.poll_once()
+    assert sorted(zip(first["player_id"], first["fixture"])) == [(1, 10), (2, 11), (2, 12)]
+    single = first[first["player_id"] == 1].iloc[0]
+    assert (single["bps"], single["influence"], single["expected_goals"]) == (31, 42.6, 0.54)
+    # A double gameweek's stats block covers both fixtures, so only itemised stats are set
+    double = first[first["player_id"] == 2].set_index("fixture")
+    assert double.loc[11, "total_points"] == 7 and double.loc[12, "total_points"] == 1
+    assert double["bps"].isna().all()
+
+    second = tracker.poll_once()
+    assert second[["player_id", "fixture", "bonus", "bps", "points_delta"]].values.tolist() == [[1, 10, 3, 34, 1]]
+
+    # Unchanged payload, including the missing double-gameweek stats: nothing to report
+    assert tracker.poll_once().empty
+
+
+def test_live_updates_leave_unreported_stats_alone(tmp_path):
+    db = tmp_path / "fpl.db"
+    SQLiteSchema(db).write("players_hist", pd.DataFrame({
+        "player_id": [1, 2, 2], "fixture": [10, 11, 12], "round": 7, "total_points": 0,
+        **dict.fromkeys(LiveGameweekTracker.STAT_COLUMNS, 0.0), "bps": 5.0, "influence": 1.5, "ict_index": 0.5,
+    }))
+
+    stream_live_points(LiveClient(EVENT_LIVE), 7, {"path": str(db)},
+                       {"live_interval": 0, "idle_interval": 0, "max_polls": 1})
+
+    with sqlite3.connect(db) as conn:
+        rows = pd.read_sql_query("SELECT * FROM players_hist ORDER BY fixture", conn).set_index("fixture")
+    assert rows.loc[10, ["total_points", "minutes", "bps", "influence", "ict_index"]].tolist() == [9, 90, 31, 42.6, 9.0]
+    assert rows.loc[[11, 12], "total_points"].tolist() == [7, 1]
+    assert rows.loc[[11, 12], "minutes"].tolist() == [90, 60]
+    # Not itemised per fixture in a double gameweek: the stored values are kept
+    assert rows.loc[[11, 12], "bps"].tolist() == [5.0, 5.0]
+    assert rows.loc[[11, 12], "influence"].tolist() == [1.5, 1.5]
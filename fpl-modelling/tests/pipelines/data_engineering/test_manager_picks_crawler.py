@@ -0,0 +1,44 @@
+import numpy as np
+
+from fpl_modelling.pipelines.data_engineering.ManagerPicksCrawler import ManagerPicksCrawler
+
+
+class PicksClient:
+    """Serves a fixed squad per entry; entries in fail are returned as exceptions."""
+
+    def __init__(self, fail=()):
+        self.fail = set(fail)
+        self.requested = []
+
+    def get_team_picks_many(self, entry_ids, gameweek):
+        self.requested += list(entry_ids)
+        return [
+            ConnectionError(entry) if entry in self.fail else
+            {"picks": [{"element": p, "position": p, "multiplier": 2 if p == 1 else 1} for p in range(1, 16)]}
+            for entry in entry_ids
+        ]
+
+
+def test_crawl_resumes_and_ignores_partial_chunks(tmp_path):
+    gw_dir = tmp_path / "gameweek=3"
+    gw_dir.mkdir()
+    (gw_dir / ".chunk_00000.npz.tmp").write_bytes(b"half a chunk")
+
+    client = PicksClient(fail={4})
+    crawler = ManagerPicksCrawler(client, str(tmp_path), chunk_size=2)
+    assert crawler.crawl(3, [1, 2, 3, 4, 5]) == 4
+    assert not list(gw_dir.glob("*.tmp"))
+    assert sorted(crawler.crawled_entries(3).tolist()) == [1, 2, 3, 5]
+
+    # Second run only retries the failed entry and appends a new chunk
+    client = PicksClient()
+    crawler = ManagerPicksCrawler(client, str(tmp_path), chunk_size=2)
+    assert crawler.crawl(3, [1, 2, 3, 4, 5]) == 1
+    assert client.requested == [4]
+    assert [p.name for p in sorted(gw_dir.iterdir())] == ["chunk_00000.npz", "chunk_00001.npz", "chunk_00002.npz",
+                                                         "chunk_00003.npz"]
+
+    ownership = crawler.effective_ownership(3).set_index("player_id")
+    assert np.allclose(ownership["ownership"], 1.0)
+    assert ownership.loc[1, "captaincy_rate"] == 1.0
+    assert ownership.loc[1, "effective_ownership"] == 2.0
@@ -0,0 +1,64 @@
+import logging
+
+import pandas as pd
+
+from fpl_modelling.pipelines.data_engineering.create_player_gw_hist_table_nodes import create_player_gw_hist_table
+from fpl_modelling.pipelines.data_engineering.PlayersHistBuilder import PlayersHistBuilder
+
+
+def record(element, round_, **fields):
+    """element-summary history record, decimals as strings like the API sends them."""
+    return {"element": element, "fixture": 100 + round_, "opponent_team": 4, "total_points": 6, "was_home": True,
+            "kickoff_time": f"2025-08-{15 + round_}T14:00:00Z", "team_h_score": 2, "team_a_score": 0,
+            "round": round_, "modified": False, "minutes": 90, "bps": 24, "influence": "31.4",
+            "ict_index": "7.2", "expected_goals": "0.38", "value": 55, "selected": 120000, **fields}
+
+
+class HistoryClient:
+    """Serves fixed histories per player id, in the order asked for."""
+
+    def __init__(self, histories):
+        self.histories = histories
+
+    def get_players_hist_records_many(self, player_ids):
+        return [self.histories.get(player_id, []) for player_id in player_ids]
+
+
+def test_builds_history_for_players_with_records(caplog):
+    db_players = pd.DataFrame({"player_name": ["A Keeper", "B Benched", "C Striker"], "team_id": [1, 2, 3],
+                               "position_id": [1, 2, 4]}, index=pd.Index([1, 2, 3], name="player_id"))
+    client = HistoryClient({
+        1: [record(1, 1, new_api_field=1), record(1, 2, saves=4)],
+        2: [],  # no appearances yet
+        3: [record(3, 2, goals_scored=1)],
+    })
+
+    with caplog.at_level(logging.WARNING):
+        players_hist = create_player_gw_hist_table(db_players, client)
+
+    assert players_hist[["player_id", "round"]].values.tolist() == [[1, 1], [1, 2], [3, 2]]
+    assert players_hist["player_name"].tolist() == ["A Keeper", "A Keeper", "C Striker"]
+    assert players_hist["team_id"].tolist() == [1, 1, 3]
+    assert players_hist["influence"].tolist() == [31.4, 31.4, 31.4]
+    assert players_hist["expected_goals"].dtype == "float64"
+    # Fields missing from a record are null, unknown ones are dropped with one warning
+    assert players_hist["saves"].isna().tolist() == [True, False, True]
+    assert players_hist.loc[1, "saves"] == 4
+    assert "new_api_field" not in players_hist
+    assert "new_api_field" in caplog.text
+    assert list(players_hist.columns) == PlayersHistBuilder().schema.names
+
+
+def test_empty_histories_build_an_empty_table():
+    builder = PlayersHistBuilder()
+    builder.append([], player_id=1, player_name="A Player", team_id=3, position_id=2)
+
+    assert len(builder) == 0
+    table = builder.to_arrow()
+    assert table.num_rows == 0 and table.schema == builder.schema
+    assert builder.to_pandas().empty
+
+    db_players = pd.DataFrame({"player_name": ["A Player"], "team_id": [3], "position_id": [2]},
+                              index=pd.Index([1], name="player_id"))
+    players_hist = create_player_gw_hist_table(db_players, HistoryClient({}))
+    assert players_hist.empty and list(players_hist.columns) == builder.schema.names
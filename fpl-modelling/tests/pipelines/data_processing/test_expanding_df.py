@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fpl_modelling.dtype_registry import typed
+from fpl_modelling.pipelines.data_processing.ExpandingDF import ExpandingDF
+
+
+def season(n_players=12, n_rounds=10, seed=0):
+    """players_hist_merged-like rows with blank gameweeks, a double gameweek and a missing last target."""
+    rng = np.random.default_rng(seed)
+    rows = []
+    for player_id in range(1, n_players + 1):
+        for round_ in range(1, n_rounds + 1):
+            if rng.random() < 0.15:
+                continue  # blank gameweek, or not yet in the squad
+            for _ in range(2 if player_id % 4 == 0 and round_ == 6 else 1):
+                rows.append({"player_id": player_id, "round": round_, "round_points": int(rng.integers(0, 15)),
+                             "players_team": f"Team {player_id % 3}", "value": float(rng.uniform(4, 12))})
+    df = pd.DataFrame(rows).sample(frac=1, random_state=seed).sort_values("round", kind="stable")
+    df["next_week_round_points"] = df.groupby("player_id")["round_points"].shift(-1).astype(float)
+    return df.reset_index(drop=True)
+
+
+FRAMES = {
+    "raw": season,
+    "typed": lambda: typed(season(), "players_hist_merged"),
+}
+
+
+@pytest.mark.parametrize("frame", FRAMES)
+@pytest.mark.parametrize("target_col", ["next_week_round_points", "round_points"])
+@pytest.mark.parametrize("current_gameweek, num_games_to_predict", [(7, 3), (9, 2), (10, 1)])
+def test_expand_df_matches_loop(frame, target_col, current_gameweek, num_games_to_predict):
+    expander = ExpandingDF(current_gameweek, FRAMES[frame](), num_games_to_predict=num_games_to_predict,
+                           target_col=target_col)
+
+    pd.testing.assert_frame_equal(expander.expand_df(), expander.expand_df_loop())
+
+
+@pytest.mark.parametrize("frame", FRAMES)
+def test_horizons_past_the_season_end_match_loop(frame):
+    df = FRAMES[frame]()
+    expander = ExpandingDF(10, df, num_games_to_predict=1, target_col="round_points")
+    expanded = expander.expand_df(horizons=[1, 3, 6])
+
+    for h in (1, 3, 6):
+        # The loop has no horizon argument or end-of-season check: widen its window directly
+        reference = ExpandingDF(10, df, num_games_to_predict=1, target_col="round_points")
+        reference.num_games_to_predict = h
+        loop = reference.expand_df_loop()
+
+        # NaN where the window holds none of the player's rows (e.g. it starts after round 10)
+        with_rows = expanded[expanded[f"target_{h}"].notna()].reset_index(drop=True)
+        pd.testing.assert_frame_equal(with_rows.drop(columns=[c for c in expanded if c.startswith("target_")]),
+                                      loop.drop(columns="target"))
+        np.testing.assert_array_equal(with_rows[f"target_{h}"].to_numpy(), loop["target"].to_numpy(dtype=float))
+
+    # Round 10 rows have every window past the last round, so none is kept
+    assert (expanded["round"] < 10).all() and len(expanded) > 0
@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fpl_modelling.pipelines.data_processing.FormFeatures import FormFeatures
+
+
+@pytest.fixture
+def players_hist_merged():
+    """Three players over 8 rounds, shuffled, with a double gameweek, a blank one and missing values."""
+    rng = np.random.default_rng(0)
+    rows = []
+    for player_id in (1, 2, 3):
+        for round_ in range(1, 9):
+            if player_id == 3 and round_ == 4:
+                continue  # blank gameweek
+            matches = 2 if player_id in (1, 2) and round_ == 5 else 1
+            for match in range(matches):
+                row = {"player_id": player_id, "round": round_, "was_home": match,
+                       "round_points": float(rng.integers(0, 12)), "round_minutes": float(rng.choice([0, 30, 90])),
+                       "ict_index": float(rng.uniform(0, 10))}
+                # Each match repeated per next-week fixture, as the next-fixture join does before a double
+                for opponent in (["A", "B"] if round_ == 4 and player_id in (1, 2) else ["A"]):
+                    rows.append({**row, "next_week_opponent_team_name": f"{opponent}{round_ + 1}"})
+    df = pd.DataFrame(rows)
+    df.loc[(df["player_id"] == 2) & (df["round"] == 2), "ict_index"] = np.nan
+    return df.sample(frac=1, random_state=0).reset_index(drop=True)
+
+
+def reference(df, col, method):
+    """Naive pandas version: one row per gameweek, rolled per player, merged back onto the rows."""
+    matches = df.drop(columns=[c for c in df if c.startswith("next_week_")]).drop_duplicates()
+    gameweeks = (matches.groupby(["player_id", "round"])[[col, "round_minutes"]]
+                 .sum(min_count=1).reset_index().sort_values(["player_id", "round"]))
+    grouped = gameweeks.groupby("player_id")
+    gameweeks["expected"] = method(grouped, gameweeks)
+    return df.merge(gameweeks[["player_id", "round", "expected"]], on=["player_id", "round"], how="left")["expected"]
+
+
+def streak(values):
+    out, run = [], 0
+    for value in values:
+        run = run + 1 if value > 0 else 0
+        out.append(run)
+    return pd.Series(out, index=values.index)
+
+
+@pytest.mark.parametrize("name, method", [
+    ("round_points_last3_sum", lambda g, gw: g["round_points"].transform(lambda s: s.rolling(3, min_periods=0).sum())),
+    ("ict_index_last3_sum", lambda g, gw: g["ict_index"].transform(lambda s: s.rolling(3, min_periods=0).sum())),
+    ("ict_index_last2_mean", lambda g, gw: g["ict_index"].transform(lambda s: s.rolling(2, min_periods=1).mean())),
+    ("ict_index_ewm3", lambda g, gw: g["ict_index"].transform(lambda s: s.ewm(span=3, adjust=False, ignore_na=True).mean())),
+    ("round_points_streak", lambda g, gw: g["round_points"].transform(streak)),
+    ("round_points_per90_last3", lambda g, gw: (
+        g["round_points"].transform(lambda s: s.rolling(3, min_periods=0).sum())
+        / g["round_minutes"].transform(lambda s: s.rolling(3, min_periods=0).sum()) * 90
+    ).replace([np.inf, -np.inf], np.nan).fillna(0.0)),
+])
+def test_matches_naive_pandas_per_gameweek(players_hist_merged, name, method):
+    col = FormFeatures.parse(name)["col"]
+    expected = reference(players_hist_merged, col, method)
+
+    np.testing.assert_allclose(FormFeatures(players_hist_merged).compute(name), expected.to_numpy(dtype=float))
+
+
+def test_double_gameweek_rows_share_the_summed_gameweek(players_hist_merged):
+    df = FormFeatures(players_hist_merged).add(["round_points_last1_sum", "round_points_streak"])
+    double = df[(df["player_id"] == 1) & (df["round"] == 5)]
+    before = df[(df["player_id"] == 1) & (df["round"] == 4)]
+
+    assert len(double) == 2 and len(before) == 2
+    assert (double["round_points_last1_sum"] == double["round_points"].sum()).all()
+    # The rows repeated for round 4's two next-week fixtures are one gameweek, counted once
+    assert (before["round_points_last1_sum"] == before["round_points"].iloc[0]).all()
+    assert double["round_points_streak"].nunique() == 1
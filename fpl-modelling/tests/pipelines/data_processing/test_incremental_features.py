@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fpl_modelling.datasets import PlayersHistMergedDataset
+from fpl_modelling.pipelines.data_processing.FormFeatures import FormFeatures
+from fpl_modelling.pipelines.data_processing.IncrementalFeatures import TARGET_COL, IncrementalFeatures
+from fpl_modelling.QueryBenchmark import generate_league_history, write_managed
+
+FEATURES = ["round_points_last3_mean", "round_points_last2_sum", "ict_index_ewm5", "round_points_per90_last3",
+            "round_minutes_streak"]
+
+
+@pytest.fixture(scope="module")
+def players_hist_merged(tmp_path_factory):
+    tables = generate_league_history(1, n_players=40, n_teams=6)
+    fixtures = tables["fixtures"]
+    # Double gameweek for two teams in round 6, so round-5 rows repeat and round-6 rows double
+    double = fixtures[fixtures["gameweek"] == 6].iloc[[0]].assign(id=fixtures["id"].max() + 1)
+    tables["fixtures"] = pd.concat([fixtures, double], ignore_index=True)
+    db = tmp_path_factory.mktemp("incremental") / "fpl.db"
+    write_managed(db, tables)
+    return PlayersHistMergedDataset(credentials={"con": f"sqlite:///{db}"}).load()
+
+
+def full_history(df):
+    """FormFeatures over the whole frame followed by the per-player target shift."""
+    df = FormFeatures(df).add(FEATURES).sort_values(["player_id", "round"], kind="stable")
+    df["seq"] = df.groupby("player_id").cumcount() + 1
+    df[TARGET_COL] = df.groupby("player_id")["round_points"].shift(-1)
+    return df.set_index(["player_id", "seq"]).sort_index()
+
+
+def upsert(parts):
+    """players_features after upserting each update's rows on (player_id, seq)."""
+    rows = pd.concat(parts, ignore_index=True).drop_duplicates(["player_id", "seq"], keep="last")
+    return rows.set_index(["player_id", "seq"]).sort_index()
+
+
+def test_round_by_round_updates_match_full_history(tmp_path, players_hist_merged):
+    df = players_hist_merged
+    parts = []
+    for last_round in range(1, df["round"].max() + 1):
+        features = IncrementalFeatures(str(tmp_path / "state"), FEATURES)
+        # Like players_hist_merged_recent: the state's round onwards
+        parts.append(features.update(df[df["round"].between(features.round, last_round)]))
+        features.save()
+
+    expected = full_history(df)
+    result = upsert(parts)
+    assert result.index.equals(expected.index)
+    pd.testing.assert_frame_equal(result[FEATURES + [TARGET_COL]], expected[FEATURES + [TARGET_COL]],
+                                  check_dtype=False)
+
+
+def test_state_round_trip(tmp_path, players_hist_merged):
+    path = str(tmp_path / "state")
+    features = IncrementalFeatures(path, FEATURES)
+    features.update(players_hist_merged[players_hist_merged["round"] <= 7])
+    features.save()
+
+    loaded = IncrementalFeatures(path, FEATURES)
+    assert loaded.round == features.round == 6
+    assert loaded.player_ids.equals(features.player_ids)
+    for name, arr in features.arrays.items():
+        np.testing.assert_array_equal(loaded.arrays[name], arr)
+    pd.testing.assert_frame_equal(loaded.last_rows, features.last_rows)
+
+    # Saved state continues exactly as the in-memory one would
+    later = players_hist_merged[players_hist_merged["round"].between(7, 9)]
+    pd.testing.assert_frame_equal(loaded.update(later), features.update(later))
+
+    with pytest.raises(ValueError, match="delete it to rebuild"):
+        IncrementalFeatures(path, ["round_points_last5_mean"])
+
+
+def test_target_is_back_filled_from_the_next_update(tmp_path, players_hist_merged):
+    df = players_hist_merged
+    features = IncrementalFeatures(str(tmp_path / "state"), FEATURES)
+    first = features.update(df[df["round"] <= 4])
+    assert first.loc[first["round"] == 4, TARGET_COL].isna().all()
+
+    changed = features.update(df[df["round"].between(4, 5)])
+    # The state was kept at round 3: its last rows get round 4's points as their target
+    back_filled = changed[changed["round"] == 3].set_index("player_id")[TARGET_COL]
+    round_4 = df[df["round"] == 4].groupby("player_id")["round_points"].first()
+    pd.testing.assert_series_equal(back_filled, round_4.loc[back_filled.index], check_names=False,
+                                  check_dtype=False)
+    assert set(changed["round"]) == {3, 4, 5}
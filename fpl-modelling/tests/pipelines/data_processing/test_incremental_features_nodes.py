@@ -0,0 +1,32 @@
+import pytest
+
+from fpl_modelling.datasets import PlayersHistMergedDataset
+from fpl_modelling.pipelines.data_processing.incremental_features_nodes import rebuild_features, update_features
+from fpl_modelling.QueryBenchmark import generate_league_history, write_managed
+
+
+@pytest.fixture
+def players_hist_merged(tmp_path):
+    db = tmp_path / "fpl.db"
+    write_managed(db, generate_league_history(1, n_players=30, n_teams=4))
+    return PlayersHistMergedDataset(credentials={"con": f"sqlite:///{db}"}).load()
+
+
+def model(features):
+    return {"minute_threshold": 0, "features": {"num_features": features, "cat_features": []}}
+
+
+def test_each_model_keeps_its_own_state(tmp_path, players_hist_merged):
+    model_config = {1: model(["round_points_last3_mean"]), 2: model(["ict_index_ewm5"])}
+    params = {"path": str(tmp_path / "incremental_features")}
+    first = players_hist_merged[players_hist_merged["round"] <= 10]
+
+    rebuild_features(first, model_config, 1, params)
+    rebuild_features(first, model_config, 2, params)
+    assert sorted(p.name for p in (tmp_path / "incremental_features").iterdir()) == ["model_1", "model_2"]
+
+    # The other model's state is untouched by a rebuild, and updates carry on from it
+    changed = update_features(players_hist_merged[players_hist_merged["round"].between(10, 11)], model_config, 1, params)
+    # Round 10 is recomputed (the latest round is never folded in) and round 9 gets its target back-filled
+    assert set(changed["round"]) == {9, 10, 11}
+    assert "round_points_last3_mean" in changed and "ict_index_ewm5" not in changed
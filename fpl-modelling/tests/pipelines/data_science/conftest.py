@@ -0,0 +1,38 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def players_features():
+    """40 players over 12 rounds with two features, round_points and the next-week target."""
+    rng = np.random.default_rng(0)
+    players, rounds = 40, 12
+    df = pd.DataFrame({
+        "player_id": np.repeat(np.arange(1, players + 1), rounds),
+        "round": np.tile(np.arange(1, rounds + 1), players),
+    })
+    df["value"] = rng.normal(55, 10, len(df))
+    df["form"] = rng.random(len(df)) * 5
+    df["round_points"] = (df["form"] + rng.normal(0, 1, len(df))).round()
+    df["cumsum_minutes"] = df["round"] * 90
+    df["next_week_round_points"] = df.groupby("player_id")["round_points"].shift(-1)
+    return df
+
+
+def _config(model_class, **hyperparams):
+    return {
+        "minute_threshold": 0,
+        "features": {"num_features": ["value", "form"], "cat_features": []},
+        "model": {"class": model_class, "hyperparams": hyperparams},
+    }
+
+
+@pytest.fixture
+def linear_config():
+    return _config("sklearn.linear_model.LinearRegression")
+
+
+@pytest.fixture
+def xgb_config():
+    return _config("xgboost.XGBRegressor", n_estimators=20, max_depth=2, learning_rate=0.3, n_jobs=1)
@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fpl_modelling.ModelStore import ModelStore
+from fpl_modelling.pipelines.data_science.gameweek_prediction_nodes import horizon_points_prediction, team_fixtures
+
+
+class HomeAdvantageModel:
+    """3 points at home, 1 away; keeps the rows it scored."""
+
+    def predict(self, X):
+        self.X = X
+        return X["next_week_is_home"].to_numpy() * 2 + 1
+
+
+class StubStore:
+    def __init__(self, model):
+        self.model = model
+
+    def load(self, name):
+        return self.model
+
+
+@pytest.fixture
+def teams():
+    return pd.DataFrame({"team_name": ["Arsenal", "Brentford", "Chelsea"]}, index=[1, 2, 3])
+
+
+@pytest.fixture
+def fixtures():
+    # GW10: team 3 blank; GW11: team 1 double
+    return pd.DataFrame({"gameweek": [10, 11, 11], "team_h": [1, 1, 2], "team_a": [2, 3, 1]})
+
+
+@pytest.fixture
+def players():
+    return pd.DataFrame({
+        "player_id": [101, 102, 103, 101, 102, 103],
+        "team_id": [1, 2, 3, 1, 2, 3],
+        "round": [8, 8, 8, 9, 9, 9],
+        "value": [50, 60, 70, 50, 60, 70],
+        "next_week_is_home": [0, 0, 0, 1, 1, 1],
+        "next_week_opponent_team_name": ["x"] * 6,
+    })
+
+
+def test_team_fixtures_lists_both_sides(fixtures, teams):
+    schedule = team_fixtures(fixtures, teams, 11, 1)
+
+    assert sorted(zip(schedule["team_id"], schedule["next_week_is_home"], schedule["next_week_opponent_team_name"])) == [
+        (1, 0, "Brentford"), (1, 1, "Chelsea"), (2, 1, "Arsenal"), (3, 0, "Arsenal"),
+    ]
+
+
+def test_horizon_matrix_sums_doubles_and_zeros_blanks(monkeypatch, players, fixtures, teams):
+    model = HomeAdvantageModel()
+    monkeypatch.setattr(ModelStore, "shared", classmethod(lambda cls, **kwargs: StubStore(model)))
+    model_config = {1: {"features": {"num_features": ["value", "next_week_is_home"],
+                                     "cat_features": ["next_week_opponent_team_name"]}}}
+
+    tensor = horizon_points_prediction(players, fixtures, teams, model_config, 1, "unused", predicting_gameweek=10,
+                                       prediction_horizon=3)
+
+    assert tensor.player_ids.tolist() == [101, 102, 103]
+    expected_points = tensor.values[..., tensor.features.index("expected_points")]
+    n_fixtures = tensor.values[..., tensor.features.index("n_fixtures")]
+    np.testing.assert_array_equal(expected_points, [[3, 4, 0], [1, 3, 0], [0, 1, 0]])
+    np.testing.assert_array_equal(n_fixtures, [[1, 2, 0], [1, 1, 0], [0, 1, 0]])
+
+    # One predict call over every player fixture, with the latest round's features
+    assert len(model.X) == 6
+    assert set(model.X["value"]) == {50, 60, 70}
+    assert "x" not in set(model.X["next_week_opponent_team_name"])
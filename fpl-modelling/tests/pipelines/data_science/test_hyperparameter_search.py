@@ -0,0 +1,45 @@
+from fpl_modelling.pipelines.data_processing.model_config_nodes import merge_tuned_model_config
+from fpl_modelling.pipelines.data_science.HyperparameterSearch import HyperparameterSearch
+from fpl_modelling.pipelines.data_science.hyperparameter_search_nodes import search_hyperparameters
+
+SEARCH_SPACE = {
+    "n_estimators": {"type": "int", "low": 5, "high": 30},
+    "learning_rate": {"type": "float", "low": 0.05, "high": 0.5, "log": True},
+    "booster": {"type": "choice", "values": ["gbtree"]},
+}
+
+
+def test_successive_halving_prunes_trials(players_features, xgb_config):
+    config = {**xgb_config, "search_space": SEARCH_SPACE}
+    search = HyperparameterSearch(players_features, config, n_trials=6, eta=3, min_folds=2, n_jobs=1)
+
+    assert search.rungs() == [[7, 10], [7, 8, 9, 10, 11, 12]]
+    trials = search.run()
+
+    assert trials["rung"].tolist() == [1, 1, 0, 0, 0, 0]
+    assert trials["folds"].tolist() == [6, 6, 2, 2, 2, 2]
+    # Trial 0 is the entry's own hyperparameters
+    assert search.trials[0] == xgb_config["model"]["hyperparams"]
+    assert "search_space" not in search.best_config()
+
+
+def test_search_adds_the_winner_to_the_tuned_entries(players_features, xgb_config):
+    tuned = {3: {**xgb_config, "tuned_from": 2}}
+    model_config = merge_tuned_model_config({2: {**xgb_config, "search_space": SEARCH_SPACE}}, tuned)
+    settings = {"model_num": 2, "n_trials": 3, "min_folds": 2, "n_jobs": 1}
+
+    trials, updated = search_hyperparameters(players_features, model_config, settings)
+
+    assert sorted(updated) == [3, 4]
+    assert updated[3] == tuned[3]
+    assert updated[4]["tuned_from"] == 2
+    assert updated[4]["search_score"]["trials"] == 3
+    assert "search_space" not in updated[4]
+
+
+def test_tuned_entries_merge_over_model_config():
+    model_config = {4: {"model": "configured"}, 5: {"model": "configured"}}
+
+    assert merge_tuned_model_config(model_config, {}) == model_config
+    merged = merge_tuned_model_config(model_config, {5: {"model": "tuned"}, 6: {"model": "tuned"}})
+    assert merged == {4: {"model": "configured"}, 5: {"model": "tuned"}, 6: {"model": "tuned"}}
@@ -1,63 +1,53 @@
-import logging
 import pandas as pd
 import pytest
-from kedro.io import DataCatalog
-from kedro.runner import SequentialRunner
-from fpl_modelling.pipelines.data_science import create_pipeline as create_ds_pipeline
-from fpl_modelling.pipelines.data_science.nodes import split_data
+
+from fpl_modelling.pipelines.data_science.data_processing_nodes import preprocess_data
+from fpl_modelling.pipelines.data_science.train_model_nodes import load_config, train_test_split
+
 
 @pytest.fixture
-def dummy_data():
-    return pd.DataFrame(
-        {
-            "engines": [1, 2, 3],
-            "crew": [4, 5, 6],
-            "passenger_capacity": [5, 6, 7],
-            "price": [120, 290, 30],
-        }
-    )
+def players_hist():
+    return pd.DataFrame({
+        "player_id": [1, 1, 1, 2, 2, 2],
+        "round": [1, 2, 3, 1, 2, 3],
+        "round_points": [2, 6, 1, 0, 0, 3],
+        "cumsum_minutes": [90, 180, 270, 0, 0, 45],
+        "value": [50, 50, 51, 45, 45, 45],
+        "position": ["MID", "MID", "MID", "DEF", "DEF", "DEF"],
+    })
+
 
 @pytest.fixture
-def dummy_parameters():
-    parameters = {
-        "model_options": {
-            "test_size": 0.2,
-            "random_state": 3,
-            "features": ["engines", "passenger_capacity", "crew"],
-        }
-    }
-    return parameters
-
-
-def test_split_data(dummy_data, dummy_parameters):
-    X_train, X_test, y_train, y_test = split_data(
-        dummy_data, dummy_parameters["model_options"]
-    )
-    assert len(X_train) == 2
-    assert len(y_train) == 2
-    assert len(X_test) == 1
-    assert len(y_test) == 1
-
-def test_split_data_missing_price(dummy_data, dummy_parameters):
-    dummy_data_missing_price = dummy_data.drop(columns="price")
-    with pytest.raises(KeyError) as e_info:
-        X_train, X_test, y_train, y_test = split_data(dummy_data_missing_price, dummy_parameters["model_options"])
-
-    assert "price" in str(e_info.value)
-
-def test_data_science_pipeline(caplog, dummy_data, dummy_parameters):
-    pipeline = (
-        create_ds_pipeline()
-        .from_nodes("split_data_node")
-        .to_nodes("evaluate_model_node")
-    )
-    catalog = DataCatalog()
-    catalog["model_input_table"] = dummy_data
-    catalog["params:model_options"] = dummy_parameters["model_options"]
-
-    caplog.set_level(logging.DEBUG, logger="kedro")
-    successful_run_msg = "Pipeline execution completed successfully"
-
-    SequentialRunner().run(pipeline, catalog)
-
-    assert successful_run_msg in caplog.text
+def model_config():
+    return {1: {
+        "minute_threshold": 0,
+        "features": {"num_features": ["value"], "cat_features": ["position"]},
+        "preprocessor": {"steps": [
+            {"name": "num", "transformer": "sklearn.preprocessing.StandardScaler", "columns": ["value"]},
+            {"name": "cat", "transformer": "sklearn.preprocessing.OneHotEncoder", "columns": ["position"]},
+        ]},
+        "model": {"class": "sklearn.linear_model.LinearRegression", "hyperparams": {}},
+    }}
+
+
+def test_preprocess_data_adds_target_and_drops_unplayed_rows(players_hist, model_config):
+    df = preprocess_data(players_hist, model_config, 1)
+
+    assert df["cumsum_minutes"].gt(0).all()
+    assert df.loc[(df["player_id"] == 1) & (df["round"] == 1), "next_week_round_points"].item() == 6
+    assert df.loc[(df["player_id"] == 1) & (df["round"] == 3), "next_week_round_points"].isna().item()
+
+
+def test_train_test_split(players_hist):
+    train_df, test_df = train_test_split(players_hist, 3)
+
+    assert set(train_df["round"]) == {1, 2}
+    assert set(test_df["round"]) == {3}
+
+
+def test_load_config_builds_pipeline(players_hist, model_config):
+    pipeline, features = load_config(model_config, 1)
+
+    assert features == ["value", "position"]
+    pipeline.fit(players_hist[features], players_hist["round_points"])
+    assert len(pipeline.predict(players_hist[features])) == len(players_hist)
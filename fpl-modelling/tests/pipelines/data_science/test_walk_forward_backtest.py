@@ -0,0 +1,31 @@
+from fpl_modelling.pipelines.data_science.WalkForwardBacktest import WalkForwardBacktest
+
+
+def test_folds_train_only_on_known_targets(players_features, linear_config):
+    backtest = WalkForwardBacktest(players_features, {1: linear_config}, n_jobs=1)
+    folds, summary = backtest.run([1])
+
+    assert folds["gameweek"].tolist() == list(range(7, 13))
+    # Gameweek g trains on rounds < g - 1 and scores round g - 1, whose targets are known
+    assert (folds["n_train"] == 40 * (folds["gameweek"] - 2)).all()
+    assert (folds["n_test"] == 40).all()
+    assert summary["folds"].item() == 6
+
+
+def test_parallel_run_matches_serial(players_features, linear_config, xgb_config):
+    model_config = {1: linear_config, 2: xgb_config}
+    serial, _ = WalkForwardBacktest(players_features, model_config, n_jobs=1).run([1, 2], first_gameweek=9)
+    parallel, summary = WalkForwardBacktest(players_features, model_config, n_jobs=2).run([1, 2], first_gameweek=9)
+
+    metrics = ["model_num", "gameweek", "mae", "rmse", "spearman"]
+    assert serial[metrics].equals(parallel[metrics])
+    assert summary["mae"].is_monotonic_increasing
+
+
+def test_warm_start_chain_is_reported_next_to_full_refits(players_features, xgb_config):
+    warm_start = {"refit_every": 3, "extra_estimators": 5, "recent_rounds": 2}
+    folds, summary = WalkForwardBacktest(players_features, {2: xgb_config}, n_jobs=1).run([2], warm_start=warm_start)
+
+    chain = folds[folds["training"] == "warm_start"]
+    assert chain["fit_mode"].tolist() == ["full", "warm", "warm", "full", "warm", "warm"]
+    assert set(summary["training"]) == {"full", "warm_start"}
@@ -0,0 +1,58 @@
+import logging
+
+import numpy as np
+
+from fpl_modelling.pipelines.data_science.ModelPipelineBuilder import ModelPipelineBuilder
+from fpl_modelling.pipelines.data_science.WarmStartTrainer import WarmStartTrainer
+
+FEATURES = ["value", "form"]
+
+
+def fit_week(trainer, config, df, gameweek, config_key="v1"):
+    train = df[(df["round"] < gameweek - 1) & df["next_week_round_points"].notna()]
+    return trainer.fit(ModelPipelineBuilder(config).build_pipeline(), train, FEATURES, gameweek, config_key)
+
+
+def test_refits_every_n_gameweeks_and_on_config_change(players_features, xgb_config):
+    trainer = WarmStartTrainer(refit_every=3, extra_estimators=5)
+    modes = [fit_week(trainer, xgb_config, players_features, gw) for gw in range(5, 10)]
+    assert modes == ["full", "warm", "warm", "full", "warm"]
+
+    booster = trainer.pipeline.named_steps["model"].get_booster()
+    assert booster.num_boosted_rounds() == 20 + 5
+
+    assert fit_week(trainer, xgb_config, players_features, 10, config_key="v2") == "full"
+
+
+def test_non_booster_models_always_refit(players_features, linear_config):
+    trainer = WarmStartTrainer(refit_every=10)
+    assert [fit_week(trainer, linear_config, players_features, gw) for gw in (5, 6)] == ["full", "full"]
+
+
+def test_failed_warm_start_is_logged_and_refits(players_features, xgb_config, caplog):
+    config = {**xgb_config, "features": {"num_features": ["value"], "cat_features": ["position"]},
+              "preprocessor": {"steps": [
+                  {"name": "cat", "transformer": "sklearn.preprocessing.OneHotEncoder", "columns": ["position"]},
+              ]}}
+    df = players_features.assign(position=np.where(players_features["round"] < 6, "MID", "FWD"))
+    trainer = WarmStartTrainer(refit_every=5, extra_estimators=5)
+
+    def fit(gameweek):
+        train = df[(df["round"] < gameweek - 1) & df["next_week_round_points"].notna()]
+        return trainer.fit(ModelPipelineBuilder(config).build_pipeline(), train, ["value", "position"], gameweek)
+
+    assert fit(7) == "full"  # trained on MID only
+    with caplog.at_level(logging.WARNING):
+        assert fit(9) == "full"  # FWD rows are new to the fitted encoder
+    assert "Warm start for gameweek 9 failed" in caplog.text
+
+
+def test_save_and_load_round_trip(tmp_path, players_features, xgb_config):
+    trainer = WarmStartTrainer(refit_every=3, extra_estimators=5)
+    fit_week(trainer, xgb_config, players_features, 5)
+    trainer.save(tmp_path / "model_1")
+
+    loaded = WarmStartTrainer.load(tmp_path / "model_1", refit_every=3, extra_estimators=5)
+    assert (loaded.gameweek, loaded.last_refit, loaded.config_key) == (5, 5, "v1")
+    assert fit_week(loaded, xgb_config, players_features, 6) == "warm"
+    assert not (tmp_path / "model_1.tmp").exists()
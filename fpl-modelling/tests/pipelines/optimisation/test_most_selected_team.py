@@ -0,0 +1,21 @@
+import pandas as pd
+
+from fpl_modelling.pipelines.optimisation.MostSelectedTeam import MostSelectedTeam
+
+
+def test_ownership_is_merged_for_the_gameweek_only():
+    players_hist_merged = pd.DataFrame({"player_id": [1, 2, 1, 2], "round": [4, 4, 5, 5], "selected": [10, 20, 11, 21]})
+    effective_ownership = pd.DataFrame({
+        "player_id": [1, 2, 1],
+        "round": [4, 4, 5],
+        "ownership": [0.5, 0.1, 0.6],
+        "captaincy_rate": [0.2, 0.0, 0.3],
+        "effective_ownership": [0.7, 0.1, 0.9],
+    })
+
+    team = MostSelectedTeam(players_hist_merged, 5, effective_ownership)
+
+    assert len(team.p_hist_gameweek) == 2
+    assert team.p_hist_gameweek.set_index("player_id")["effective_ownership"].to_dict() == {1: 0.9, 2: 0.0}
+    # No crawl yet: the table loads empty and the frame is left alone
+    assert "effective_ownership" not in MostSelectedTeam(players_hist_merged, 5, pd.DataFrame()).p_hist_gameweek
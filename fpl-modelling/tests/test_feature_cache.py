@@ -0,0 +1,98 @@
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+
+from fpl_modelling.datasets import LazySource, PlayersHistMergedDataset
+from fpl_modelling.FeatureCache import FeatureCache
+from fpl_modelling.pipelines.data_science.data_processing_nodes import cached_preprocess_data
+from fpl_modelling.QueryBenchmark import generate_league_history, write_managed
+from fpl_modelling.ResponseCache import ResponseCache
+
+
+def frame(seed):
+    return pd.DataFrame({"x": np.random.default_rng(seed).random(1000)})
+
+
+def test_feature_cache_evicts_least_recently_used(tmp_path):
+    cache = FeatureCache(str(tmp_path / "cache"))
+    cache.put("a", frame(0))
+    size = (tmp_path / "cache" / "a.feather").stat().st_size
+    cache.max_size_bytes = 2 * size
+
+    cache.put("b", frame(1))
+    assert cache.get("a") is not None  # a is now more recent than b
+    cache.put("c", frame(2))
+
+    assert cache.get("b") is None
+    assert not (tmp_path / "cache" / "b.feather").exists()
+    pd.testing.assert_frame_equal(cache.get("a"), frame(0))
+    assert cache.stats()["evictions"] == 1
+
+    cache.clear()
+    assert not list((tmp_path / "cache").glob("*.feather"))
+    cache.close()
+
+
+def test_response_cache_evicts_least_recently_used(tmp_path):
+    def body():
+        return json.dumps(os.urandom(512).hex()).encode()
+
+    cache = ResponseCache(str(tmp_path / "http_cache.sqlite"))
+    cache.put("a", body())
+    size = cache._conn.execute("SELECT size FROM responses").fetchone()[0]
+    cache.max_size_bytes = 2 * size + size // 2  # room for two bodies, not three
+
+    cache.put("b", body())
+
+    assert cache.lookup("a")[0] is not None
+    cache.put("c", body())
+
+    assert cache.lookup("b") == (None, None)
+    assert cache.lookup("a")[0] is not None
+    assert cache.stats()["evictions"] == 1
+    cache.close()
+
+
+class CountingDataset:
+    def __init__(self, df):
+        self.df = df
+        self.loads = 0
+
+    def load(self):
+        self.loads += 1
+        return self.df.copy()
+
+
+def test_cached_preprocess_data_skips_load_on_hit(tmp_path):
+    db = tmp_path / "fpl.db"
+    write_managed(db, generate_league_history(1, n_players=20, n_teams=4))
+    dataset = CountingDataset(PlayersHistMergedDataset(credentials={"con": f"sqlite:///{db}"}).load())
+    source = LazySource(dataset, version="v1")
+    model_config = {1: {"minute_threshold": 0, "features": {"num_features": ["round_points_last3_mean"], "cat_features": []}}}
+    feature_cache = {"path": str(tmp_path / "feature_cache"), "max_size_mb": 64}
+
+    first = cached_preprocess_data(source, model_config, 1, feature_cache)
+    second = cached_preprocess_data(source, model_config, 1, feature_cache)
+
+    assert dataset.loads == 1
+    assert "next_week_round_points" in first and "round_points_last3_mean" in first
+    pd.testing.assert_frame_equal(first.reset_index(drop=True), second)
+    # The form features and the preprocessed frame are cached separately
+    assert len(list((tmp_path / "feature_cache").glob("*.feather"))) == 2
+
+
+def test_response_cache_counts_revalidations_across_threads(tmp_path):
+    cache = ResponseCache(str(tmp_path / "http_cache.sqlite"))
+    cache.put("bootstrap-static/", b"{}", etag="v1", ttl=0)
+    _, entry = cache.lookup("bootstrap-static/")
+    not_modified = SimpleNamespace(status_code=304, headers={}, content=b"")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda _: cache.update("bootstrap-static/", entry, not_modified), range(200)))
+
+    assert cache.stats()["revalidated"] == 200
+    cache.close()
@@ -0,0 +1,64 @@
+import json
+import threading
+
+import pytest
+
+from fpl_modelling.FPL_API import FPLClient
+from fpl_modelling.ReplayServer import ReplayServer, archive_path
+from fpl_modelling.ResponseArchive import ResponseArchive
+from fpl_modelling.ResponseCache import ResponseCache
+
+BOOTSTRAP = {"events": [{"id": 1, "deadline_time": "2025-08-15T17:30:00Z", "is_current": True}],
+             "elements": [], "teams": [], "element_types": []}
+
+
+def record(record_dir, endpoint, data):
+    path = archive_path(record_dir, endpoint)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data))
+
+
+@pytest.fixture
+def server(tmp_path):
+    record(tmp_path / "rec", "bootstrap-static/", BOOTSTRAP)
+    record(tmp_path / "rec", "my-team/7", {"picks": [{"element": 1}]})
+    for player_id in range(1, 6):
+        record(tmp_path / "rec", f"element-summary/{player_id}/", {"history": [{"element": player_id, "round": 1}]})
+    with ReplayServer(tmp_path / "rec") as server:
+        yield server
+
+
+def test_snapshot_sends_authenticated_requests_to_the_network(tmp_path, server):
+    archive = ResponseArchive(str(tmp_path / "archive"))
+    archive.append("bootstrap-static/", BOOTSTRAP)
+    client = FPLClient(server.base_url, archive=archive, snapshot={"season": "2025-26", "gameweek": 1})
+
+    assert client.get_metadata() == BOOTSTRAP
+    served = server.requests_served
+    assert client.get_current_team(7, "token") == {"picks": [{"element": 1}]}
+    assert server.requests_served == served + 1
+    with pytest.raises(KeyError):
+        client.get_players_hist(1)  # public and not archived: the snapshot does not fall back
+    client.close()
+
+
+def test_async_bulk_fetch_keeps_cache_off_the_event_loop(tmp_path, server):
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"))
+    threads = set()
+    lookup = cache.lookup
+
+    def tracking_lookup(key):
+        threads.add(threading.get_ident())
+        return lookup(key)
+
+    cache.lookup = tracking_lookup
+    client = FPLClient(server.base_url, cache=cache)
+    records = client.get_players_hist_records_many(range(1, 6))
+
+    assert [r[0]["element"] for r in records] == [1, 2, 3, 4, 5]
+    assert threading.get_ident() not in threads
+    # Second pass is served from the cache without touching the server
+    served = server.requests_served
+    client.get_players_hist_records_many(range(1, 6))
+    assert server.requests_served == served
+    client.close()
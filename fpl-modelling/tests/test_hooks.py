@@ -0,0 +1,22 @@
+import pandas as pd
+
+from fpl_modelling.hooks import DtypeHooks
+
+
+def frame():
+    return pd.DataFrame({"player_id": [1, 2], "team_id": [3, 4], "player_name": ["A", "B"]})
+
+
+def test_allow_listed_datasets_are_typed():
+    players = frame()
+    DtypeHooks().after_dataset_loaded("players", players)
+
+    assert players["team_id"].dtype == "int8"
+    assert isinstance(players["player_name"].dtype, pd.CategoricalDtype)
+
+
+def test_other_datasets_are_left_as_loaded():
+    state = frame()
+    DtypeHooks().after_dataset_loaded("players_hist_state", state)
+
+    assert state.dtypes.equals(frame().dtypes)
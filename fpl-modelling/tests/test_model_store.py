@@ -0,0 +1,69 @@
+import json
+from types import SimpleNamespace
+
+import joblib
+import pytest
+
+from fpl_modelling import ModelStore as model_store_module
+from fpl_modelling.ModelStore import ModelStore
+
+
+class FakeRegistry:
+    """Stands in for MlflowClient: model_gameweek_12 has versions 1 and 2."""
+    available = True
+    calls = 0
+
+    def __init__(self, tracking_uri=None):
+        pass
+
+    def search_model_versions(self, query):
+        FakeRegistry.calls += 1
+        if not FakeRegistry.available:
+            raise ConnectionError("registry down")
+        return [SimpleNamespace(version="1", run_id="run1"), SimpleNamespace(version="2", run_id="run2")]
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    FakeRegistry.available, FakeRegistry.calls = True, 0
+    monkeypatch.setattr(model_store_module, "MlflowClient", FakeRegistry)
+
+    def download(self, resolved, entry):
+        entry.mkdir(parents=True)
+        model = {"version": resolved["version"]}
+        joblib.dump(model, entry / "model.joblib")
+        (entry / "meta.json").write_text(json.dumps(resolved))
+        return model
+
+    monkeypatch.setattr(ModelStore, "_download", download)
+    return ModelStore(str(tmp_path / "model_store"), max_loaded=1, resolve_ttl=60)
+
+
+def test_downloads_each_version_once(store):
+    assert store.load("model_gameweek_12") == {"version": "2"}
+    assert store.load("model_gameweek_12") == {"version": "2"}
+    assert store.stats() == {"memory_hits": 1, "disk_hits": 0, "downloads": 1}
+    # The latest version was resolved once within resolve_ttl
+    assert FakeRegistry.calls == 1
+
+
+def test_in_memory_models_are_evicted_to_disk(store, monkeypatch):
+    monkeypatch.setattr(FakeRegistry, "search_model_versions", lambda self, query: [
+        SimpleNamespace(version="1", run_id=f"run_{query}")])
+    store.load("model_gameweek_12")
+    store.load("model_gameweek_13")  # max_loaded=1 pushes gameweek 12 out of memory
+    store.load("model_gameweek_12")
+
+    assert store.stats() == {"memory_hits": 0, "disk_hits": 1, "downloads": 2}
+
+
+def test_falls_back_to_stored_version_when_registry_is_down(tmp_path, store):
+    store.load("model_gameweek_12")
+
+    FakeRegistry.available = False
+    fresh = ModelStore(str(tmp_path / "model_store"))
+    assert fresh.load("model_gameweek_12") == {"version": "2"}
+    assert fresh.stats()["disk_hits"] == 1
+
+    with pytest.raises(ConnectionError):
+        fresh.load("model_gameweek_13")
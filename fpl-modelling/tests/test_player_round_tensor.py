@@ -0,0 +1,25 @@
+import numpy as np
+import pandas as pd
+
+from fpl_modelling.PlayerRoundTensor import PlayerRoundTensor
+
+
+def test_double_gameweek_sums_fixtures_once(tmp_path):
+    df = pd.DataFrame({
+        "player_id": [1, 1, 1, 1, 1, 2],
+        # Round 2 is a double gameweek; round 1 is repeated once per round-2 fixture by the next-week join
+        "round": [1, 1, 2, 2, 3, 1],
+        "round_points": [3, 3, 2, 6, 1, 5],
+        "cumsum_points": [3, 3, 5, 11, 12, 5],
+        "next_week_is_home": [1, 0, 1, 1, 0, 0],
+    })
+
+    tensor = PlayerRoundTensor.from_frame(df, ["round_points", "cumsum_points"], sum_features=["round_points"])
+
+    assert tensor.feature("round_points")[0].tolist() == [3, 8, 1]
+    assert tensor.feature("cumsum_points")[0].tolist() == [3, 11, 12]
+    assert np.isnan(tensor.player(2)[1:]).all()
+
+    tensor.save(tmp_path / "tensor")
+    loaded = PlayerRoundTensor.load(tmp_path / "tensor")
+    assert loaded.gameweek_frame(2)["round_points"].to_dict() == {1: 8.0}
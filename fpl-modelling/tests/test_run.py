@@ -1,20 +1,36 @@
 """
-This module contains example tests for a Kedro project.
-Tests should be placed in ``src/tests``, in modules that mirror your
-project's structure, and in files named test_*.py.
+Smoke tests for the Kedro project: every registered pipeline builds, and every dataset
+a pipeline reads is a catalog entry or the output of a registered node. Parameters are
+not checked: several are only supplied at run time (see the RUNTIME PARAMS comments in
+pipeline_registry.py).
 """
 from pathlib import Path
 
+import pytest
+from kedro.framework.project import pipelines
 from kedro.framework.session import KedroSession
 from kedro.framework.startup import bootstrap_project
 
-# The tests below are here for the demonstration purpose
-# and should be replaced with the ones testing the project
-# functionality
+PROJECT_PATH = Path(__file__).resolve().parents[1]
 
-class TestKedroRun:
-    def test_kedro_run(self):
-        bootstrap_project(Path.cwd())
 
-        with KedroSession.create(project_path=Path.cwd()) as session:
-            assert session.run() is not None
+@pytest.fixture(scope="module")
+def context():
+    bootstrap_project(PROJECT_PATH)
+    with KedroSession.create(project_path=PROJECT_PATH) as session:
+        yield session.load_context()
+
+
+def test_pipelines_register(context):
+    assert "train_model" in pipelines
+    assert all(len(pipeline.nodes) for pipeline in pipelines.values())
+
+
+def test_pipeline_inputs_are_in_catalog(context):
+    catalog = context.catalog
+    # Standalone pipelines may read in-memory outputs of the pipelines they are composed with
+    produced = {output for pipeline in pipelines.values() for output in pipeline.all_outputs()}
+    for name, pipeline in pipelines.items():
+        for dataset in pipeline.inputs():
+            if not dataset.startswith("params:") and dataset != "parameters" and dataset not in produced:
+                assert dataset in catalog, f"{name}: {dataset}"